@@ -11,10 +11,11 @@ from typing import Any, Dict, List, Set
 import boto3
 import pyarrow as pa
 import pyarrow.parquet as pq
-import websockets
 from dateutil import parser as date_parser
 
+from dr_manhattan.base.websocket import WebSocketPool
 from dr_manhattan.exchanges.polymarket import Polymarket
+from dr_manhattan.exchanges.polymarket_ws import PolymarketWebSocket
 
 # ========== LOGGING CONFIG ==========
 
@@ -27,12 +28,11 @@ logger = logging.getLogger(__name__)
 
 # ========== CONFIG ==========
 
-WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
 S3_BUCKET = os.getenv("S3_BUCKET")
 POLL_INTERVAL_SEC = 60 * 3
 WS_PING_INTERVAL_SEC = 20
 WS_RECONNECT_DELAY_SEC = 3
-WS_NO_ASSETS_SLEEP_SEC = 15
+WS_MAX_ASSETS_PER_CONNECTION = 500
 
 
 # ========== EVENT TYPE CONSTANTS ==========
@@ -637,132 +637,61 @@ async def dispatch_raw(raw: str, state: SharedState):
         await dispatch_message(msg, state)
 
 
-# ========== WEBSOCKET WORKER ==========
+# ========== WEBSOCKET SHARDS ==========
 
 
-class WebSocketWorker:
-    def __init__(self, state: SharedState, asset_ids: List[str], generation: int):
-        self.state = state
-        self.asset_ids = asset_ids
-        self.generation = generation
-        self.ws: websockets.WebSocketClientProtocol | None = None
-        self.ready = asyncio.Event()
-        self.running = True
+class CrawlerSocket(PolymarketWebSocket):
+    """Market-channel connection handing every event to the crawler handlers"""
 
-    async def run(self):
-        try:
-            async with websockets.connect(
-                WS_URL,
-                ping_interval=None,
-                ping_timeout=None,
-            ) as ws:
-                self.ws = ws
-                logger.info(
-                    "[ws] connecting gen=%s (%d assets)",
-                    self.generation,
-                    len(self.asset_ids),
-                )
-
-                # (Keep existing field name as requested)
-                sub_msg = {
-                    "type": "MARKET",
-                    "assets_ids": self.asset_ids,
-                }
-                await ws.send(json.dumps(sub_msg))
-                self.ready.set()
-
-                async def ping_loop():
-                    try:
-                        while self.running:
-                            await ws.send("PING")
-                            await asyncio.sleep(WS_PING_INTERVAL_SEC)
-                    except Exception:
-                        logger.warning("[ws] ping_loop gen=%s error", self.generation)
+    def __init__(self, shared: SharedState):
+        super().__init__(
+            {
+                "ping_interval": WS_PING_INTERVAL_SEC,
+                "reconnect_delay": WS_RECONNECT_DELAY_SEC,
+                "max_assets_per_frame": WS_MAX_ASSETS_PER_CONNECTION,
+                "resync_books": False,
+            }
+        )
+        self.shared = shared
 
-                ping_task = asyncio.create_task(ping_loop())
+    async def _process_message_item(self, data: dict):
+        if isinstance(data, dict):
+            await dispatch_message(data, self.shared)
 
-                try:
-                    async for raw in ws:
-                        if not self.running:
-                            break
-                        await dispatch_raw(raw, self.state)
-                finally:
-                    ping_task.cancel()
 
-        except Exception:
-            logger.exception("[ws] worker gen=%s error", self.generation)
-            if not self.ready.is_set():
-                self.ready.set()
-        finally:
-            self.running = False
-
-    async def stop(self):
-        self.running = False
-        if self.ws is not None:
-            try:
-                await self.ws.close()
-            except Exception:
-                pass
+def _ignore_book(asset_id: str, orderbook: dict):
+    """Events are written by dispatch_message; nothing to do per book"""
 
 
 # ========== WS MANAGER ==========
 
 
 async def manage_ws_connections(state: SharedState):
-    worker: WebSocketWorker | None = None
-    worker_task: asyncio.Task | None = None
-    generation = 0
-
-    while True:
-        async with state.lock:
-            asset_ids = list(state.desired_asset_ids)
-            state.subscribed_asset_ids = set(asset_ids)
-            state.need_resubscribe = False
-
-        if not asset_ids:
-            logger.info("[ws] no assets to subscribe, waiting...")
-            await asyncio.sleep(WS_NO_ASSETS_SLEEP_SEC)
-            continue
-
-        generation += 1
-        logger.info("[ws] starting worker gen=%s (%d assets)", generation, len(asset_ids))
-
-        new_worker = WebSocketWorker(state, asset_ids, generation)
-        new_task = asyncio.create_task(new_worker.run())
-
-        await new_worker.ready.wait()
-        if not new_worker.running and new_task.done():
-            logger.warning("[ws] worker gen=%s failed during startup", generation)
-            await asyncio.sleep(WS_RECONNECT_DELAY_SEC)
-            continue
-
-        logger.info("[ws] worker gen=%s READY", generation)
-
-        if worker is not None:
-            logger.info("[ws] stopping old worker gen=%s", worker.generation)
-            await worker.stop()
-            if worker_task is not None:
-                try:
-                    await asyncio.wait_for(worker_task, timeout=5)
-                except asyncio.TimeoutError:
-                    logger.warning("[ws] old worker gen=%s timeout", worker.generation)
-
-        worker = new_worker
-        worker_task = new_task
+    pool = WebSocketPool(
+        lambda: CrawlerSocket(state), max_per_connection=WS_MAX_ASSETS_PER_CONNECTION
+    )
 
+    try:
         while True:
-            await asyncio.sleep(1)
-
-            if not worker.running or worker_task.done():
-                logger.warning("[ws] worker gen=%s stopped; restarting", worker.generation)
-                await asyncio.sleep(WS_RECONNECT_DELAY_SEC)
-                break
-
             async with state.lock:
-                if state.need_resubscribe or state.desired_asset_ids != state.subscribed_asset_ids:
-                    state.need_resubscribe = True
-                    logger.info("[ws] subscription change detected → rolling worker")
-                    break
+                asset_ids = set(state.desired_asset_ids)
+                changed = state.need_resubscribe or asset_ids != state.subscribed_asset_ids
+                state.need_resubscribe = False
+
+            if changed:
+                # Closed markets are dropped and new ones added; untouched shards keep streaming
+                await pool.sync({asset_id: _ignore_book for asset_id in asset_ids})
+                state.subscribed_asset_ids = asset_ids
+                logger.info(
+                    "[ws] %d assets on %d connections %s",
+                    len(pool),
+                    len(pool.shards),
+                    pool.loads,
+                )
+
+            await asyncio.sleep(1)
+    finally:
+        await pool.disconnect()
 
 
 # ========== MAIN ==========
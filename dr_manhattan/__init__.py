@@ -2,8 +2,11 @@
 Dr. Manhattan: CCXT-style unified API for prediction markets
 """
 
+from .base.async_exchange import AsyncExchange
+from .base.catalog import MarketCatalog
 from .base.errors import (
     AuthenticationError,
+    CircuitOpenError,
     DrManhattanError,
     ExchangeError,
     InsufficientFunds,
@@ -38,12 +41,15 @@ __all__ = [
     "create_exchange",
     "list_exchanges",
     "Exchange",
+    "AsyncExchange",
     "ExchangeClient",
+    "MarketCatalog",
     "Strategy",
     "DrManhattanError",
     "ExchangeError",
     "NetworkError",
     "RateLimitError",
+    "CircuitOpenError",
     "AuthenticationError",
     "InsufficientFunds",
     "InvalidOrder",
@@ -1,5 +1,9 @@
+from .async_exchange import AsyncExchange
+from .async_http import AsyncHTTPTransport
+from .catalog import MarketCatalog
 from .errors import (
     AuthenticationError,
+    CircuitOpenError,
     DrManhattanError,
     ExchangeError,
     InsufficientFunds,
@@ -18,13 +22,31 @@ from .exchange_client import (
     format_positions_compact,
 )
 from .exchange_factory import create_exchange, get_exchange_class, list_exchanges
+from .http import HTTPTransport
+from .metrics import MetricsHook, MetricsRecorder
 from .order_tracker import OrderEvent, OrderTracker, create_fill_logger
+from .paginator import Paginator
+from .price_cache import PriceHistoryCache
+from .rate_limiter import RateLimiter
+from .single_flight import SingleFlight
 from .strategy import Strategy
+from .ws_runtime import WebSocketRuntime
 
 __all__ = [
     "Exchange",
+    "AsyncExchange",
+    "AsyncHTTPTransport",
     "ExchangeClient",
+    "HTTPTransport",
+    "MarketCatalog",
+    "MetricsHook",
+    "MetricsRecorder",
+    "Paginator",
+    "PriceHistoryCache",
+    "RateLimiter",
+    "SingleFlight",
     "Strategy",
+    "WebSocketRuntime",
     "StrategyState",
     "DeltaInfo",
     "calculate_delta",
@@ -34,6 +56,7 @@ __all__ = [
     "ExchangeError",
     "NetworkError",
     "RateLimitError",
+    "CircuitOpenError",
     "AuthenticationError",
     "InsufficientFunds",
     "InvalidOrder",
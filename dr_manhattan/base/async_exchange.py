@@ -0,0 +1,320 @@
+"""
+Asyncio API surface for exchanges.
+
+``AsyncExchange`` mirrors the unified ``Exchange`` API with ``async def``
+methods. It wraps a sync exchange instance and shares its configuration,
+caches and credentials. Public REST reads are served natively over a pooled
+aiohttp transport by exchange-specific subclasses; operations that depend on
+blocking signing SDKs (order placement, balances) run in a worker thread.
+"""
+
+import asyncio
+import copy
+import time
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from ..models.market import Market
+from ..models.order import Order, OrderSide
+from ..models.orderbook import Orderbook
+from ..models.position import Position
+from .async_http import DEFAULT_CONNECTION_LIMIT, AsyncHTTPTransport, AsyncResponse
+from .errors import AuthenticationError, ExchangeError, NetworkError, RateLimitError
+from .exchange import Exchange
+from .http import DEFAULT_POOL_MAXSIZE
+from .rate_limiter import parse_retry_after
+from .resilience import endpoint_key
+from .single_flight import AsyncSingleFlight, call_key
+
+T = TypeVar("T")
+
+
+class AsyncExchange:
+    """
+    Async counterpart of an Exchange.
+
+    The default implementation runs every method of the wrapped sync
+    exchange in a worker thread. Subclasses override the read paths with
+    native coroutines built on ``_request_json``.
+
+    Example:
+        >>> async with Polymarket().to_async() as exchange:
+        ...     markets = await exchange.fetch_markets({"limit": 10})
+    """
+
+    def __init__(self, exchange: Exchange):
+        """
+        Initialize async exchange.
+
+        Args:
+            exchange: Sync exchange instance to wrap
+        """
+        self.exchange = exchange
+        config = exchange.config
+        self._http = AsyncHTTPTransport(
+            limit=config.get("async_pool_limit", DEFAULT_CONNECTION_LIMIT),
+            limit_per_host=config.get("pool_maxsize", DEFAULT_POOL_MAXSIZE),
+            timeout=exchange.timeout,
+        )
+
+        # Coalesce identical concurrent reads on the loop (opt-in, see Exchange)
+        self._single_flight = AsyncSingleFlight(copy_result=copy.copy)
+        if exchange.coalesce_requests:
+            for name in exchange.COALESCED_METHODS:
+                method = getattr(self, name, None)
+                if method is not None:
+                    setattr(self, name, self._coalesced(name, method))
+
+    @property
+    def id(self) -> str:
+        return self.exchange.id
+
+    @property
+    def name(self) -> str:
+        return self.exchange.name
+
+    @property
+    def verbose(self) -> bool:
+        return self.exchange.verbose
+
+    @property
+    def http(self) -> AsyncHTTPTransport:
+        """Pooled async HTTP transport used for native REST calls"""
+        return self._http
+
+    async def __aenter__(self) -> "AsyncExchange":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        await self._http.close()
+
+    def _coalesced(
+        self, name: str, method: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        """Wrap a bound coroutine method so identical concurrent calls share one request"""
+
+        @wraps(method)
+        async def wrapper(*args, **kwargs):
+            key = call_key(name, args, kwargs)
+            if key is None:
+                return await method(*args, **kwargs)
+            return await self._single_flight.do(key, method, *args, **kwargs)
+
+        return wrapper
+
+    def coalescing_stats(self) -> Dict[str, Any]:
+        """Get request coalescing statistics for async callers"""
+        return self._single_flight.stats()
+
+    async def _run_sync(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking exchange method in a worker thread."""
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def _with_retry(
+        self,
+        func: Callable[[], Awaitable[T]],
+        endpoint: Optional[str] = None,
+        url: Optional[str] = None,
+    ) -> T:
+        """
+        Async equivalent of Exchange._retry_on_failure.
+
+        Applies the wrapped exchange's rate limit and retries NetworkError /
+        RateLimitError with exponential backoff (or Retry-After), without
+        blocking the loop. ``url`` selects the host limiter for exchanges with
+        RATE_LIMIT_PER_REQUEST_HOST.
+        """
+        exchange = self.exchange
+        metrics = exchange.metrics
+        last_exception: Optional[Exception] = None
+
+        for attempt in range(exchange.max_retries + 1):
+            wait = exchange._reserve_rate_limit(endpoint, url)
+            if wait > 0:
+                if metrics is not None:
+                    metrics.observe_rate_limit_wait(exchange.id, endpoint or "default", wait)
+                await asyncio.sleep(wait)
+            try:
+                return await func()
+            except (NetworkError, RateLimitError) as e:
+                last_exception = e
+                if attempt < exchange.max_retries:
+                    if metrics is not None:
+                        metrics.observe_retry(exchange.id, endpoint or "request", type(e).__name__)
+                    delay = exchange._retry_delay_for(e, attempt, endpoint, url)
+                    if self.verbose:
+                        print(f"Attempt {attempt + 1} failed, retrying in {delay:.2f}s: {e}")
+                    await asyncio.sleep(delay)
+
+        raise last_exception
+
+    def _raise_for_status(self, response: AsyncResponse, endpoint: str) -> None:
+        """Map HTTP error statuses to unified exceptions"""
+        status = response.status_code
+        if status < 400:
+            return
+        if status == 429:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            raise RateLimitError(
+                f"Rate limited. Retry after {retry_after}s", retry_after=retry_after
+            )
+        if status == 404:
+            raise ExchangeError(f"Resource not found: {endpoint}")
+        if status == 401:
+            raise AuthenticationError(f"Authentication failed: {status}")
+        if status == 403:
+            raise AuthenticationError(f"Access forbidden: {status}")
+        raise ExchangeError(f"HTTP error: {status} - {response.text[:200]}")
+
+    async def _request_json(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        endpoint: Optional[str] = None,
+    ) -> Any:
+        """
+        Send a request with rate limiting and retries and decode JSON.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            params: Query parameters
+            json: JSON body
+            headers: Request headers
+            endpoint: Endpoint label used in error messages (defaults to url)
+
+        Returns:
+            Decoded JSON body
+        """
+
+        async def _send() -> Any:
+            response = await self._send_observed(method, url, params, json, headers)
+            self._raise_for_status(response, endpoint or url)
+            try:
+                return response.json()
+            except ValueError as e:
+                raise ExchangeError(f"Invalid JSON response from {endpoint or url}: {e}")
+
+        return await self._with_retry(_send, url=url)
+
+    async def _send_observed(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Any],
+        headers: Optional[Dict[str, str]],
+    ) -> AsyncResponse:
+        """Send one request, reporting it to the exchange's metrics hook if set"""
+        metrics = self.exchange.metrics
+        if metrics is None:
+            return await self._http.request(method, url, params=params, json=json, headers=headers)
+        start = time.perf_counter()
+        try:
+            response = await self._http.request(
+                method, url, params=params, json=json, headers=headers
+            )
+        except Exception as e:
+            metrics.observe_request(
+                self.id,
+                endpoint_key(method, url),
+                time.perf_counter() - start,
+                error=type(e).__name__,
+            )
+            raise
+        metrics.observe_request(
+            self.id,
+            endpoint_key(method, url),
+            time.perf_counter() - start,
+            status=response.status_code,
+            bytes_received=len(response.content),
+        )
+        return response
+
+    # Unified API
+
+    async def fetch_markets(self, params: Optional[Dict[str, Any]] = None) -> List[Market]:
+        """Async version of Exchange.fetch_markets"""
+        return await self._run_sync(self.exchange.fetch_markets, params)
+
+    async def fetch_market(self, market_id: str) -> Market:
+        """Async version of Exchange.fetch_market"""
+        return await self._run_sync(self.exchange.fetch_market, market_id)
+
+    async def get_orderbook(self, token_id: str) -> Dict[str, Any]:
+        """Async version of the exchange's get_orderbook"""
+        return await self._run_sync(self.exchange.get_orderbook, token_id)
+
+    async def get_orderbooks(self, token_ids: List[str]) -> Dict[str, Orderbook]:
+        """
+        Async version of Exchange.get_orderbooks.
+
+        Fans out get_orderbook() coroutines, at most ``orderbook_concurrency``
+        in flight at once. Tokens whose fetch raised are left out.
+        """
+        unique_ids = list(dict.fromkeys(token_ids))
+        semaphore = asyncio.Semaphore(max(1, self.exchange.orderbook_concurrency))
+
+        async def _fetch(token_id: str) -> Optional[Orderbook]:
+            async with semaphore:
+                try:
+                    data = await self.get_orderbook(token_id)
+                except Exception as e:
+                    if self.verbose:
+                        print(f"Failed to fetch orderbook for {token_id}: {e}")
+                    return None
+            return Orderbook.from_rest_response(data or {}, token_id)
+
+        books = await asyncio.gather(*(_fetch(token_id) for token_id in unique_ids))
+        return {token_id: book for token_id, book in zip(unique_ids, books) if book is not None}
+
+    async def create_order(
+        self,
+        market_id: str,
+        outcome: str,
+        side: OrderSide,
+        price: float,
+        size: float,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Order:
+        """Async version of Exchange.create_order"""
+        return await self._run_sync(
+            self.exchange.create_order, market_id, outcome, side, price, size, params
+        )
+
+    async def cancel_order(self, order_id: str, market_id: Optional[str] = None) -> Order:
+        """Async version of Exchange.cancel_order"""
+        return await self._run_sync(self.exchange.cancel_order, order_id, market_id)
+
+    async def fetch_order(self, order_id: str, market_id: Optional[str] = None) -> Order:
+        """Async version of Exchange.fetch_order"""
+        return await self._run_sync(self.exchange.fetch_order, order_id, market_id)
+
+    async def fetch_open_orders(
+        self, market_id: Optional[str] = None, params: Optional[Dict[str, Any]] = None
+    ) -> List[Order]:
+        """Async version of Exchange.fetch_open_orders"""
+        # Some exchanges (e.g. PredictFun) do not accept params
+        if params is None:
+            return await self._run_sync(self.exchange.fetch_open_orders, market_id)
+        return await self._run_sync(self.exchange.fetch_open_orders, market_id, params)
+
+    async def fetch_positions(
+        self, market_id: Optional[str] = None, params: Optional[Dict[str, Any]] = None
+    ) -> List[Position]:
+        """Async version of Exchange.fetch_positions"""
+        if params is None:
+            return await self._run_sync(self.exchange.fetch_positions, market_id)
+        return await self._run_sync(self.exchange.fetch_positions, market_id, params)
+
+    async def fetch_balance(self) -> Dict[str, float]:
+        """Async version of Exchange.fetch_balance"""
+        return await self._run_sync(self.exchange.fetch_balance)
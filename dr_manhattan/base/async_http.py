@@ -0,0 +1,212 @@
+"""
+Pooled asyncio HTTP transport.
+
+Async counterpart of :class:`HTTPTransport`. One ``aiohttp.ClientSession``
+with a bounded keep-alive connector serves every coroutine on the loop, so
+hundreds of requests can be in flight without a thread per request.
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from .errors import NetworkError
+from .http import DEFAULT_POOL_MAXSIZE
+
+# Total open connections across all hosts
+DEFAULT_CONNECTION_LIMIT = 100
+# Seconds an idle keep-alive connection stays in the pool
+DEFAULT_KEEPALIVE_TIMEOUT = 30.0
+
+
+@dataclass
+class AsyncResponse:
+    """Fully read HTTP response returned by AsyncHTTPTransport."""
+
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes = field(repr=False)
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class AsyncHTTPTransport:
+    """
+    Keep-alive aiohttp transport with connection reuse instrumentation.
+
+    The underlying session is created lazily on first use so the transport
+    binds to whichever event loop actually runs the requests.
+    """
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_CONNECTION_LIMIT,
+        limit_per_host: int = DEFAULT_POOL_MAXSIZE,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        timeout: float = 30.0,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize transport.
+
+        Args:
+            limit: Maximum simultaneous connections across all hosts
+            limit_per_host: Maximum simultaneous connections per host
+            keepalive_timeout: Idle time before a pooled connection is closed
+            timeout: Default total request timeout in seconds
+            headers: Extra default headers for every request
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.headers = {"Accept-Encoding": "gzip, deflate", **(headers or {})}
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._requests = 0
+        self._new_connections = 0
+        self._reused_connections = 0
+        self._errors = 0
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        async def on_create(session, ctx, params):
+            self._new_connections += 1
+
+        async def on_reuse(session, ctx, params):
+            self._reused_connections += 1
+
+        trace.on_connection_create_end.append(on_create)
+        trace.on_connection_reuseconn.append(on_reuse)
+        return trace
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                trace_configs=[self._trace_config()],
+            )
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncResponse:
+        """
+        Send a request and read the full body.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            params: Query parameters (None values are dropped)
+            json: JSON body
+            headers: Per-request headers
+            timeout: Total timeout override in seconds
+
+        Returns:
+            AsyncResponse
+
+        Raises:
+            NetworkError: On timeout or connection failure
+        """
+        session = self._get_session()
+        self._requests += 1
+        query = _clean_params(params)
+        # Only pass a timeout to override the session default; timeout=None
+        # would disable it entirely
+        overrides: Dict[str, Any] = {}
+        if timeout:
+            overrides["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+        try:
+            async with session.request(
+                method,
+                url,
+                params=query,
+                json=json,
+                headers=headers,
+                **overrides,
+            ) as response:
+                content = await response.read()
+                return AsyncResponse(
+                    status_code=response.status,
+                    headers=dict(response.headers),
+                    content=content,
+                )
+        except asyncio.TimeoutError as e:
+            self._errors += 1
+            raise NetworkError(f"Request timeout: {e}")
+        except aiohttp.ClientError as e:
+            self._errors += 1
+            raise NetworkError(f"Connection error: {e}")
+
+    async def get(self, url: str, **kwargs: Any) -> AsyncResponse:
+        """Send a GET request."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> AsyncResponse:
+        """Send a POST request."""
+        return await self.request("POST", url, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get connection reuse statistics.
+
+        Returns:
+            Dict with request count, new/reused connections and reuse ratio
+        """
+        total = self._requests
+        return {
+            "requests": total,
+            "new_connections": self._new_connections,
+            "reused_connections": self._reused_connections,
+            "reuse_ratio": self._reused_connections / total if total else 0.0,
+            "errors": self._errors,
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+        }
+
+    async def close(self) -> None:
+        """Close the session and all pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+def _clean_params(params: Optional[Dict[str, Any]]) -> Optional[List[Tuple[str, str]]]:
+    """Encode query params the way requests does (drop None, repeat list values)."""
+    if not params:
+        return None
+    encoded: List[Tuple[str, str]] = []
+    for key, value in params.items():
+        if value is None:
+            continue
+        values = value if isinstance(value, (list, tuple)) else [value]
+        encoded.extend((key, str(v)) for v in values)
+    return encoded
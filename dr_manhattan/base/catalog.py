@@ -0,0 +1,381 @@
+"""
+Local market catalog with incremental sync.
+
+``MarketCatalog`` stores normalized ``Market`` rows per exchange in SQLite,
+so scanners can start from the local copy instead of re-downloading every
+listing. ``sync()`` asks the exchange only for markets updated since the
+last sync when the exchange can order its listing by update time (see
+``Exchange.MARKET_UPDATED_AT_KEY``); other exchanges are re-listed in full
+and upserted. Queries run against indexed columns (close time, liquidity,
+volume, binary-ness, tags).
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence
+
+from ..models.market import Market
+
+if TYPE_CHECKING:
+    from .exchange import Exchange
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS markets (
+    exchange TEXT NOT NULL,
+    id TEXT NOT NULL,
+    question TEXT NOT NULL,
+    description TEXT NOT NULL,
+    outcomes TEXT NOT NULL,
+    prices TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    close_time TEXT,
+    close_ts REAL,
+    volume REAL NOT NULL,
+    liquidity REAL NOT NULL,
+    tick_size REAL NOT NULL,
+    is_binary INTEGER NOT NULL,
+    updated_at TEXT,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (exchange, id)
+);
+CREATE INDEX IF NOT EXISTS markets_close_ts ON markets (exchange, close_ts);
+CREATE INDEX IF NOT EXISTS markets_liquidity ON markets (exchange, liquidity);
+CREATE INDEX IF NOT EXISTS markets_volume ON markets (exchange, volume);
+CREATE INDEX IF NOT EXISTS markets_binary ON markets (exchange, is_binary);
+CREATE TABLE IF NOT EXISTS market_tags (
+    exchange TEXT NOT NULL,
+    id TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (exchange, id, tag)
+);
+CREATE INDEX IF NOT EXISTS market_tags_tag ON market_tags (exchange, tag);
+CREATE TABLE IF NOT EXISTS sync_state (
+    exchange TEXT PRIMARY KEY,
+    cursor TEXT,
+    synced_at REAL NOT NULL
+);
+"""
+
+# Metadata keys whose values are treated as tags/categories
+TAG_KEYS = ("tags", "category", "categories", "topics")
+
+# Sortable columns accepted by MarketCatalog.markets()
+ORDER_COLUMNS = ("volume", "liquidity", "close_ts", "updated_at", "synced_at")
+
+
+def market_tags(market: Market) -> List[str]:
+    """
+    Lower-cased tags/categories from market metadata.
+
+    Tag entries may be strings or dicts (Gamma ``tags`` carry ``label`` and
+    ``slug``); both forms are indexed.
+    """
+    tags: List[str] = []
+    for key in TAG_KEYS:
+        value = market.metadata.get(key)
+        if value is None:
+            continue
+        items = value if isinstance(value, (list, tuple)) else [value]
+        for item in items:
+            if isinstance(item, dict):
+                tags.extend(
+                    str(item[field]).lower() for field in ("label", "slug") if item.get(field)
+                )
+            elif item is not None and str(item):
+                tags.append(str(item).lower())
+    return list(dict.fromkeys(tags))
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class MarketCatalog:
+    """
+    SQLite-backed store of normalized markets, keyed by (exchange id, market id).
+
+    Example:
+        >>> catalog = MarketCatalog("~/.cache/dr_manhattan/markets.db")
+        >>> catalog.sync(Polymarket())  # full the first time, incremental after
+        >>> catalog.markets("polymarket", binary=True, min_liquidity=10_000, limit=50)
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Initialize catalog.
+
+        Args:
+            path: SQLite database file (":memory:" for a process-local catalog)
+        """
+        self.path = path if path == ":memory:" else os.path.expanduser(path)
+        if self.path != ":memory:":
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "MarketCatalog":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # Sync
+
+    def sync(self, exchange: "Exchange", full: bool = False) -> int:
+        """
+        Bring an exchange's markets up to date.
+
+        Args:
+            exchange: Exchange to list markets from
+            full: Ignore the saved cursor and re-list everything
+
+        Returns:
+            Number of markets written
+        """
+        exchange_id = exchange.id
+        cursor = None if full else self.cursor(exchange_id)
+        key = exchange.MARKET_UPDATED_AT_KEY
+
+        written = 0
+        latest = cursor
+        batch: List[Market] = []
+        for market in exchange.iter_updated_markets(cursor):
+            batch.append(market)
+            if key:
+                updated_at = market.metadata.get(key)
+                if updated_at is not None and (latest is None or str(updated_at) > latest):
+                    latest = str(updated_at)
+            if len(batch) >= 500:
+                written += self.upsert(exchange_id, batch, updated_at_key=key)
+                batch = []
+        if batch:
+            written += self.upsert(exchange_id, batch, updated_at_key=key)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO sync_state (exchange, cursor, synced_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(exchange) DO UPDATE SET cursor = excluded.cursor, "
+                "synced_at = excluded.synced_at",
+                (exchange_id, latest if key else None, time.time()),
+            )
+        return written
+
+    def upsert(
+        self,
+        exchange_id: str,
+        markets: Iterable[Market],
+        updated_at_key: Optional[str] = None,
+    ) -> int:
+        """
+        Insert or replace markets.
+
+        Args:
+            exchange_id: Exchange the markets belong to
+            markets: Markets to store
+            updated_at_key: Metadata key holding the market's update time
+
+        Returns:
+            Number of markets written
+        """
+        now = time.time()
+        rows = []
+        tags = []
+        ids = []
+        for market in markets:
+            updated_at = market.metadata.get(updated_at_key) if updated_at_key else None
+            rows.append(
+                (
+                    exchange_id,
+                    str(market.id),
+                    market.question or "",
+                    market.description or "",
+                    json.dumps(list(market.outcomes)),
+                    json.dumps(market.prices),
+                    json.dumps(market.metadata, default=str),
+                    market.close_time.isoformat() if market.close_time else None,
+                    _timestamp(market.close_time),
+                    float(market.volume or 0),
+                    float(market.liquidity or 0),
+                    float(market.tick_size or 0),
+                    int(market.is_binary),
+                    str(updated_at) if updated_at is not None else None,
+                    now,
+                )
+            )
+            ids.append((exchange_id, str(market.id)))
+            tags.extend((exchange_id, str(market.id), tag) for tag in market_tags(market))
+
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO markets VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.executemany("DELETE FROM market_tags WHERE exchange = ? AND id = ?", ids)
+            self._conn.executemany("INSERT OR IGNORE INTO market_tags VALUES (?, ?, ?)", tags)
+        return len(rows)
+
+    def cursor(self, exchange_id: str) -> Optional[str]:
+        """Update-time cursor saved by the last sync, if any."""
+        row = self._fetchone("SELECT cursor FROM sync_state WHERE exchange = ?", (exchange_id,))
+        return row["cursor"] if row else None
+
+    def last_synced(self, exchange_id: str) -> Optional[float]:
+        """Unix time of the last sync, or None if never synced."""
+        row = self._fetchone("SELECT synced_at FROM sync_state WHERE exchange = ?", (exchange_id,))
+        return row["synced_at"] if row else None
+
+    # Queries
+
+    def get(self, exchange_id: str, market_id: str) -> Optional[Market]:
+        """Stored market, or None."""
+        row = self._fetchone(
+            "SELECT * FROM markets WHERE exchange = ? AND id = ?", (exchange_id, str(market_id))
+        )
+        return self._to_market(row) if row else None
+
+    def count(self, exchange_id: Optional[str] = None) -> int:
+        """Number of stored markets (for one exchange, or all)."""
+        if exchange_id is None:
+            row = self._fetchone("SELECT COUNT(*) AS n FROM markets", ())
+        else:
+            row = self._fetchone(
+                "SELECT COUNT(*) AS n FROM markets WHERE exchange = ?", (exchange_id,)
+            )
+        return row["n"]
+
+    def markets(
+        self,
+        exchange_id: Optional[str] = None,
+        *,
+        query: Optional[str] = None,
+        binary: Optional[bool] = None,
+        min_liquidity: Optional[float] = None,
+        min_volume: Optional[float] = None,
+        tags: Optional[Sequence[str]] = None,
+        closes_after: Optional[datetime] = None,
+        closes_before: Optional[datetime] = None,
+        order_by: str = "volume",
+        descending: bool = True,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Market]:
+        """
+        Query stored markets.
+
+        Args:
+            exchange_id: Restrict to one exchange (None for all)
+            query: Case-insensitive substring of the question or description
+            binary: If set, only binary (True) or non-binary (False) markets
+            min_liquidity: Minimum liquidity
+            min_volume: Minimum volume
+            tags: Match markets carrying any of these tags/categories
+            closes_after: Only markets closing after this time
+            closes_before: Only markets closing before this time
+            order_by: One of ORDER_COLUMNS
+            descending: Sort direction
+            limit: Maximum markets to return
+            offset: Rows to skip
+
+        Returns:
+            List of Market objects
+        """
+        if order_by not in ORDER_COLUMNS:
+            raise ValueError(f"order_by must be one of {ORDER_COLUMNS}, got {order_by!r}")
+
+        clauses: List[str] = []
+        args: List[Any] = []
+        if exchange_id is not None:
+            clauses.append("exchange = ?")
+            args.append(exchange_id)
+        if query:
+            clauses.append("(question LIKE ? OR description LIKE ?)")
+            pattern = f"%{query}%"
+            args.extend([pattern, pattern])
+        if binary is not None:
+            clauses.append("is_binary = ?")
+            args.append(int(binary))
+        if min_liquidity is not None:
+            clauses.append("liquidity >= ?")
+            args.append(min_liquidity)
+        if min_volume is not None:
+            clauses.append("volume >= ?")
+            args.append(min_volume)
+        if closes_after is not None:
+            clauses.append("close_ts > ?")
+            args.append(_timestamp(closes_after))
+        if closes_before is not None:
+            clauses.append("close_ts < ?")
+            args.append(_timestamp(closes_before))
+        if tags:
+            lowered = [tag.lower() for tag in tags]
+            placeholders = ", ".join("?" * len(lowered))
+            clauses.append(
+                "EXISTS (SELECT 1 FROM market_tags t WHERE t.exchange = markets.exchange "
+                f"AND t.id = markets.id AND t.tag IN ({placeholders}))"
+            )
+            args.extend(lowered)
+
+        sql = "SELECT * FROM markets"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {order_by} {'DESC' if descending else 'ASC'}, exchange, id"
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            args.extend([-1 if limit is None else int(limit), int(offset)])
+
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        return [self._to_market(row) for row in rows]
+
+    def _fetchone(self, sql: str, args: Sequence[Any]) -> Optional[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, args).fetchone()
+
+    @staticmethod
+    def _to_market(row: sqlite3.Row) -> Market:
+        close_time = datetime.fromisoformat(row["close_time"]) if row["close_time"] else None
+        return Market(
+            id=row["id"],
+            question=row["question"],
+            outcomes=json.loads(row["outcomes"]),
+            close_time=close_time,
+            volume=row["volume"],
+            liquidity=row["liquidity"],
+            prices=json.loads(row["prices"]),
+            metadata=json.loads(row["metadata"]),
+            tick_size=row["tick_size"],
+            description=row["description"],
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-exchange market counts and last sync times."""
+        with self._lock:
+            counts = self._conn.execute(
+                "SELECT exchange, COUNT(*) AS n FROM markets GROUP BY exchange"
+            ).fetchall()
+            synced = self._conn.execute("SELECT exchange, synced_at FROM sync_state").fetchall()
+        last = {row["exchange"]: row["synced_at"] for row in synced}
+        return {
+            row["exchange"]: {"markets": row["n"], "synced_at": last.get(row["exchange"])}
+            for row in counts
+        }
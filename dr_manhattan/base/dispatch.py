@@ -0,0 +1,258 @@
+"""
+Bounded callback dispatch for WebSocket streams.
+
+With a ``Dispatcher`` the receive loop of a WebSocket only parses messages
+and enqueues them; callbacks run on a dedicated worker thread, so a slow
+(or blocking) strategy callback no longer delays reads and ping replies.
+Every subscriber has its own bounded queue whose ``OverflowPolicy``
+decides what happens when its callback falls behind.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+from .metrics import MetricsHook
+
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(str, Enum):
+    """What a full subscriber queue does with a new update"""
+
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest queued update
+    CONFLATE = "conflate"  # Keep only the newest queued update per token
+    BLOCK = "block"  # Stop reading from the socket until the callback catches up
+
+
+@dataclass
+class SubscriberQueue:
+    """Pending updates of one subscriber"""
+
+    name: str
+    callback: Callable
+    maxsize: int
+    policy: OverflowPolicy
+    items: Deque[Tuple[Any, ...]] = field(default_factory=deque)
+    latest: "OrderedDict[Hashable, Tuple[Any, ...]]" = field(default_factory=OrderedDict)
+    dropped: int = 0
+    delivered: int = 0
+    scheduled: bool = False  # In the dispatcher's ready list
+
+    def __len__(self) -> int:
+        return len(self.latest) if self.policy == OverflowPolicy.CONFLATE else len(self.items)
+
+    def offer(self, key: Hashable, args: Tuple[Any, ...]) -> bool:
+        """Enqueue an update; False if the queue is full and the policy is BLOCK"""
+        if self.policy == OverflowPolicy.CONFLATE:
+            if key in self.latest:
+                # Replace in place so a busy token keeps its turn
+                self.latest[key] = args
+                self.dropped += 1
+                return True
+            if len(self.latest) >= self.maxsize:
+                self.latest.popitem(last=False)
+                self.dropped += 1
+            self.latest[key] = args
+            return True
+        if len(self.items) >= self.maxsize:
+            if self.policy == OverflowPolicy.BLOCK:
+                return False
+            self.items.popleft()
+            self.dropped += 1
+        self.items.append(args)
+        return True
+
+    def pop(self) -> Tuple[Any, ...]:
+        if self.policy == OverflowPolicy.CONFLATE:
+            return self.latest.popitem(last=False)[1]
+        return self.items.popleft()
+
+
+def _subscriber_name(subscriber: Hashable) -> str:
+    if isinstance(subscriber, str):
+        return subscriber
+    return getattr(subscriber, "__qualname__", None) or repr(subscriber)
+
+
+class Dispatcher:
+    """
+    Per-subscriber bounded queues drained by one worker thread.
+
+    Subscribers are served round-robin, one update at a time, so a slow
+    callback delays its own queue more than the others'. Coroutine
+    callbacks are run on the event loop that enqueued them.
+
+    Example:
+        >>> ws = PolymarketWebSocket({"dispatch_policy": "conflate"})
+        >>> ws.set_overflow_policy(token_id, "block", maxsize=100)
+        >>> ws.dispatcher.stats()[token_id]
+        {'depth': 0, 'dropped': 0, 'delivered': 12, 'policy': 'block'}
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        policy: OverflowPolicy | str = OverflowPolicy.DROP_OLDEST,
+        metrics: Optional[MetricsHook] = None,
+        stream: str = "websocket",
+    ):
+        """
+        Initialize dispatcher.
+
+        Args:
+            maxsize: Default queue bound per subscriber
+            policy: Default overflow policy
+            metrics: Hook receiving queue depth and drops per enqueue
+            stream: Stream name reported with metrics
+        """
+        self.maxsize = max(1, maxsize)
+        self.policy = OverflowPolicy(policy)
+        self.metrics = metrics
+        self.stream = stream
+        self._queues: Dict[Hashable, SubscriberQueue] = {}
+        self._overrides: Dict[Hashable, Tuple[OverflowPolicy, int]] = {}
+        self._ready: Deque[SubscriberQueue] = deque()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def configure(
+        self,
+        subscriber: Hashable,
+        policy: OverflowPolicy | str | None = None,
+        maxsize: Optional[int] = None,
+    ) -> None:
+        """
+        Set the overflow policy and bound of one subscriber.
+
+        Args:
+            subscriber: Subscription key or callback
+            policy: Overflow policy (default: the dispatcher's)
+            maxsize: Queue bound (default: the dispatcher's)
+        """
+        settings = (OverflowPolicy(policy or self.policy), max(1, maxsize or self.maxsize))
+        with self._cond:
+            self._overrides[subscriber] = settings
+            queue = self._queues.get(subscriber)
+            if queue is not None and not len(queue):
+                queue.policy, queue.maxsize = settings
+
+    def _queue(self, subscriber: Hashable, callback: Callable) -> SubscriberQueue:
+        queue = self._queues.get(subscriber)
+        if queue is None:
+            policy, maxsize = self._overrides.get(subscriber, (self.policy, self.maxsize))
+            queue = SubscriberQueue(_subscriber_name(subscriber), callback, maxsize, policy)
+            self._queues[subscriber] = queue
+        queue.callback = callback
+        return queue
+
+    def _offer(self, subscriber: Hashable, key: Hashable, callback: Callable, args) -> bool:
+        with self._cond:
+            queue = self._queue(subscriber, callback)
+            dropped = queue.dropped
+            if not queue.offer(key, args):
+                return False
+            if not queue.scheduled:
+                queue.scheduled = True
+                self._ready.append(queue)
+                self._cond.notify_all()
+            depth, dropped = len(queue), queue.dropped - dropped
+        if self.metrics is not None:
+            self.metrics.observe_dispatch(self.stream, queue.name, depth, dropped)
+        return True
+
+    def _wait_for_space(self, subscriber: Hashable, timeout: float) -> None:
+        with self._cond:
+            queue = self._queues.get(subscriber)
+            if queue is not None:
+                self._cond.wait_for(lambda: len(queue) < queue.maxsize or self._closed, timeout)
+
+    async def put(self, subscriber: Hashable, key: Hashable, callback: Callable, *args) -> None:
+        """
+        Enqueue ``callback(*args)`` for a subscriber.
+
+        Under the BLOCK policy this waits (without blocking the event loop)
+        until the subscriber's queue has room, which stops the caller from
+        reading further messages.
+
+        Args:
+            subscriber: Subscription key or callback owning the queue
+            key: Token the update is about (conflation key)
+            callback: Function or coroutine function to call
+            *args: Callback arguments
+        """
+        self._loop = asyncio.get_running_loop()
+        self._ensure_worker()
+        while not self._offer(subscriber, key, callback, args):
+            await self._loop.run_in_executor(None, self._wait_for_space, subscriber, 1.0)
+            if self._closed:
+                return
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name=f"{self.stream}-dispatch", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._ready or self._closed)
+                if self._closed:
+                    return
+                queue = self._ready.popleft()
+                args = queue.pop()
+                if len(queue):
+                    self._ready.append(queue)
+                else:
+                    queue.scheduled = False
+                callback = queue.callback
+                self._cond.notify_all()  # Room for BLOCK waiters
+            try:
+                if asyncio.iscoroutinefunction(callback):
+                    asyncio.run_coroutine_threadsafe(callback(*args), self._loop).result()
+                else:
+                    callback(*args)
+            except Exception as e:
+                logger.error(f"Callback error for {queue.name}: {e}")
+            queue.delivered += 1
+
+    def remove(self, subscriber: Hashable) -> None:
+        """Drop a subscriber's queue and pending updates."""
+        with self._cond:
+            queue = self._queues.pop(subscriber, None)
+            self._overrides.pop(subscriber, None)
+            if queue is not None and queue.scheduled:
+                self._ready.remove(queue)
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Depth, drop and delivery counts per subscriber."""
+        with self._cond:
+            return {
+                queue.name: {
+                    "depth": len(queue),
+                    "dropped": queue.dropped,
+                    "delivered": queue.delivered,
+                    "policy": queue.policy.value,
+                }
+                for queue in self._queues.values()
+            }
+
+    def close(self, timeout: float = 1.0) -> None:
+        """Stop the worker thread; pending updates are discarded."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
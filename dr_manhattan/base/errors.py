@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class DrManhattanError(Exception):
     """Base exception for all dr-manhattan errors"""
 
@@ -19,7 +22,19 @@ class NetworkError(DrManhattanError):
 class RateLimitError(DrManhattanError):
     """Rate limit exceeded"""
 
-    pass
+    def __init__(self, message: str = "", retry_after: Optional[float] = None):
+        super().__init__(message)
+        # Seconds the server asked us to wait (Retry-After), if known
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(DrManhattanError):
+    """Endpoint circuit breaker is open; the call was rejected without a request"""
+
+    def __init__(self, message: str = "", retry_after: Optional[float] = None):
+        super().__init__(message)
+        # Seconds until the breaker lets a trial request through
+        self.retry_after = retry_after
 
 
 class AuthenticationError(DrManhattanError):
@@ -1,16 +1,32 @@
+import copy
 import random
 import re
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import wraps
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
 
 from ..base.errors import NetworkError, RateLimitError
+from ..base.http import DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, HTTPTransport
+from ..base.metrics import MetricsHook, method_name
+from ..base.paginator import DEFAULT_PAGINATION_WINDOW, Paginator
+from ..base.price_cache import PriceHistoryCache
+from ..base.rate_limiter import EndpointLimit, RateLimiter, get_shared_rate_limiter
+from ..base.resilience import HedgePolicy
+from ..base.single_flight import SingleFlight, call_key
 from ..models.crypto_hourly import CryptoHourlyMarket
 from ..models.market import Market
 from ..models.order import Order, OrderSide
+from ..models.orderbook import Orderbook
 from ..models.position import Position
+from ..utils.search import MarketSearchIndex, default_categories, default_search_text
+
+if TYPE_CHECKING:
+    from .async_exchange import AsyncExchange
 
 
 class Exchange(ABC):
@@ -19,6 +35,26 @@ class Exchange(ABC):
     Follows CCXT-style unified API pattern.
     """
 
+    # Per-endpoint rate budgets: name -> requests/sec or (requests/sec, burst).
+    # Endpoints without an entry share the default ``rate_limit`` bucket.
+    RATE_LIMITS: Dict[str, EndpointLimit] = {}
+
+    # Exchanges whose REST calls span several API hosts (and all go through
+    # ``self._http``) set this so each request inside _retry_on_failure draws
+    # from the limiter of the host it is sent to.
+    RATE_LIMIT_PER_REQUEST_HOST: bool = False
+
+    # Read methods whose concurrent identical calls share one request
+    # when ``coalesce_requests`` is enabled. Each follower gets a shallow copy
+    # of the leader's result; nested containers (orderbook level lists,
+    # Market.metadata) are still shared and should be treated as read-only.
+    COALESCED_METHODS: tuple = ("fetch_market", "get_orderbook", "fetch_balance")
+
+    # Market.metadata key holding the market's last-update time. Exchanges
+    # that set it list markets newest-update-first in iter_updated_markets,
+    # which lets MarketCatalog sync incrementally.
+    MARKET_UPDATED_AT_KEY: Optional[str] = None
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize exchange with optional configuration.
@@ -32,10 +68,14 @@ class Exchange(ABC):
         self.timeout = self.config.get("timeout", 30)
         self.verbose = self.config.get("verbose", False)
 
-        # Rate limiting
+        # Rate limiting (token bucket, shared per API host unless disabled)
         self.rate_limit = self.config.get("rate_limit", 10)  # requests per second
-        self.last_request_time = 0
-        self.request_times = []  # For sliding window rate limiting
+        self.rate_limit_burst = self.config.get("rate_limit_burst", self.rate_limit)
+        self.share_rate_limit = self.config.get("share_rate_limit", True)
+        self._rate_limiters: Dict[str, RateLimiter] = {}
+        self._rate_limiter_lock = threading.Lock()
+        # Per-thread stack of endpoint buckets for in-flight _retry_on_failure calls
+        self._rate_limit_scope = threading.local()
 
         # Retry configuration
         self.max_retries = self.config.get("max_retries", 3)
@@ -44,6 +84,116 @@ class Exchange(ABC):
             "retry_backoff", 2.0
         )  # Multiplier for exponential backoff
 
+        # Max parallel requests when fanning out per-token orderbook fetches
+        self.orderbook_concurrency = self.config.get("orderbook_concurrency", 8)
+
+        # Page requests kept in flight by paginated listings
+        self.pagination_window = self.config.get("pagination_window", DEFAULT_PAGINATION_WINDOW)
+
+        # Pooled keep-alive HTTP transport shared by all REST calls
+        self._http = HTTPTransport(
+            pool_connections=self.config.get("pool_connections", DEFAULT_POOL_CONNECTIONS),
+            pool_maxsize=self.config.get("pool_maxsize", DEFAULT_POOL_MAXSIZE),
+            pool_block=self.config.get("pool_block", False),
+            keep_alive=self.config.get("keep_alive", True),
+            gzip=self.config.get("gzip", True),
+            # Hedged GETs and circuit breakers are both opt-in; an open circuit
+            # raises CircuitOpenError, which _retry_on_failure does not retry
+            hedge=HedgePolicy(
+                enabled=self.config.get("hedge_requests", False),
+                delay=self.config.get("hedge_delay"),
+                percentile=self.config.get("hedge_percentile", 0.95),
+            ),
+            breaker_threshold=self.config.get("circuit_breaker_threshold", 0),
+            breaker_reset_timeout=self.config.get("circuit_breaker_reset", 30.0),
+        )
+        if self.RATE_LIMIT_PER_REQUEST_HOST:
+            self._http.before_request = self._rate_limit_request
+
+        # Optional metrics hook (see base.metrics); None disables instrumentation
+        self.metrics: Optional[MetricsHook] = self.config.get("metrics")
+        if self.metrics is not None:
+            self._http.after_request = self._record_http_request
+
+        # Optional on-disk price history cache (a directory path or a shared PriceHistoryCache)
+        price_cache = self.config.get("price_history_cache")
+        if isinstance(price_cache, str):
+            price_cache = PriceHistoryCache(price_cache, metrics=self.metrics)
+        elif price_cache is not None and price_cache.metrics is None:
+            price_cache.metrics = self.metrics
+        self.price_history_cache: Optional[PriceHistoryCache] = price_cache
+
+        # Keep only COMPACT_METADATA_KEYS of each parsed market's raw payload
+        self.compact_markets = self.config.get("compact_markets", False)
+        parse_market = getattr(self, "_parse_market", None)
+        if self.compact_markets and parse_market is not None:
+            self._parse_market = lambda *args, **kwargs: parse_market(*args, **kwargs).compact()
+
+        # Inverted index over markets seen by client-side search (see utils.search)
+        self.search_index = MarketSearchIndex(
+            text=self._build_search_text, categories=self._extract_categories
+        )
+
+        # Opt-in single-flight for identical concurrent reads
+        self.coalesce_requests = self.config.get("coalesce_requests", False)
+        self._single_flight = SingleFlight(copy_result=copy.copy)
+        if self.coalesce_requests:
+            for name in self.COALESCED_METHODS:
+                method = getattr(self, name, None)
+                if method is not None:
+                    setattr(self, name, self._coalesced(name, method))
+
+    def _coalesced(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a bound read method so identical concurrent calls share one request"""
+
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            key = call_key(name, args, kwargs)
+            if key is None:
+                return method(*args, **kwargs)
+            return self._single_flight.do(key, method, *args, **kwargs)
+
+        return wrapper
+
+    def resilience_stats(self) -> Dict[str, Any]:
+        """
+        Get hedged-request and circuit breaker statistics.
+
+        Returns:
+            Dict with hedge counts/win rate and per-endpoint breaker status
+        """
+        return self._http.resilience_stats()
+
+    def coalescing_stats(self) -> Dict[str, Any]:
+        """
+        Get request coalescing statistics.
+
+        Returns:
+            Dict with calls, executed and coalesced counts (overall and
+            per method). Async callers are counted by
+            AsyncExchange.coalescing_stats().
+        """
+        return self._single_flight.stats()
+
+    @property
+    def http(self) -> HTTPTransport:
+        """Pooled HTTP transport used for REST calls"""
+        return self._http
+
+    def to_async(self) -> "AsyncExchange":
+        """
+        Get an asyncio counterpart of this exchange.
+
+        The async exchange shares this instance's config, credentials and
+        caches. Exchanges override this to return a native implementation.
+
+        Returns:
+            AsyncExchange wrapping this exchange
+        """
+        from .async_exchange import AsyncExchange
+
+        return AsyncExchange(self)
+
     @property
     @abstractmethod
     def id(self) -> str:
@@ -85,6 +235,33 @@ class Exchange(ABC):
         """
         pass
 
+    def iter_updated_markets(self, since: Optional[str] = None) -> Iterable[Market]:
+        """
+        Markets for a MarketCatalog sync.
+
+        The default lists every market via ``fetch_markets({"all": True})``
+        and ignores ``since``. Exchanges that set MARKET_UPDATED_AT_KEY
+        override this to stop once markets updated at or before ``since``
+        are reached.
+
+        Args:
+            since: Update-time cursor saved by the previous sync
+
+        Returns:
+            Iterable of Market objects
+        """
+        return self.fetch_markets({"all": True})
+
+    @staticmethod
+    def _build_search_text(market: Market) -> str:
+        """Searchable text of a market (question, description, slug)"""
+        return default_search_text(market)
+
+    @staticmethod
+    def _extract_categories(market: Market) -> List[str]:
+        """Lower-cased categories of a market"""
+        return default_categories(market)
+
     def fetch_markets_by_slug(self, slug_or_url: str) -> list[Market]:
         """
         Fetch all markets from an event by slug or URL.
@@ -196,6 +373,119 @@ class Exchange(ABC):
         """
         pass
 
+    def get_orderbooks(self, token_ids: List[str]) -> Dict[str, Orderbook]:
+        """
+        Fetch orderbooks for many tokens at once.
+
+        The default implementation fans out get_orderbook() calls over a
+        bounded thread pool (``orderbook_concurrency``). Exchanges with a
+        multi-book endpoint override this with a batched request.
+
+        Args:
+            token_ids: Token IDs to fetch (duplicates are fetched once)
+
+        Returns:
+            Dict mapping token_id to normalized Orderbook. Tokens whose fetch
+            raised are left out, so callers keep their last good book.
+        """
+        if not hasattr(self, "get_orderbook"):
+            raise NotImplementedError(f"{self.name} does not support get_orderbook")
+
+        unique_ids = list(dict.fromkeys(token_ids))
+        if not unique_ids:
+            return {}
+
+        def _fetch(token_id: str) -> Optional[Orderbook]:
+            try:
+                data = self.get_orderbook(token_id)
+            except Exception as e:
+                if self.verbose:
+                    print(f"Failed to fetch orderbook for {token_id}: {e}")
+                return None
+            return Orderbook.from_rest_response(data or {}, token_id)
+
+        workers = max(1, min(len(unique_ids), self.orderbook_concurrency))
+        if workers == 1:
+            books = [_fetch(token_id) for token_id in unique_ids]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                books = list(executor.map(_fetch, unique_ids))
+
+        return {token_id: book for token_id, book in zip(unique_ids, books) if book is not None}
+
+    def _cached_price_history(
+        self,
+        market: Market,
+        token_id: str,
+        start: int,
+        end: int,
+        fetch: Callable[[int, int], Iterable[Any]],
+        *,
+        interval: Optional[str] = None,
+        fidelity: Optional[int] = None,
+        min_gap: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Serve a price history window through ``self.price_history_cache``.
+
+        Rows returned by ``fetch`` are normalized with the exchange's
+        ``_parse_history``. History of a closed market is cached as
+        immutable up to its close time (or now, if the close time is unknown).
+
+        Args:
+            market: Market the series belongs to
+            token_id: Series identifier (token or market ID)
+            start: Window start (epoch seconds)
+            end: Window end (epoch seconds)
+            fetch: Function(start, end) returning raw history rows
+            interval: Sampling interval of the series
+            fidelity: Resolution parameter of the series
+            min_gap: Uncached gaps shorter than this many seconds are not fetched
+
+        Returns:
+            Rows as {"t": epoch seconds, "p": price} dicts sorted by time
+        """
+        close_time = market.close_time
+        closed = market.metadata.get("closed")
+        if closed is None:
+            closed = close_time is not None and close_time.timestamp() <= time.time()
+        closed_at = None
+        if closed:
+            closed_at = int(close_time.timestamp()) if close_time else int(time.time())
+
+        def fetch_rows(lo: int, hi: int) -> List[Any]:
+            return [
+                (int(point.timestamp.timestamp()), point.price)
+                for point in self._parse_history(fetch(lo, hi))
+            ]
+
+        rows = self.price_history_cache.get(
+            self.id,
+            token_id,
+            start,
+            end,
+            fetch_rows,
+            interval=interval,
+            fidelity=fidelity,
+            closed_at=closed_at,
+            min_gap=min_gap,
+        )
+        return [{"t": t, "p": p} for t, p in rows]
+
+    def _paginate(self, fetch_page: Callable[[int, int], List[Any]], **kwargs: Any) -> Paginator:
+        """
+        Build a prefetching Paginator using this exchange's ``pagination_window``.
+
+        Args:
+            fetch_page: Callable(cursor, limit) returning one page of items
+            **kwargs: Paginator options (total_limit, page_size, dedup_key, ...)
+
+        Returns:
+            Paginator to iterate or collect
+        """
+        kwargs.setdefault("window", self.pagination_window)
+        return Paginator(fetch_page, **kwargs)
+
     def find_tradeable_market(
         self, binary: bool = True, limit: int = 100, min_liquidity: float = 0.0
     ) -> Optional[Market]:
@@ -385,43 +675,190 @@ class Exchange(ABC):
                 "rate_limit": True,
                 "retry_logic": True,
             },
+            "resilience": self.resilience_stats(),
         }
 
-    def _check_rate_limit(self):
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Token-bucket rate limiter for this exchange's API host"""
+        return self.rate_limiter_for()
+
+    def rate_limiter_for(self, url: Optional[str] = None) -> RateLimiter:
+        """
+        Get the rate limiter a request draws from.
+
+        Args:
+            url: Request URL; only used with RATE_LIMIT_PER_REQUEST_HOST, where
+                each API host has its own limiter
+
+        Returns:
+            RateLimiter for the request's host (the exchange's host by default)
+        """
+        key = self._rate_limit_key()
+        if url and self.RATE_LIMIT_PER_REQUEST_HOST:
+            key = urlparse(url).netloc or key
+        limiter = self._rate_limiters.get(key)
+        if limiter is None:
+            with self._rate_limiter_lock:
+                limiter = self._rate_limiters.get(key)
+                if limiter is None:
+                    limiter = self._rate_limiters[key] = self._create_rate_limiter(key)
+        return limiter
+
+    def _create_rate_limiter(self, key: str) -> RateLimiter:
+        endpoint_limits = {**self.RATE_LIMITS, **self.config.get("rate_limits", {})}
+        if self.share_rate_limit:
+            return get_shared_rate_limiter(
+                key, self.rate_limit, self.rate_limit_burst, endpoint_limits
+            )
+        return RateLimiter(self.rate_limit, self.rate_limit_burst, endpoint_limits)
+
+    def _rate_limit_key(self) -> str:
+        """Key under which instances share a rate limiter (API host, else exchange id)"""
+        host = getattr(self, "host", None)
+        if isinstance(host, str) and host:
+            return urlparse(host).netloc or host
+        return self.id
+
+    def _reserve_rate_limit(
+        self, endpoint: Optional[str] = None, url: Optional[str] = None
+    ) -> float:
+        """
+        Record a request against the rate limit.
+
+        Args:
+            endpoint: Endpoint bucket name (see RATE_LIMITS)
+            url: Request URL, selecting the host limiter (see rate_limiter_for)
+
+        Returns:
+            Seconds the caller must wait before sending (0 if none)
+        """
+        return self.rate_limiter_for(url).reserve(endpoint)
+
+    def _check_rate_limit(self, endpoint: Optional[str] = None, url: Optional[str] = None):
         """Check and enforce rate limiting"""
-        current_time = time.time()
+        sleep_time = self._reserve_rate_limit(endpoint, url)
+        if sleep_time > 0:
+            if self.verbose:
+                print(f"Rate limit reached, sleeping for {sleep_time:.2f}s")
+            if self.metrics is not None:
+                self.metrics.observe_rate_limit_wait(self.id, endpoint or "default", sleep_time)
+            time.sleep(sleep_time)
+
+    def _observed(self, method: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call ``func``, reporting its duration to the metrics hook as ``method``.
+
+        Used for steps outside _retry_on_failure, e.g. order signing.
+        """
+        if self.metrics is None:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        error = None
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            self.metrics.observe_call(self.id, method, time.perf_counter() - start, error)
+
+    def _record_http_request(
+        self,
+        endpoint: str,
+        seconds: float,
+        response: Optional[Any],
+        error: Optional[BaseException],
+    ) -> None:
+        """HTTPTransport hook: report one HTTP request to the metrics hook"""
+        status = bytes_sent = bytes_received = None
+        if response is not None:
+            status = getattr(response, "status_code", None)
+            body = getattr(getattr(response, "request", None), "body", None)
+            bytes_sent = len(body) if isinstance(body, (bytes, str)) else 0
+            length = getattr(response, "headers", {}).get("Content-Length")
+            if length is not None and str(length).isdigit():
+                bytes_received = int(length)
+            else:
+                content = getattr(response, "content", b"")
+                bytes_received = len(content) if isinstance(content, (bytes, str)) else 0
+        self.metrics.observe_request(
+            self.id,
+            endpoint,
+            seconds,
+            status=status if isinstance(status, int) else None,
+            bytes_sent=bytes_sent or 0,
+            bytes_received=bytes_received or 0,
+            error=type(error).__name__ if error is not None else None,
+        )
 
-        # Clean old requests (older than 1 second)
-        self.request_times = [t for t in self.request_times if current_time - t < 1.0]
+    def _rate_limit_request(self, method: str, url: str) -> None:
+        """HTTPTransport hook: rate limit a request sent inside _retry_on_failure"""
+        scope = getattr(self._rate_limit_scope, "endpoints", None)
+        if scope:
+            self._rate_limit_scope.url = url
+            self._check_rate_limit(scope[-1], url)
 
-        # Check if we've exceeded the rate limit
-        if len(self.request_times) >= self.rate_limit:
-            sleep_time = 1.0 - (current_time - self.request_times[0])
-            if sleep_time > 0:
-                if self.verbose:
-                    print(f"Rate limit reached, sleeping for {sleep_time:.2f}s")
-                time.sleep(sleep_time)
+    def _retry_delay_for(
+        self,
+        error: Exception,
+        attempt: int,
+        endpoint: Optional[str],
+        url: Optional[str] = None,
+    ) -> float:
+        """Delay before the next retry; honors Retry-After on rate limit errors"""
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            # Block the shared bucket so other callers back off too
+            self.rate_limiter_for(url).block(retry_after, endpoint)
+            return retry_after
+        return self.retry_delay * (self.retry_backoff**attempt) + random.uniform(0, 1)
+
+    def _retry_on_failure(self, func=None, *, endpoint: Optional[str] = None):
+        """
+        Decorator for retry logic with exponential backoff.
 
-        # Record this request
-        self.request_times.append(current_time)
+        Usable bare (``@self._retry_on_failure``) or with an endpoint bucket
+        (``@self._retry_on_failure(endpoint="orders")``). With
+        RATE_LIMIT_PER_REQUEST_HOST, the rate limit is applied per HTTP request
+        (against that request's host) instead of once per call.
+        """
+        if func is None:
+            return lambda f: self._retry_on_failure(f, endpoint=endpoint)
 
-    def _retry_on_failure(self, func):
-        """Decorator for retry logic with exponential backoff"""
+        name = method_name(func)
 
         @wraps(func)
         def wrapper(*args, **kwargs):
+            if self.metrics is None:
+                return attempt_with_retries(*args, **kwargs)
+            return self._observed(name, attempt_with_retries, *args, **kwargs)
+
+        def attempt_with_retries(*args, **kwargs):
             last_exception = None
+            per_request = self.RATE_LIMIT_PER_REQUEST_HOST
 
             for attempt in range(self.max_retries + 1):
                 try:
-                    self._check_rate_limit()
-                    return func(*args, **kwargs)
+                    if not per_request:
+                        self._check_rate_limit(endpoint)
+                        return func(*args, **kwargs)
+                    scope = self._rate_limit_scope
+                    if not hasattr(scope, "endpoints"):
+                        scope.endpoints = []
+                    scope.endpoints.append(endpoint)
+                    scope.url = None
+                    try:
+                        return func(*args, **kwargs)
+                    finally:
+                        scope.endpoints.pop()
                 except (NetworkError, RateLimitError) as e:
                     last_exception = e
                     if attempt < self.max_retries:
-                        delay = self.retry_delay * (self.retry_backoff**attempt) + random.uniform(
-                            0, 1
-                        )
+                        if self.metrics is not None:
+                            self.metrics.observe_retry(self.id, name, type(e).__name__)
+                        url = getattr(self._rate_limit_scope, "url", None) if per_request else None
+                        delay = self._retry_delay_for(e, attempt, endpoint, url)
                         if self.verbose:
                             print(f"Attempt {attempt + 1} failed, retrying in {delay:.2f}s: {e}")
                         time.sleep(delay)
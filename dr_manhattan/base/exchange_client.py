@@ -6,19 +6,20 @@ Exchange is regarded as stateless; ExchangeClient maintains client-specific stat
 """
 
 import asyncio
+import concurrent.futures
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..models.market import Market
 from ..models.nav import NAV, PositionBreakdown
 from ..models.order import Order, OrderSide
-from ..models.orderbook import Orderbook, OrderbookManager
+from ..models.orderbook import ArrayOrderbook, Orderbook, OrderbookManager
 from ..models.position import Position
 from ..utils import setup_logger
 from .order_tracker import OrderCallback, OrderTracker, create_fill_logger
+from .ws_runtime import WebSocketRuntime
 
 logger = setup_logger(__name__)
 
@@ -152,7 +153,7 @@ class ExchangeClient:
         # Market data WebSocket for orderbook
         self._market_ws = None
         self._orderbook_manager = None
-        self._ws_thread = None
+        self._ws_future: Optional[concurrent.futures.Future] = None
 
         # Polling fallback for exchanges without WebSocket
         self._polling_thread = None
@@ -278,6 +279,24 @@ class ExchangeClient:
             return self._exchange.get_orderbook(token_id)
         return {"bids": [], "asks": []}
 
+    def get_orderbooks(self, token_ids: List[str]) -> Dict[str, Orderbook]:
+        """Get normalized orderbooks for many tokens (failed tokens are left out)"""
+        if hasattr(self._exchange, "get_orderbook"):
+            return self._exchange.get_orderbooks(token_ids)
+        return {}
+
+    def _refresh_orderbooks(self, token_ids: List[str]) -> None:
+        """
+        Fetch orderbooks via REST and push them into the orderbook manager.
+
+        Tokens whose fetch failed are missing from get_orderbooks(), so their
+        last good book stays in place.
+        """
+        for token_id, orderbook in self.get_orderbooks(token_ids).items():
+            data = orderbook.to_dict()
+            self._orderbook_manager.update(token_id, data)
+            self.update_mid_price_from_orderbook(token_id, data)
+
     def get_websocket(self):
         """Get market data WebSocket (if exchange supports it)"""
         if hasattr(self._exchange, "get_websocket"):
@@ -307,24 +326,12 @@ class ExchangeClient:
         self._polling_stop = False
 
         # Initial fetch
-        for token_id in token_ids:
-            rest_data = self.get_orderbook(token_id)
-            if rest_data:
-                orderbook = Orderbook.from_rest_response(rest_data, token_id)
-                self._orderbook_manager.update(token_id, orderbook.to_dict())
-                self.update_mid_price_from_orderbook(token_id, orderbook.to_dict())
+        self._refresh_orderbooks(token_ids)
 
         def polling_worker():
             while not self._polling_stop:
                 try:
-                    for token_id in self._polling_token_ids:
-                        if self._polling_stop:
-                            break
-                        rest_data = self.get_orderbook(token_id)
-                        if rest_data:
-                            orderbook = Orderbook.from_rest_response(rest_data, token_id)
-                            self._orderbook_manager.update(token_id, orderbook.to_dict())
-                            self.update_mid_price_from_orderbook(token_id, orderbook.to_dict())
+                    self._refresh_orderbooks(self._polling_token_ids)
                 except Exception as e:
                     logger.warning(f"Orderbook polling error: {e}")
                 time.sleep(interval)
@@ -355,18 +362,9 @@ class ExchangeClient:
             self._orderbook_manager = self._market_ws.get_orderbook_manager()
 
             # Fetch initial orderbook data via REST before connecting WebSocket
-            # Parallelized to reduce latency for markets with many outcomes
+            # Batched to reduce latency for markets with many outcomes
             fetch_start = time.time()
-
-            def fetch_and_update(token_id: str):
-                rest_data = self.get_orderbook(token_id)
-                if rest_data:
-                    orderbook = Orderbook.from_rest_response(rest_data, token_id)
-                    self._orderbook_manager.update(token_id, orderbook.to_dict())
-                    self.update_mid_price_from_orderbook(token_id, orderbook.to_dict())
-
-            with ThreadPoolExecutor(max_workers=min(len(token_ids), 5)) as executor:
-                executor.map(fetch_and_update, token_ids)
+            self._refresh_orderbooks(token_ids)
 
             fetch_duration = time.time() - fetch_start
             if fetch_duration > 1.0:
@@ -374,9 +372,9 @@ class ExchangeClient:
                     f"Initial orderbook fetch took {fetch_duration:.2f}s for {len(token_ids)} tokens"
                 )
 
-            # Create event loop for WebSocket
-            if self._market_ws.loop is None:
-                self._market_ws.loop = asyncio.new_event_loop()
+            # Host the socket on the process-wide WebSocket loop
+            runtime = WebSocketRuntime.default()
+            self._market_ws.loop = runtime.loop
 
             # Callback to update mid price cache on orderbook updates
             def on_orderbook_update(market_id: str, orderbook: dict):
@@ -404,14 +402,7 @@ class ExchangeClient:
                         except Exception:
                             pass
 
-            # Run in background thread with proper event loop management
-            def run_loop():
-                asyncio.set_event_loop(self._market_ws.loop)
-                self._market_ws.loop.create_task(run_websocket())
-                self._market_ws.loop.run_forever()
-
-            self._ws_thread = threading.Thread(target=run_loop, daemon=False)
-            self._ws_thread.start()
+            self._ws_future = runtime.submit(run_websocket())
 
             logger.info("WebSocket orderbook connected")
             return True
@@ -457,9 +448,10 @@ class ExchangeClient:
         Returns:
             Tuple of (best_bid, best_ask), None if not available or invalid
         """
-        # Try WebSocket orderbook first
-        if self._orderbook_manager and self._orderbook_manager.has_data(token_id):
-            return self._orderbook_manager.get_best_bid_ask(token_id)
+        # Try WebSocket orderbook first (one snapshot read: both sides from the same update)
+        snapshot = self._orderbook_manager.snapshot(token_id) if self._orderbook_manager else None
+        if snapshot is not None and snapshot.has_data:
+            return snapshot.best_bid, snapshot.best_ask
 
         # Fall back to REST API
         orderbook = self.get_orderbook(token_id)
@@ -472,6 +464,48 @@ class ExchangeClient:
 
         return best_bid, best_ask
 
+    def is_book_fresh(self, token_id: str, max_age_ms: float) -> bool:
+        """
+        Check that the streamed orderbook for a token is in sync and recent.
+
+        Uses the WebSocket's sync tracking when available, otherwise the age
+        of the last WebSocket or polling update.
+
+        Args:
+            token_id: Token ID
+            max_age_ms: Maximum age in milliseconds
+
+        Returns:
+            True if the book is safe to quote against
+        """
+        if self._market_ws is not None and hasattr(self._market_ws, "is_book_fresh"):
+            return self._market_ws.is_book_fresh(token_id, max_age_ms)
+        if self._orderbook_manager is None:
+            return False
+        age = self._orderbook_manager.age_ms(token_id)
+        return age is not None and age <= max_age_ms
+
+    def get_depth(self, token_id: str) -> Optional[ArrayOrderbook]:
+        """
+        Get full orderbook depth as an ArrayOrderbook.
+
+        Uses WebSocket orderbook if available, otherwise falls back to REST API.
+
+        Args:
+            token_id: Token ID to fetch orderbook for
+
+        Returns:
+            ArrayOrderbook, or None if no orderbook is available
+        """
+        snapshot = self._orderbook_manager.snapshot(token_id) if self._orderbook_manager else None
+        if snapshot is not None and snapshot.has_data:
+            return snapshot.to_arrays()
+
+        orderbook = self.get_orderbook(token_id)
+        if not orderbook:
+            return None
+        return ArrayOrderbook.from_rest_response(orderbook, token_id)
+
     def stop(self):
         """Stop order tracking, WebSocket connections, and polling"""
         if self._order_tracker:
@@ -479,7 +513,8 @@ class ExchangeClient:
         if self._user_ws:
             self._user_ws.stop()
         if self._market_ws:
-            # Stop WebSocket and wait for disconnect to complete
+            # Stop WebSocket and wait for disconnect to complete; the loop is
+            # shared with other clients, so only this client's task is awaited
             if self._market_ws.loop:
                 try:
                     if self._market_ws.loop.is_running():
@@ -487,15 +522,19 @@ class ExchangeClient:
                             self._market_ws.disconnect(), self._market_ws.loop
                         )
                         future.result(timeout=3.0)
-                        self._market_ws.loop.call_soon_threadsafe(self._market_ws.loop.stop)
                 except (RuntimeError, TimeoutError) as e:
                     logger.debug(f"WebSocket disconnect: {e}")
         # Stop polling thread
         if self._polling_thread:
             self._polling_stop = True
             self._polling_thread.join(timeout=2.0)
-        if self._ws_thread:
-            self._ws_thread.join(timeout=3.0)
+        if self._ws_future:
+            try:
+                self._ws_future.result(timeout=3.0)
+            except Exception as e:
+                self._ws_future.cancel()
+                logger.debug(f"WebSocket task shutdown: {e}")
+            self._ws_future = None
 
     def get_balance(self) -> Dict[str, float]:
         """
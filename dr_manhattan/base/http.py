@@ -0,0 +1,342 @@
+"""
+Pooled HTTP transport shared by all exchanges.
+
+Every exchange talks to its REST API through a single ``requests.Session``
+mounted with a connection-pooling adapter, so repeated calls to the same host
+reuse an open TCP+TLS connection instead of paying a fresh handshake.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .errors import CircuitOpenError
+from .resilience import (
+    DEFAULT_MAX_ENDPOINTS,
+    CircuitBreaker,
+    HedgePolicy,
+    LatencyTracker,
+    endpoint_key,
+)
+
+# Defaults sized for a handful of API hosts polled from a few threads
+DEFAULT_POOL_CONNECTIONS = 10  # number of per-host pools kept alive
+DEFAULT_POOL_MAXSIZE = 20  # connections kept per host
+
+
+def _counting_pool(base: type, on_new_conn) -> type:
+    """Build a connection pool class that reports every new connection."""
+
+    class _CountingPool(base):
+        def _new_conn(self):
+            on_new_conn()
+            return super()._new_conn()
+
+    _CountingPool.__name__ = f"Counting{base.__name__}"
+    return _CountingPool
+
+
+class _InstrumentedAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools count the connections they open."""
+
+    def __init__(self, on_new_conn, **kwargs):
+        self._on_new_conn = on_new_conn
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool(HTTPConnectionPool, self._on_new_conn),
+            "https": _counting_pool(HTTPSConnectionPool, self._on_new_conn),
+        }
+
+
+class HTTPTransport:
+    """
+    Keep-alive HTTP transport with connection reuse instrumentation.
+
+    Wraps a ``requests.Session`` so exchanges keep their existing
+    ``requests`` error handling (``requests.Timeout``, ``HTTPError`` ...).
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        gzip: bool = True,
+        headers: Optional[Dict[str, str]] = None,
+        hedge: Optional[HedgePolicy] = None,
+        breaker_threshold: int = 0,
+        breaker_reset_timeout: float = 30.0,
+        max_endpoints: int = DEFAULT_MAX_ENDPOINTS,
+    ):
+        """
+        Initialize transport.
+
+        Args:
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum connections kept open per host
+            pool_block: If True, block when a host's pool is exhausted instead
+                of opening an extra throwaway connection (hard per-host limit)
+            keep_alive: Reuse connections between requests
+            gzip: Advertise gzip/deflate response compression
+            headers: Extra default headers for every request
+            hedge: Hedged GET policy (disabled by default)
+            breaker_threshold: Consecutive failures (network errors or 5xx)
+                that open an endpoint's circuit; 0 (default) disables circuit
+                breaking
+            breaker_reset_timeout: Seconds an open circuit rejects calls
+            max_endpoints: Endpoints with latency samples and breakers kept
+                before the least recently used one is dropped
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._new_connections = 0
+        self._errors = 0
+
+        self.hedge = hedge or HedgePolicy()
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset_timeout = breaker_reset_timeout
+        self.max_endpoints = max_endpoints
+        self.latency = LatencyTracker(max_endpoints=max_endpoints)
+        self._breakers: "OrderedDict[str, CircuitBreaker]" = OrderedDict()
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+
+        # Optional callable(method, url) run before every request is sent
+        # (used by exchanges to rate limit per API host)
+        self.before_request: Optional[Callable[[str, str], None]] = None
+        # Optional callable(endpoint, seconds, response, error) run after every
+        # request completes (used for metrics)
+        self.after_request: Optional[
+            Callable[[str, float, Optional[requests.Response], Optional[BaseException]], None]
+        ] = None
+
+        self.session = requests.Session()
+        adapter = _InstrumentedAdapter(
+            self._record_new_connection,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.session.headers["Accept-Encoding"] = "gzip, deflate" if gzip else "identity"
+        self.session.headers["Connection"] = "keep-alive" if keep_alive else "close"
+        if headers:
+            self.session.headers.update(headers)
+
+    @property
+    def headers(self):
+        """Default headers sent with every request"""
+        return self.session.headers
+
+    @property
+    def cookies(self):
+        """Cookie jar shared by all requests (e.g. login sessions)"""
+        return self.session.cookies
+
+    def _record_new_connection(self) -> None:
+        with self._lock:
+            self._new_connections += 1
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        """Get (or create) the circuit breaker for an endpoint key"""
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(self.breaker_threshold, self.breaker_reset_timeout)
+                self._breakers[endpoint] = breaker
+                while len(self._breakers) > self.max_endpoints:
+                    self._breakers.popitem(last=False)
+            else:
+                self._breakers.move_to_end(endpoint)
+            return breaker
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a request through the pooled session.
+
+        GET requests are hedged when the hedge policy is enabled, and every
+        endpoint is guarded by a circuit breaker when ``breaker_threshold`` > 0.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            **kwargs: Passed through to ``requests.Session.request``
+
+        Returns:
+            requests.Response
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open (not retried by
+                ``Exchange._retry_on_failure``)
+        """
+        if self.before_request is not None:
+            self.before_request(method, url)
+
+        endpoint = endpoint_key(method, url)
+        breaker = self.breaker(endpoint) if self.breaker_threshold > 0 else None
+        if breaker is not None and not breaker.allow():
+            retry_in = breaker.retry_in()
+            raise CircuitOpenError(
+                f"Circuit open for {endpoint}, retry in {retry_in:.1f}s", retry_after=retry_in
+            )
+
+        with self._lock:
+            self._requests += 1
+        start = time.monotonic()
+        try:
+            if self.hedge.enabled and method.upper() == "GET":
+                response = self._hedged_request(endpoint, method, url, kwargs, start)
+            else:
+                response = self.session.request(method, url, **kwargs)
+                self.latency.record(endpoint, time.monotonic() - start)
+        except Exception as e:
+            if isinstance(e, requests.RequestException):
+                with self._lock:
+                    self._errors += 1
+            if breaker is not None:
+                breaker.record_failure()
+            if self.after_request is not None:
+                self.after_request(endpoint, time.monotonic() - start, None, e)
+            raise
+
+        if self.after_request is not None:
+            self.after_request(endpoint, time.monotonic() - start, response, None)
+        if breaker is not None:
+            status = getattr(response, "status_code", None)
+            if isinstance(status, int) and status >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        return response
+
+    def _hedged_request(
+        self, endpoint: str, method: str, url: str, kwargs: Dict[str, Any], start: float
+    ) -> requests.Response:
+        """
+        Send a request, firing a duplicate if it is slower than the hedge delay.
+
+        Only the primary's latency is recorded, so a fast hedge does not pull
+        the endpoint percentile (and with it the hedge delay) down.
+        """
+        with self._lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=self.pool_maxsize, thread_name_prefix="http-hedge"
+                )
+            executor = self._hedge_executor
+
+        def record_primary(future) -> None:
+            if not future.cancelled() and future.exception() is None:
+                self.latency.record(endpoint, time.monotonic() - start)
+
+        primary = executor.submit(self.session.request, method, url, **kwargs)
+        primary.add_done_callback(record_primary)
+        done, _ = wait([primary], timeout=self.hedge.delay_for(self.latency, endpoint))
+        if done:
+            return primary.result()
+
+        hedge = executor.submit(self.session.request, method, url, **kwargs)
+        with self._lock:
+            self._requests += 1
+            self._hedges += 1
+
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # Prefer the primary if both finished together
+            for future in sorted(done, key=lambda f: f is not primary):
+                if future.exception() is None:
+                    if future is hedge:
+                        with self._lock:
+                            self._hedge_wins += 1
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a POST request."""
+        return self.request("POST", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a DELETE request."""
+        return self.request("DELETE", url, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get connection reuse statistics.
+
+        Returns:
+            Dict with request count, new connections, reused connections and
+            reuse ratio (0-1)
+        """
+        with self._lock:
+            total = self._requests
+            opened = self._new_connections
+            errors = self._errors
+        reused = max(total - opened, 0)
+        return {
+            "requests": total,
+            "new_connections": opened,
+            "reused_connections": reused,
+            "reuse_ratio": reused / total if total else 0.0,
+            "errors": errors,
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "keep_alive": self.keep_alive,
+            **self.resilience_stats(),
+        }
+
+    def resilience_stats(self) -> Dict[str, Any]:
+        """
+        Get hedging and circuit breaker statistics.
+
+        Returns:
+            Dict with hedges fired, hedge wins and win rate, and the status of
+            every endpoint circuit breaker
+        """
+        with self._lock:
+            hedges = self._hedges
+            wins = self._hedge_wins
+            breakers = dict(self._breakers)
+        return {
+            "hedging": {
+                "enabled": self.hedge.enabled,
+                "hedged": hedges,
+                "hedge_wins": wins,
+                "hedge_win_rate": wins / hedges if hedges else 0.0,
+            },
+            "circuit_breakers": {
+                endpoint: breaker.status() for endpoint, breaker in sorted(breakers.items())
+            },
+        }
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+        with self._lock:
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -0,0 +1,317 @@
+"""
+Pluggable latency/throughput metrics for exchanges.
+
+Pass a ``MetricsHook`` as ``config["metrics"]`` to any exchange to receive
+per-method call timings, per-endpoint HTTP timings and byte counts, retries,
+rate-limit sleeps and error classes. ``MetricsRecorder`` aggregates them in
+memory and renders Prometheus/OpenMetrics text. With no hook configured the
+instrumentation points reduce to a ``None`` check.
+"""
+
+import bisect
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Latency histogram bucket upper bounds in seconds (Prometheus defaults)
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class MetricsHook:
+    """
+    Receiver for exchange instrumentation events.
+
+    Every method is a no-op; subclass and override what you need (e.g. to
+    forward into statsd or an existing Prometheus registry).
+    """
+
+    def observe_call(
+        self, exchange: str, method: str, seconds: float, error: Optional[str] = None
+    ) -> None:
+        """
+        One exchange method call, including retries and rate-limit sleeps.
+
+        Args:
+            exchange: Exchange id
+            method: Method name (e.g. ``fetch_market``)
+            seconds: Wall time of the call
+            error: Exception class name if the call failed
+        """
+
+    def observe_request(
+        self,
+        exchange: str,
+        endpoint: str,
+        seconds: float,
+        status: Optional[int] = None,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        One HTTP request.
+
+        Args:
+            exchange: Exchange id
+            endpoint: Normalized endpoint key (``"GET host/path/{id}"``)
+            seconds: Request latency
+            status: HTTP status code (None if no response)
+            bytes_sent: Request body size
+            bytes_received: Response body size
+            error: Exception class name if the request raised
+        """
+
+    def observe_retry(self, exchange: str, method: str, error: str) -> None:
+        """A retried attempt and the error class that caused it."""
+
+    def observe_rate_limit_wait(self, exchange: str, bucket: str, seconds: float) -> None:
+        """Time spent sleeping on a rate-limit bucket."""
+
+    def observe_cache(self, exchange: str, cache: str, hit: bool) -> None:
+        """A local cache lookup that was served from disk (hit) or had to fetch (miss)."""
+
+    def observe_dispatch(self, stream: str, subscriber: str, depth: int, dropped: int) -> None:
+        """
+        One update enqueued for a WebSocket subscriber callback.
+
+        Args:
+            stream: WebSocket class the update came from
+            subscriber: Subscription key or callback name
+            depth: Updates queued for the subscriber after this one
+            dropped: Queued updates this enqueue discarded or conflated
+        """
+
+
+class _Histogram:
+    """Cumulative-bucket histogram"""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"count": self.count, "sum": self.sum, "buckets": list(self.counts)}
+
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _labels(**labels: Any) -> LabelKey:
+    return tuple((name, str(value)) for name, value in labels.items())
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+class MetricsRecorder(MetricsHook):
+    """
+    Thread-safe in-memory aggregation with an OpenMetrics text exporter.
+
+    Example:
+        >>> metrics = MetricsRecorder()
+        >>> exchange = Polymarket({"metrics": metrics})
+        >>> exchange.fetch_market("0x...")
+        >>> print(metrics.render())
+    """
+
+    PREFIX = "dr_manhattan"
+
+    def __init__(self, latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Initialize recorder.
+
+        Args:
+            latency_buckets: Histogram bucket upper bounds in seconds
+        """
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+
+    def _observe(self, name: str, labels: LabelKey, value: float) -> None:
+        series = self._histograms.setdefault(name, {})
+        histogram = series.get(labels)
+        if histogram is None:
+            histogram = series[labels] = _Histogram(self.latency_buckets)
+        histogram.observe(value)
+
+    def _inc(self, name: str, labels: LabelKey, value: float = 1) -> None:
+        series = self._counters.setdefault(name, {})
+        series[labels] = series.get(labels, 0) + value
+
+    def observe_call(
+        self, exchange: str, method: str, seconds: float, error: Optional[str] = None
+    ) -> None:
+        labels = _labels(exchange=exchange, method=method)
+        with self._lock:
+            self._observe("call_duration_seconds", labels, seconds)
+            if error:
+                self._inc("call_errors", labels + (("error", error),))
+
+    def observe_request(
+        self,
+        exchange: str,
+        endpoint: str,
+        seconds: float,
+        status: Optional[int] = None,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        error: Optional[str] = None,
+    ) -> None:
+        labels = _labels(exchange=exchange, endpoint=endpoint)
+        outcome = error or (str(status) if status is not None else "none")
+        with self._lock:
+            self._observe("request_duration_seconds", labels, seconds)
+            self._inc("requests", labels + (("status", outcome),))
+            if bytes_sent:
+                self._inc("request_bytes", labels + (("direction", "sent"),), bytes_sent)
+            if bytes_received:
+                self._inc("request_bytes", labels + (("direction", "received"),), bytes_received)
+
+    def observe_retry(self, exchange: str, method: str, error: str) -> None:
+        with self._lock:
+            self._inc("retries", _labels(exchange=exchange, method=method, error=error))
+
+    def observe_rate_limit_wait(self, exchange: str, bucket: str, seconds: float) -> None:
+        labels = _labels(exchange=exchange, bucket=bucket)
+        with self._lock:
+            self._inc("rate_limit_wait_seconds", labels, seconds)
+            self._inc("rate_limit_waits", labels)
+
+    def observe_cache(self, exchange: str, cache: str, hit: bool) -> None:
+        result = "hit" if hit else "miss"
+        with self._lock:
+            self._inc("cache_lookups", _labels(exchange=exchange, cache=cache, result=result))
+
+    def observe_dispatch(self, stream: str, subscriber: str, depth: int, dropped: int) -> None:
+        labels = _labels(stream=stream, subscriber=subscriber)
+        with self._lock:
+            self._gauges.setdefault("dispatch_queue_depth", {})[labels] = depth
+            self._inc("dispatch_updates", labels)
+            if dropped:
+                self._inc("dispatch_dropped", labels, dropped)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get all series as plain data.
+
+        Returns:
+            Dict with ``histograms``, ``counters`` and ``gauges``, each mapping metric name
+            to a list of ``{"labels": {...}, ...}`` entries
+        """
+        with self._lock:
+            return {
+                "histograms": {
+                    name: [
+                        {"labels": dict(labels), **histogram.snapshot()}
+                        for labels, histogram in series.items()
+                    ]
+                    for name, series in self._histograms.items()
+                },
+                "counters": {
+                    name: [
+                        {"labels": dict(labels), "value": value} for labels, value in series.items()
+                    ]
+                    for name, series in self._counters.items()
+                },
+                "gauges": {
+                    name: [
+                        {"labels": dict(labels), "value": value} for labels, value in series.items()
+                    ]
+                    for name, series in self._gauges.items()
+                },
+            }
+
+    def reset(self) -> None:
+        """Drop every recorded series."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._gauges.clear()
+
+    def render(self) -> str:
+        """
+        Render all series in the OpenMetrics text format.
+
+        The output is also accepted by Prometheus' text-format parser, so it
+        can be served as-is from a ``/metrics`` endpoint.
+
+        Returns:
+            Exposition text ending with ``# EOF``
+        """
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(self._histograms):
+                metric = f"{self.PREFIX}_{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for labels, histogram in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    for bound, count in zip(self.latency_buckets, histogram.counts):
+                        cumulative += count
+                        le = ("le", _format_bound(bound))
+                        lines.append(f"{metric}_bucket{_format_labels(labels, le)} {cumulative}")
+                    inf = ("le", "+Inf")
+                    lines.append(f"{metric}_bucket{_format_labels(labels, inf)} {histogram.count}")
+                    lines.append(f"{metric}_sum{_format_labels(labels)} {histogram.sum}")
+                    lines.append(f"{metric}_count{_format_labels(labels)} {histogram.count}")
+            for name in sorted(self._counters):
+                metric = f"{self.PREFIX}_{name}"
+                lines.append(f"# TYPE {metric} counter")
+                for labels, value in sorted(self._counters[name].items()):
+                    lines.append(f"{metric}_total{_format_labels(labels)} {value}")
+            for name in sorted(self._gauges):
+                metric = f"{self.PREFIX}_{name}"
+                lines.append(f"# TYPE {metric} gauge")
+                for labels, value in sorted(self._gauges[name].items()):
+                    lines.append(f"{metric}{_format_labels(labels)} {value}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def method_name(func: Any) -> str:
+    """
+    Public method name for a function wrapped by ``_retry_on_failure``.
+
+    Exchanges decorate local closures (``Polymarket.fetch_market.<locals>._fetch``),
+    so the enclosing method's name is used when there is one.
+    """
+    qualname = getattr(func, "__qualname__", "") or getattr(func, "__name__", "")
+    parts = qualname.split(".")
+    if "<locals>" in parts:
+        index = len(parts) - 1 - parts[::-1].index("<locals>")
+        if index > 0:
+            return parts[index - 1]
+    return parts[-1] if parts else "unknown"
@@ -0,0 +1,174 @@
+"""
+Concurrent prefetching paginator.
+
+REST listings paged by offset (or page number) have predictable request
+parameters, so later pages can be requested while earlier ones are still
+being consumed. ``Paginator`` keeps a bounded window of page requests in
+flight and yields items strictly in page order.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Generic, Iterator, List, Optional, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Page requests kept in flight by default
+DEFAULT_PAGINATION_WINDOW = 4
+
+
+class Paginator(Generic[T]):
+    """
+    Iterate a paged REST listing with a window of prefetched pages.
+
+    ``fetch_page(cursor, limit)`` is called with the page offset (or page
+    number when ``page_numbers`` is set) and the requested page size.
+    Iteration stops at the first empty page, at a short page, when a page
+    contributes no new items under ``dedup_key``, or once ``total_limit``
+    items have been yielded. Pages already in flight past the stop point
+    are cancelled or discarded.
+
+    Example:
+        >>> pages = Paginator(fetch_page, total_limit=5000, page_size=200, window=4)
+        >>> for item in pages:  # page 1 is consumed while pages 2-4 load
+        ...     handle(item)
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[int, int], List[T]],
+        *,
+        total_limit: Optional[int] = None,
+        initial_offset: int = 0,
+        page_size: int = 500,
+        window: int = DEFAULT_PAGINATION_WINDOW,
+        dedup_key: Optional[Callable[[T], Any]] = None,
+        page_numbers: bool = False,
+        stop_on_short_page: bool = True,
+        max_pages: Optional[int] = None,
+        log: bool = False,
+    ):
+        """
+        Initialize paginator.
+
+        Args:
+            fetch_page: Callable(cursor, limit) returning one page of items
+            total_limit: Maximum items to yield (None for no limit)
+            initial_offset: First offset, or first page number with page_numbers
+            page_size: Items requested per page
+            window: Maximum page requests in flight (1 fetches serially)
+            dedup_key: Key function used to drop items already seen
+            page_numbers: Pass page numbers instead of item offsets as cursor
+            stop_on_short_page: Stop after a page with fewer items than requested.
+                Disable for endpoints that filter pages after fetching.
+            max_pages: Maximum pages to request
+            log: Print each page request
+        """
+        self.fetch_page = fetch_page
+        self.total_limit = None if total_limit is None else int(total_limit)
+        self.initial_offset = int(initial_offset)
+        self.page_size = max(1, int(page_size))
+        self.window = max(1, int(window))
+        self.dedup_key = dedup_key
+        self.page_numbers = page_numbers
+        self.stop_on_short_page = stop_on_short_page
+        self.max_pages = max_pages
+        self.log = log
+
+    def __iter__(self) -> Iterator[T]:
+        yielded = 0
+        for page in self.pages():
+            for item in page:
+                if self.total_limit is not None and yielded >= self.total_limit:
+                    return
+                yielded += 1
+                yield item
+
+    def collect(self) -> List[T]:
+        """Fetch every page and return all items as a list."""
+        return list(self)
+
+    def pages(self) -> Iterator[List[T]]:
+        """
+        Iterate pages in order, with duplicates already removed.
+
+        Yields:
+            Non-empty list of new items per page
+        """
+        if self.total_limit is not None and self.total_limit <= 0:
+            return
+
+        seen: Set[Any] = set()
+        # Cursor of the next page and item count requested by pages still in flight
+        next_cursor = self.initial_offset
+        requested = 0
+        consumed = 0
+        scheduled_pages = 0
+        pending: Deque[Tuple[int, Future]] = deque()
+        executor = ThreadPoolExecutor(max_workers=self.window) if self.window > 1 else None
+
+        def _can_schedule() -> bool:
+            if self.max_pages is not None and scheduled_pages >= self.max_pages:
+                return False
+            if self.total_limit is None:
+                return True
+            return consumed + requested < self.total_limit
+
+        def _schedule() -> None:
+            nonlocal next_cursor, requested, scheduled_pages
+            limit = self.page_size
+            if self.total_limit is not None:
+                limit = min(limit, self.total_limit - consumed - requested)
+            if self.log:
+                print("current-offset:", next_cursor)
+                print("page_limit:", limit)
+                print("----------")
+            if executor is None:
+                future: Future = Future()
+                try:
+                    future.set_result(self.fetch_page(next_cursor, limit))
+                except Exception as e:
+                    future.set_exception(e)
+            else:
+                future = executor.submit(self.fetch_page, next_cursor, limit)
+            pending.append((limit, future))
+            next_cursor += 1 if self.page_numbers else limit
+            requested += limit
+            scheduled_pages += 1
+
+        try:
+            while True:
+                while len(pending) < self.window and _can_schedule():
+                    _schedule()
+                if not pending:
+                    return
+
+                limit, future = pending.popleft()
+                requested -= limit
+                page = future.result()
+                if not page:
+                    return
+
+                if self.dedup_key is not None:
+                    new_items = []
+                    for item in page:
+                        key = self.dedup_key(item)
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        new_items.append(item)
+                    if not new_items:
+                        return
+                else:
+                    new_items = list(page)
+
+                consumed += len(new_items)
+                yield new_items
+
+                if self.stop_on_short_page and len(page) < limit:
+                    return
+        finally:
+            for _, future in pending:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,229 @@
+"""
+On-disk incremental cache for price history.
+
+``PriceHistoryCache`` stores (timestamp, price) columns per exchange, token,
+interval and fidelity as Parquet files, together with the time ranges that
+have already been downloaded. A request only fetches the sub-ranges it has
+not seen yet, merges them in, and serves the rest from disk. Once a market
+has closed its history cannot change, so nothing past its close time is
+ever fetched again.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .metrics import MetricsHook
+
+# (timestamp in epoch seconds, price)
+PriceRow = Tuple[int, float]
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+@dataclass
+class _Series:
+    """Cached rows and downloaded ranges of one key"""
+
+    timestamps: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    prices: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    coverage: List[List[int]] = field(default_factory=list)  # Sorted, merged [start, end]
+    closed_at: Optional[int] = None
+
+
+def _add_range(coverage: List[List[int]], start: int, end: int) -> List[List[int]]:
+    """Insert [start, end] into a sorted list of ranges, merging overlaps"""
+    merged: List[List[int]] = []
+    for lo, hi in sorted(coverage + [[start, end]]):
+        if merged and lo <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], hi)
+        else:
+            merged.append([lo, hi])
+    return merged
+
+
+def missing_ranges(
+    coverage: List[List[int]], start: int, end: int, min_gap: int = 0
+) -> List[Tuple[int, int]]:
+    """
+    Sub-ranges of [start, end] not covered by ``coverage``.
+
+    Args:
+        coverage: Sorted, non-overlapping [start, end] ranges
+        start: Window start (epoch seconds)
+        end: Window end (epoch seconds)
+        min_gap: Gaps shorter than this many seconds count as covered
+
+    Returns:
+        List of (start, end) ranges to fetch
+    """
+    gaps: List[Tuple[int, int]] = []
+    cursor = start
+    for lo, hi in coverage:
+        if hi < cursor:
+            continue
+        if lo > end:
+            break
+        if lo > cursor:
+            gaps.append((cursor, lo))
+        cursor = max(cursor, hi)
+    if cursor < end:
+        gaps.append((cursor, end))
+    return [(lo, hi) for lo, hi in gaps if hi - lo >= max(min_gap, 1)]
+
+
+class PriceHistoryCache:
+    """
+    Thread-safe price history cache with per-key downloaded ranges.
+
+    Example:
+        >>> cache = PriceHistoryCache("~/.cache/dr_manhattan/prices")
+        >>> exchange = Polymarket({"price_history_cache": cache})
+        >>> exchange.fetch_price_history(market, interval="1w", fidelity=60)  # miss
+        >>> exchange.fetch_price_history(market, interval="1w", fidelity=60)  # hit
+        >>> cache.stats()
+        {'hits': 1, 'misses': 1, 'keys': 1}
+    """
+
+    def __init__(self, path: Optional[str] = None, metrics: Optional[MetricsHook] = None):
+        """
+        Initialize cache.
+
+        Args:
+            path: Directory for Parquet files (None keeps the cache in memory only)
+            metrics: Hook receiving a hit/miss event per lookup
+        """
+        self.path = os.path.expanduser(path) if path else None
+        self.metrics = metrics
+        self.hits = 0
+        self.misses = 0
+        self._series: Dict[str, _Series] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(exchange: str, token_id: str, interval: Optional[str], fidelity: Optional[int]) -> str:
+        """Cache key of one price series."""
+        return "/".join([exchange, str(token_id), interval or "-", str(fidelity or "-")])
+
+    def _file(self, key: str) -> Optional[str]:
+        if not self.path:
+            return None
+        exchange, rest = key.split("/", 1)
+        return os.path.join(self.path, exchange, _UNSAFE.sub("_", rest) + ".parquet")
+
+    def _load(self, key: str) -> _Series:
+        series = self._series.get(key)
+        if series is not None:
+            return series
+        series = _Series()
+        path = self._file(key)
+        if path and os.path.exists(path):
+            table = pq.read_table(path)
+            meta = json.loads((table.schema.metadata or {}).get(b"cache", b"{}"))
+            series.timestamps = table.column("timestamp").to_numpy().astype(np.int64)
+            series.prices = table.column("price").to_numpy().astype(np.float64)
+            series.coverage = [list(r) for r in meta.get("coverage", [])]
+            series.closed_at = meta.get("closed_at")
+        self._series[key] = series
+        return series
+
+    def _save(self, key: str, series: _Series) -> None:
+        path = self._file(key)
+        if not path:
+            return
+        meta = {"coverage": series.coverage, "closed_at": series.closed_at}
+        table = pa.table(
+            {"timestamp": series.timestamps, "price": series.prices},
+            metadata={"cache": json.dumps(meta)},
+        )
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _merge(series: _Series, rows: Iterable[PriceRow]) -> None:
+        """Merge fetched rows in; a fetched timestamp replaces the cached one"""
+        new = np.asarray(list(rows), dtype=np.float64).reshape(-1, 2)
+        timestamps = np.concatenate([new[:, 0].astype(np.int64), series.timestamps])
+        prices = np.concatenate([new[:, 1], series.prices])
+        series.timestamps, first = np.unique(timestamps, return_index=True)
+        series.prices = prices[first]
+
+    def get(
+        self,
+        exchange: str,
+        token_id: str,
+        start: int,
+        end: int,
+        fetch: Callable[[int, int], Iterable[PriceRow]],
+        *,
+        interval: Optional[str] = None,
+        fidelity: Optional[int] = None,
+        closed_at: Optional[int] = None,
+        min_gap: int = 0,
+    ) -> List[PriceRow]:
+        """
+        Price rows in [start, end], fetching only ranges not cached yet.
+
+        Args:
+            exchange: Exchange id
+            token_id: Token/market identifier
+            start: Window start (epoch seconds)
+            end: Window end (epoch seconds)
+            fetch: Function(start, end) returning (timestamp, price) rows
+            interval: Interval the rows are sampled at
+            fidelity: Resolution parameter the rows were fetched with
+            closed_at: Market close time; the series is immutable past it
+            min_gap: Uncached gaps shorter than this many seconds are not fetched
+
+        Returns:
+            Rows sorted by timestamp
+        """
+        key = self.key(exchange, token_id, interval, fidelity)
+        with self._lock:
+            series = self._load(key)
+            if closed_at is not None:
+                series.closed_at = closed_at
+            if series.closed_at is not None:
+                end = min(end, series.closed_at)
+            gaps = missing_ranges(series.coverage, start, end, min_gap) if start < end else []
+
+            if gaps:
+                self.misses += 1
+                fetched_at = int(time.time())
+                for lo, hi in gaps:
+                    rows = list(fetch(lo, hi))
+                    if rows:
+                        self._merge(series, rows)
+                    if min(hi, fetched_at) > lo:
+                        series.coverage = _add_range(series.coverage, lo, min(hi, fetched_at))
+                self._save(key, series)
+            else:
+                self.hits += 1
+
+            lo = int(np.searchsorted(series.timestamps, start, side="left"))
+            hi = int(np.searchsorted(series.timestamps, end, side="right"))
+            rows = list(zip(series.timestamps[lo:hi].tolist(), series.prices[lo:hi].tolist()))
+
+        if self.metrics is not None:
+            self.metrics.observe_cache(exchange, "price_history", hit=not gaps)
+        return rows
+
+    def stats(self) -> Dict[str, int]:
+        """Hit and miss counts since creation, and keys loaded."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "keys": len(self._series)}
+
+    def clear(self) -> None:
+        """Drop the in-memory series (files on disk are kept)."""
+        with self._lock:
+            self._series.clear()
@@ -0,0 +1,226 @@
+"""
+Token-bucket rate limiting for exchange REST calls.
+
+Each API host gets one RateLimiter with a default bucket plus optional
+per-endpoint buckets (e.g. order placement vs market data). Limiters are
+shared process-wide through a registry, so every Exchange instance talking
+to the same host with the same limits draws from the same budget.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple, Union
+
+# Endpoint budget: rate in requests/sec, or (rate, burst)
+EndpointLimit = Union[float, Tuple[float, float]]
+
+DEFAULT_BUCKET = "default"
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with O(1) reservations.
+
+    A reservation debits the bucket immediately and returns how long the
+    caller must wait. The balance may go negative, which queues concurrent
+    callers fairly (GCRA-style) instead of letting them race for refills.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        Initialize bucket.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Bucket capacity (defaults to rate, minimum 1)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = max(1.0, float(burst if burst is not None else rate))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Reserve tokens for one request.
+
+        Args:
+            tokens: Cost of the request
+
+        Returns:
+            Seconds to wait before sending (0 if the request may go now)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now, 0.0)
+
+    def block(self, seconds: float) -> None:
+        """
+        Hold all reservations for ``seconds`` (e.g. after a 429 Retry-After).
+
+        Args:
+            seconds: Time to block from now
+        """
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def status(self) -> Dict[str, float]:
+        """
+        Get current bucket status.
+
+        Returns:
+            Dict with available tokens, rate, burst and remaining block time
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                "tokens_available": self._tokens,
+                "rate_per_second": self.rate,
+                "burst_size": self.burst,
+                "blocked_for": max(0.0, self._blocked_until - now),
+            }
+
+
+class RateLimiter:
+    """Rate limiter for one API host with per-endpoint buckets."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        endpoint_limits: Optional[Dict[str, EndpointLimit]] = None,
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Default requests per second
+            burst: Default bucket capacity (defaults to rate)
+            endpoint_limits: Named endpoint budgets, each a rate or (rate, burst).
+                Endpoints without an entry share the default bucket.
+        """
+        self._buckets: Dict[str, TokenBucket] = {DEFAULT_BUCKET: TokenBucket(rate, burst)}
+        for endpoint, limit in (endpoint_limits or {}).items():
+            if isinstance(limit, (tuple, list)):
+                self._buckets[endpoint] = TokenBucket(limit[0], limit[1])
+            else:
+                self._buckets[endpoint] = TokenBucket(limit)
+
+    def bucket(self, endpoint: Optional[str] = None) -> TokenBucket:
+        """Get the bucket for an endpoint (the default bucket if it has no budget)"""
+        return self._buckets.get(endpoint or DEFAULT_BUCKET) or self._buckets[DEFAULT_BUCKET]
+
+    def reserve(self, endpoint: Optional[str] = None) -> float:
+        """
+        Reserve one request on an endpoint.
+
+        Args:
+            endpoint: Endpoint bucket name
+
+        Returns:
+            Seconds to wait before sending
+        """
+        return self.bucket(endpoint).reserve()
+
+    def block(self, seconds: float, endpoint: Optional[str] = None) -> None:
+        """
+        Block an endpoint bucket, e.g. to honor a Retry-After header.
+
+        Args:
+            seconds: Time to block from now
+            endpoint: Endpoint bucket name
+        """
+        if seconds > 0:
+            self.bucket(endpoint).block(seconds)
+
+    def status(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get status of every bucket.
+
+        Returns:
+            Dict mapping bucket name to TokenBucket.status()
+        """
+        return {name: bucket.status() for name, bucket in self._buckets.items()}
+
+
+# Process-wide limiters keyed by API host and limits
+_shared_limiters: Dict[Tuple[Any, ...], RateLimiter] = {}
+_shared_limiters_lock = threading.Lock()
+
+
+def get_shared_rate_limiter(
+    key: str,
+    rate: float,
+    burst: Optional[float] = None,
+    endpoint_limits: Optional[Dict[str, EndpointLimit]] = None,
+) -> RateLimiter:
+    """
+    Get or create the process-wide limiter for an API host.
+
+    Callers share a limiter only when both the key and the limits match, so
+    an instance configured with different limits gets its own budget instead
+    of silently inheriting the first instance's.
+
+    Args:
+        key: API host (or other shared budget identifier)
+        rate: Default requests per second
+        burst: Default bucket capacity
+        endpoint_limits: Named endpoint budgets
+
+    Returns:
+        Shared RateLimiter
+    """
+    limits = tuple(
+        sorted(
+            (name, tuple(limit) if isinstance(limit, (tuple, list)) else limit)
+            for name, limit in (endpoint_limits or {}).items()
+        )
+    )
+    registry_key = (key, rate, burst, limits)
+    with _shared_limiters_lock:
+        limiter = _shared_limiters.get(registry_key)
+        if limiter is None:
+            limiter = RateLimiter(rate, burst, endpoint_limits)
+            _shared_limiters[registry_key] = limiter
+        return limiter
+
+
+def parse_retry_after(value: Any, default: float = 1.0) -> float:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+        default: Value to use when the header is missing or malformed
+
+    Returns:
+        Seconds to wait (never negative)
+    """
+    if value is None or value == "":
+        return default
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
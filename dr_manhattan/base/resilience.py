@@ -0,0 +1,238 @@
+"""
+Tail-latency and failure isolation for REST endpoints.
+
+``LatencyTracker`` keeps a rolling latency window per endpoint, used to
+derive the p95-based delay after which a hedged GET is fired.
+``CircuitBreaker`` fails calls fast while an endpoint keeps failing, then
+lets a single trial request through to probe recovery.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional
+from urllib.parse import urlparse
+
+# Path segments that look like IDs: numbers, or long tokens containing digits
+# (hex hashes, token IDs). Short ones such as "v1" are kept.
+_ID_SEGMENT = re.compile(r"^(\d+|(?=.*\d)[\w\-.:]{8,})$")
+
+# Endpoint keys tracked per transport. Paths with free-form segments (e.g.
+# market slugs) produce one key per slug, so per-endpoint state is kept in
+# LRU order and the least recently used keys are dropped past this bound.
+DEFAULT_MAX_ENDPOINTS = 128
+
+
+def endpoint_key(method: str, url: str) -> str:
+    """
+    Normalize a request into an endpoint key.
+
+    Query strings are dropped and ID-like path segments are collapsed, so
+    ``GET /markets/123`` and ``GET /markets/456`` share one key.
+
+    Args:
+        method: HTTP method
+        url: Absolute URL
+
+    Returns:
+        Key such as ``"GET clob.polymarket.com/markets/{id}"``
+    """
+    parsed = urlparse(url)
+    segments = [
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in parsed.path.split("/")
+    ]
+    return f"{method.upper()} {parsed.netloc}{'/'.join(segments)}"
+
+
+class LatencyTracker:
+    """Rolling per-endpoint latency samples with percentile lookup."""
+
+    def __init__(self, window: int = 200, max_endpoints: int = DEFAULT_MAX_ENDPOINTS):
+        """
+        Initialize tracker.
+
+        Args:
+            window: Samples kept per endpoint
+            max_endpoints: Endpoints tracked before the least recently used is dropped
+        """
+        self.window = window
+        self.max_endpoints = max_endpoints
+        self._samples: "OrderedDict[str, Deque[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        """Record one request latency."""
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+                while len(self._samples) > self.max_endpoints:
+                    self._samples.popitem(last=False)
+            else:
+                self._samples.move_to_end(endpoint)
+            samples.append(seconds)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._samples)
+
+    def percentile(self, endpoint: str, q: float = 0.95, min_samples: int = 1) -> Optional[float]:
+        """
+        Get a latency percentile for an endpoint.
+
+        Args:
+            endpoint: Endpoint key
+            q: Percentile in [0, 1]
+            min_samples: Minimum samples required
+
+        Returns:
+            Latency in seconds, or None with too few samples
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint, ()))
+        if len(samples) < max(1, min_samples):
+            return None
+        index = min(len(samples) - 1, int(q * len(samples)))
+        return samples[index]
+
+
+@dataclass
+class HedgePolicy:
+    """
+    When to fire a duplicate GET.
+
+    Attributes:
+        enabled: Hedge idempotent GET requests
+        delay: Fixed hedge delay in seconds (None derives it from latency)
+        percentile: Latency percentile used as the hedge delay
+        min_samples: Samples needed before the percentile is trusted
+        initial_delay: Delay used until enough samples exist
+        min_delay: Lower bound for the derived delay
+    """
+
+    enabled: bool = False
+    delay: Optional[float] = None
+    percentile: float = 0.95
+    min_samples: int = 20
+    initial_delay: float = 1.0
+    min_delay: float = 0.05
+
+    def delay_for(self, tracker: LatencyTracker, endpoint: str) -> float:
+        """Hedge delay for an endpoint given its observed latency."""
+        if self.delay is not None:
+            return self.delay
+        observed = tracker.percentile(endpoint, self.percentile, self.min_samples)
+        if observed is None:
+            return self.initial_delay
+        return max(self.min_delay, observed)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed -> open after ``failure_threshold`` consecutive failures; open
+    rejects calls for ``reset_timeout`` seconds; then half-open lets one
+    trial call through, which closes the breaker on success or reopens it
+    on failure.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before probing
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._opens = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == self.OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may proceed.
+
+        Returns:
+            False while open (or while a half-open trial is running)
+        """
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self._rejected += 1
+            return False
+
+    def retry_in(self) -> float:
+        """Seconds until the breaker will allow a trial call."""
+        with self._lock:
+            if self._current_state(time.monotonic()) != self.OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self._opens += 1
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Get breaker status.
+
+        Returns:
+            Dict with state, consecutive failures, open count and rejected calls
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            retry_in = (
+                max(0.0, self.reset_timeout - (now - self._opened_at))
+                if state == self.OPEN
+                else 0.0
+            )
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "opens": self._opens,
+                "rejected": self._rejected,
+                "retry_in": retry_in,
+            }
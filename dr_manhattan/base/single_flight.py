@@ -0,0 +1,222 @@
+"""
+Request coalescing (single-flight).
+
+Concurrent identical read calls share one in-flight execution: the first
+caller runs the request and every caller that arrives before it finishes
+receives the same result (or the same exception). Nothing is cached once
+the call completes. Groups built with ``copy_result`` hand each follower
+its own copy, so one caller mutating the result does not affect the others.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """In-flight call shared by the leader and its followers"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class FlightStats:
+    """Per-method executed/coalesced counters, shareable between flight groups"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executed: Dict[str, int] = {}
+        self._coalesced: Dict[str, int] = {}
+
+    def record(self, group: str, coalesced: bool) -> None:
+        counters = self._coalesced if coalesced else self._executed
+        with self._lock:
+            counters[group] = counters.get(group, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            executed = sum(self._executed.values())
+            coalesced = sum(self._coalesced.values())
+            groups = sorted(set(self._executed) | set(self._coalesced))
+            return {
+                "calls": executed + coalesced,
+                "executed": executed,
+                "coalesced": coalesced,
+                "by_method": {
+                    group: {
+                        "executed": self._executed.get(group, 0),
+                        "coalesced": self._coalesced.get(group, 0),
+                    }
+                    for group in groups
+                },
+            }
+
+
+def _group(key: Hashable) -> str:
+    return str(key[0]) if isinstance(key, tuple) and key else str(key)
+
+
+class SingleFlight:
+    """
+    Thread-safe single-flight group.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> book = flight.do(("get_orderbook", token_id), exchange.get_orderbook, token_id)
+    """
+
+    def __init__(
+        self,
+        stats: Optional[FlightStats] = None,
+        copy_result: Optional[Callable[[Any], Any]] = None,
+    ):
+        """
+        Initialize group.
+
+        Args:
+            stats: Counters to record into (shared with another group if given)
+            copy_result: Applied to the shared result for each follower
+                (e.g. ``copy.copy``); followers get the leader's object if None
+        """
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.stats_recorder = stats or FlightStats()
+        self.copy_result = copy_result
+
+    def do(self, key: Hashable, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run ``func`` once per key among concurrent callers.
+
+        Args:
+            key: Hashable call identity; the first element names the stats group
+            func: Callable to run when no identical call is in flight
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+        self.stats_recorder.record(_group(key), coalesced=not leader)
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return self.copy_result(call.result) if self.copy_result else call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dict with total calls, executed and coalesced counts, and a
+            per-method breakdown
+        """
+        return self.stats_recorder.snapshot()
+
+
+class AsyncSingleFlight:
+    """
+    Single-flight group for coroutines on one event loop.
+
+    The shared call runs as a task, so cancelling one waiting caller does
+    not cancel the request for the others.
+    """
+
+    def __init__(
+        self,
+        stats: Optional[FlightStats] = None,
+        copy_result: Optional[Callable[[Any], Any]] = None,
+    ):
+        """
+        Initialize group.
+
+        Args:
+            stats: Counters to record into (shared with another group if given)
+            copy_result: Applied to the shared result for each follower
+        """
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self.stats_recorder = stats or FlightStats()
+        self.copy_result = copy_result
+
+    async def do(
+        self, key: Hashable, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Await ``func`` once per key among concurrent callers.
+
+        Args:
+            key: Hashable call identity; the first element names the stats group
+            func: Coroutine function to run when no identical call is in flight
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result of the shared call
+        """
+        task = self._tasks.get(key)
+        leader = task is None
+        self.stats_recorder.record(_group(key), coalesced=not leader)
+        if leader:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        result = await asyncio.shield(task)
+        if not leader and self.copy_result:
+            return self.copy_result(result)
+        return result
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._tasks)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics (same layout as SingleFlight.stats)."""
+        return self.stats_recorder.snapshot()
+
+
+def call_key(name: str, args: tuple, kwargs: Dict[str, Any]) -> Optional[Hashable]:
+    """
+    Build a single-flight key for a method call.
+
+    Returns:
+        Hashable key, or None if any argument is unhashable (the call is
+        then not coalesced)
+    """
+    key = (name, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
@@ -11,6 +11,7 @@ from typing import Callable, Dict, List, Optional, Tuple
 from ..models.market import Market, OutcomeToken
 from ..models.nav import NAV
 from ..models.order import Order, OrderSide
+from ..models.orderbook import ArrayOrderbook
 from ..utils import setup_logger
 from ..utils.logger import Colors
 from ..utils.price import round_to_tick_size
@@ -391,6 +392,37 @@ class Strategy(ABC):
             logger.warning(f"Failed to fetch orderbook: {e}")
             return {"bids": [], "asks": []}
 
+    def get_depth(self, token_id: str) -> Optional[ArrayOrderbook]:
+        """
+        Get full orderbook depth for sizing against the book.
+
+        Uses WebSocket orderbook if available, otherwise falls back to REST API.
+
+        Args:
+            token_id: Token ID to fetch orderbook for
+
+        Returns:
+            ArrayOrderbook, or None if unavailable
+        """
+        try:
+            return self.client.get_depth(token_id)
+        except Exception as e:
+            logger.warning(f"Failed to fetch orderbook depth: {e}")
+            return None
+
+    def is_book_fresh(self, token_id: str, max_age_ms: float = 5000) -> bool:
+        """
+        Check the streamed orderbook is in sync and recent before quoting.
+
+        Args:
+            token_id: Token ID
+            max_age_ms: Maximum age in milliseconds
+
+        Returns:
+            True if the book is safe to quote against
+        """
+        return self.client.is_book_fresh(token_id, max_age_ms)
+
     def get_best_bid_ask(self, token_id: str) -> Tuple[Optional[float], Optional[float]]:
         """
         Get best bid and ask prices.
@@ -533,7 +565,7 @@ class Strategy(ABC):
 
     def liquidate_positions(self):
         """
-        Liquidate all positions by selling at best bid.
+        Liquidate all positions by selling into the visible bids.
 
         Override for custom liquidation logic.
         """
@@ -554,21 +586,42 @@ class Strategy(ABC):
                 logger.warning(f"  Cannot find token_id for {outcome}")
                 continue
 
-            best_bid, _ = self.get_best_bid_ask(token_id)
-            if best_bid is None or best_bid <= 0:
-                logger.warning(f"  {outcome}: No bid available, cannot liquidate")
-                continue
-
             sell_size = float(int(size))
             if sell_size <= 0:
                 continue
 
+            price = self._liquidation_price(token_id, sell_size)
+            if price is None or price <= 0:
+                logger.warning(f"  {outcome}: No bid available, cannot liquidate")
+                continue
+
             try:
-                self.create_order(outcome, OrderSide.SELL, best_bid, sell_size, token_id)
-                self.log_order(OrderSide.SELL, sell_size, outcome, best_bid, "LIQUIDATE")
+                self.create_order(outcome, OrderSide.SELL, price, sell_size, token_id)
+                self.log_order(OrderSide.SELL, sell_size, outcome, price, "LIQUIDATE")
             except Exception as e:
                 logger.error(f"  Failed to liquidate {outcome}: {e}")
 
+    def _liquidation_price(self, token_id: str, size: float) -> Optional[float]:
+        """
+        Limit price that sells ``size`` into the visible bids.
+
+        Walks the book so a position larger than the top bid is priced at the
+        deepest level it needs; if the book is too thin, uses the lowest bid.
+        Falls back to the best bid when depth is unavailable.
+        """
+        book = self.get_depth(token_id)
+        if book is None or not book.bid_prices.size:
+            best_bid, _ = self.get_best_bid_ask(token_id)
+            return best_bid
+
+        price = book.fill_price(OrderSide.SELL, size)
+        if price is None:
+            price = float(book.bid_prices[-1])
+            logger.warning(
+                f"  Only {book.bid_sizes.sum():.0f} of {size:.0f} can fill at visible bids"
+            )
+        return price
+
     def cleanup(self):
         """
         Cleanup on shutdown.
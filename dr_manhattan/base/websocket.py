@@ -1,15 +1,17 @@
 import asyncio
 import json
 import logging
-import threading
 import time
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import websockets
 import websockets.exceptions
 
+from .dispatch import Dispatcher, OverflowPolicy
+from .ws_runtime import WebSocketRuntime
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,13 +53,20 @@ class OrderBookWebSocket(ABC):
         # Subscriptions
         self.subscriptions: Dict[str, Callable] = {}
 
-        # Event loop
+        # Event loop (the shared WebSocketRuntime's once started)
         self.loop = None
         self.tasks = []
+        self._run_future = None
 
         # Last activity tracking
         self.last_message_time = 0
 
+        # Optional dispatch stage: with a policy set, callbacks run on a worker
+        # thread behind bounded per-subscription queues instead of on the receive loop
+        self.dispatcher: Optional[Dispatcher] = None
+        if self.config.get("dispatch_policy"):
+            self._ensure_dispatcher()
+
     @property
     @abstractmethod
     def ws_url(self) -> str:
@@ -143,8 +152,7 @@ class OrderBookWebSocket(ABC):
             await self._authenticate()
 
             # Resubscribe to all markets
-            for market_id in list(self.subscriptions.keys()):
-                await self._subscribe_orderbook(market_id)
+            await self._resubscribe()
 
         except Exception as e:
             self.state = WebSocketState.DISCONNECTED
@@ -166,6 +174,9 @@ class OrderBookWebSocket(ABC):
             task.cancel()
         self.tasks.clear()
 
+        if self.dispatcher is not None:
+            self.dispatcher.close()
+
         if self.verbose:
             logger.debug("WebSocket disconnected")
 
@@ -206,6 +217,39 @@ class OrderBookWebSocket(ABC):
             if self.verbose:
                 logger.debug(f"Error handling message: {e}")
 
+    def _ensure_dispatcher(self) -> Dispatcher:
+        if self.dispatcher is None:
+            self.dispatcher = Dispatcher(
+                maxsize=self.config.get("dispatch_queue_size", 1000),
+                policy=self.config.get("dispatch_policy") or OverflowPolicy.DROP_OLDEST,
+                metrics=self.config.get("metrics")
+                or getattr(getattr(self, "exchange", None), "metrics", None),
+                stream=type(self).__name__,
+            )
+        return self.dispatcher
+
+    def set_overflow_policy(
+        self, market_id: str, policy: OverflowPolicy | str, maxsize: Optional[int] = None
+    ) -> None:
+        """
+        Queue a subscription's callbacks off the receive loop with its own overflow policy.
+
+        Args:
+            market_id: Subscription key
+            policy: "drop_oldest", "conflate" or "block"
+            maxsize: Queue bound (default: ``dispatch_queue_size`` config)
+        """
+        self._ensure_dispatcher().configure(market_id, policy, maxsize)
+
+    async def _deliver(self, market_id: str, callback: Callable, *args) -> None:
+        """Call a subscription callback, or enqueue it when a dispatcher is configured"""
+        if self.dispatcher is not None:
+            await self.dispatcher.put(market_id, market_id, callback, *args)
+        elif asyncio.iscoroutinefunction(callback):
+            await callback(*args)
+        else:
+            callback(*args)
+
     async def _process_message_item(self, data: dict):
         """Process a single message item"""
         try:
@@ -216,13 +260,7 @@ class OrderBookWebSocket(ABC):
 
             market_id = orderbook.get("market_id")
             if market_id in self.subscriptions:
-                callback = self.subscriptions[market_id]
-
-                # Call callback in a non-blocking way
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(market_id, orderbook)
-                else:
-                    callback(market_id, orderbook)
+                await self._deliver(market_id, self.subscriptions[market_id], market_id, orderbook)
         except Exception as e:
             if self.verbose:
                 logger.debug(f"Error processing message item: {e}")
@@ -310,10 +348,31 @@ class OrderBookWebSocket(ABC):
             if self.verbose:
                 logger.debug("✓ Reconnected successfully")
 
+            await self._on_reconnect()
+
         except Exception as e:
             if self.verbose:
                 logger.debug(f"Reconnection failed: {e}")
 
+    async def _resubscribe(self):
+        """
+        Replay every subscription on a fresh connection.
+
+        Subclasses whose protocol accepts many markets per message should
+        override this to batch them.
+        """
+        for market_id in list(self.subscriptions.keys()):
+            await self._subscribe_orderbook(market_id)
+
+    async def _on_reconnect(self):
+        """
+        Hook run after a successful reconnect.
+
+        Updates sent while disconnected are lost, so subclasses that keep
+        incremental state should mark it stale and resync here.
+        """
+        pass
+
     async def watch_orderbook(self, market_id: str, callback: Callable):
         """
         Subscribe to orderbook updates for a market.
@@ -348,6 +407,8 @@ class OrderBookWebSocket(ABC):
 
         # Remove subscription
         del self.subscriptions[market_id]
+        if self.dispatcher is not None:
+            self.dispatcher.remove(market_id)
 
         # Unsubscribe from orderbook
         if self.state == WebSocketState.CONNECTED:
@@ -359,24 +420,192 @@ class OrderBookWebSocket(ABC):
     def start(self):
         """
         Start WebSocket connection and message loop.
-        Non-blocking - runs in background.
+        Non-blocking - runs on the shared WebSocketRuntime loop
+        (``config["runtime"]`` or the process-wide default).
+
+        Returns:
+            The runtime's loop thread
         """
-        if self.loop is None:
-            self.loop = asyncio.new_event_loop()
+        runtime = self.config.get("runtime") or WebSocketRuntime.default()
+        self.loop = runtime.loop
 
         async def _start():
             await self.connect()
             await self._receive_loop()
 
-        def _run_loop():
-            asyncio.set_event_loop(self.loop)
-            self.loop.run_until_complete(_start())
-
-        thread = threading.Thread(target=_run_loop, daemon=True)
-        thread.start()
-        return thread
+        self._run_future = runtime.submit(_start())
+        return runtime.thread
 
     def stop(self):
         """Stop WebSocket connection"""
-        if self.loop:
+        if self.loop and not self.loop.is_closed():
             asyncio.run_coroutine_threadsafe(self.disconnect(), self.loop)
+
+
+class WebSocketPool:
+    """
+    Shards market subscriptions across several WebSocket connections.
+
+    Each shard is an ``OrderBookWebSocket`` built by ``factory`` holding at
+    most ``max_per_connection`` markets. Shards are opened on demand, run
+    their own receive loop and reconnect independently, so one dropped
+    connection does not disturb the others. ``sync`` applies markets
+    opening and closing and then packs the survivors onto as few
+    connections as they fit in.
+
+    Example:
+        >>> pool = WebSocketPool(PolymarketWebSocket, max_per_connection=500)
+        >>> await pool.sync({asset_id: on_book for asset_id in asset_ids})
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], OrderBookWebSocket],
+        max_per_connection: int = 500,
+        verbose: bool = False,
+    ):
+        """
+        Initialize pool.
+
+        Args:
+            factory: Function returning a new, unconnected shard
+            max_per_connection: Maximum markets subscribed on one connection
+            verbose: Log shard opens, closes and migrations
+        """
+        self.factory = factory
+        self.max_per_connection = max(1, max_per_connection)
+        self.verbose = verbose
+        self.shards: List[OrderBookWebSocket] = []
+        self._assignment: Dict[str, OrderBookWebSocket] = {}
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._assignment)
+
+    def __contains__(self, market_id: str) -> bool:
+        return market_id in self._assignment
+
+    def shard_for(self, market_id: str) -> Optional[OrderBookWebSocket]:
+        """Connection a market is subscribed on (None if not subscribed)."""
+        return self._assignment.get(market_id)
+
+    @property
+    def loads(self) -> List[int]:
+        """Markets subscribed on each shard."""
+        return [len(shard.subscriptions) for shard in self.shards]
+
+    async def _open_shard(self) -> OrderBookWebSocket:
+        shard = self.factory()
+        shard.loop = asyncio.get_running_loop()
+        try:
+            await shard.connect()
+        except Exception as e:
+            # The receive loop keeps retrying with backoff
+            logger.warning(f"WebSocket shard failed to connect: {e}")
+        shard.tasks.append(shard.loop.create_task(shard._receive_loop()))
+        self.shards.append(shard)
+        if self.verbose:
+            logger.debug(f"Opened WebSocket shard #{len(self.shards)}")
+        return shard
+
+    async def _close_shard(self, shard: OrderBookWebSocket) -> None:
+        self.shards.remove(shard)
+        await shard.disconnect()
+        if self.verbose:
+            logger.debug(f"Closed WebSocket shard ({len(self.shards)} left)")
+
+    async def _shard_with_room(self, exclude: Optional[OrderBookWebSocket] = None):
+        """Least-loaded shard below the cap, opening a new one if all are full"""
+        candidates = [
+            shard
+            for shard in self.shards
+            if shard is not exclude and len(shard.subscriptions) < self.max_per_connection
+        ]
+        if candidates:
+            return min(candidates, key=lambda shard: len(shard.subscriptions))
+        return await self._open_shard()
+
+    @staticmethod
+    async def _attach(shard: OrderBookWebSocket, market_id: str, callback: Callable) -> None:
+        shard.subscriptions[market_id] = callback
+        if shard.state == WebSocketState.CONNECTED:
+            await shard._subscribe_orderbook(market_id)
+        # Otherwise the shard subscribes it when its connection comes back
+
+    async def _watch(self, market_id: str, callback: Callable) -> None:
+        shard = self._assignment.get(market_id)
+        if shard is None:
+            shard = await self._shard_with_room()
+            self._assignment[market_id] = shard
+        await self._attach(shard, market_id, callback)
+
+    async def _unwatch(self, market_id: str) -> None:
+        shard = self._assignment.pop(market_id, None)
+        if shard is None:
+            return
+        await shard.unwatch_orderbook(market_id)
+        if not shard.subscriptions:
+            await self._close_shard(shard)
+
+    async def _rebalance(self) -> None:
+        """Drain the least-loaded shards while the markets fit on fewer connections"""
+        needed = -(-len(self._assignment) // self.max_per_connection)
+        while len(self.shards) > needed:
+            source = min(self.shards, key=lambda shard: len(shard.subscriptions))
+            for market_id, callback in list(source.subscriptions.items()):
+                # Subscribe on the new shard before leaving the old one
+                target = await self._shard_with_room(exclude=source)
+                await self._attach(target, market_id, callback)
+                self._assignment[market_id] = target
+            source.subscriptions.clear()
+            await self._close_shard(source)
+
+    async def watch_orderbook(self, market_id: str, callback: Callable):
+        """
+        Subscribe to orderbook updates on a shard with room.
+
+        Args:
+            market_id: Market identifier
+            callback: Function to call with orderbook updates
+        """
+        async with self._lock:
+            await self._watch(market_id, callback)
+
+    async def unwatch_orderbook(self, market_id: str):
+        """
+        Unsubscribe a market, closing its shard if it was the last one.
+
+        Args:
+            market_id: Market identifier
+        """
+        async with self._lock:
+            await self._unwatch(market_id)
+
+    async def sync(self, desired: Dict[str, Callable]):
+        """
+        Make the pool's subscriptions match ``desired``.
+
+        Markets no longer desired (e.g. closed) are unsubscribed, new ones
+        are added, and the remaining markets are repacked onto
+        ``ceil(len(desired) / max_per_connection)`` connections.
+
+        Args:
+            desired: Market identifier -> callback for every market to watch
+        """
+        async with self._lock:
+            for market_id in [m for m in self._assignment if m not in desired]:
+                await self._unwatch(market_id)
+            for market_id, callback in desired.items():
+                shard = self._assignment.get(market_id)
+                if shard is None:
+                    await self._watch(market_id, callback)
+                else:
+                    shard.subscriptions[market_id] = callback
+            await self._rebalance()
+
+    async def disconnect(self):
+        """Close every shard."""
+        async with self._lock:
+            for shard in list(self.shards):
+                await self._close_shard(shard)
+            self._assignment.clear()
@@ -0,0 +1,161 @@
+"""
+Process-wide event loop for WebSocket connections.
+
+Every ``start()`` used to create its own event loop and thread, so a process
+running many strategies carried dozens of idle loops. ``WebSocketRuntime``
+runs one loop on one daemon thread; market and user sockets of every
+exchange are scheduled onto it, and other threads talk to them through the
+thread-safe ``submit``/``run``/``call_soon`` helpers.
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class WebSocketRuntime:
+    """
+    One event loop thread hosting WebSocket tasks.
+
+    Example:
+        >>> runtime = WebSocketRuntime.default()
+        >>> future = runtime.submit(ws.watch_orderbook(token_id, on_book))
+        >>> runtime.run(ws.unwatch_orderbook(token_id), timeout=5)
+    """
+
+    _default: Optional["WebSocketRuntime"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, name: str = "dr-manhattan-ws"):
+        """
+        Initialize runtime (the loop thread starts on first use).
+
+        Args:
+            name: Name of the loop thread
+        """
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls) -> "WebSocketRuntime":
+        """Runtime shared by every WebSocket in the process."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+                atexit.register(cls._default.stop)
+            return cls._default
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The runtime's event loop, started if needed."""
+        self.start()
+        return self._loop
+
+    @property
+    def thread(self) -> threading.Thread:
+        """The thread running the loop, started if needed."""
+        self.start()
+        return self._thread
+
+    @property
+    def running(self) -> bool:
+        """Whether the loop thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def in_loop_thread(self) -> bool:
+        """Whether the caller runs on the runtime's loop thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def start(self) -> None:
+        """Start the loop thread (no-op if already running)."""
+        with self._lock:
+            if self.running:
+                return
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                try:
+                    loop.run_forever()
+                finally:
+                    loop.close()
+
+            self._loop = loop
+            self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+            self._thread.start()
+            ready.wait()
+
+    def submit(self, coro: Awaitable[Any]) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine on the runtime loop from any thread.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Future with the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the runtime loop and wait for its result.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            RuntimeError: If called from the loop thread (it would deadlock)
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("WebSocketRuntime.run() called from its own loop; await instead")
+        return self.submit(coro).result(timeout)
+
+    def call_soon(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Call a function on the loop thread."""
+        self.loop.call_soon_threadsafe(callback, *args)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Cancel every task on the loop, stop it and join its thread.
+
+        The runtime can be started again afterwards.
+
+        Args:
+            timeout: Seconds to wait for tasks to finish cancelling
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if thread is None or not thread.is_alive():
+                return
+
+            async def cancel_all():
+                tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+            if thread is not threading.current_thread():
+                try:
+                    asyncio.run_coroutine_threadsafe(cancel_all(), loop).result(timeout)
+                except Exception as e:
+                    logger.debug(f"WebSocket runtime shutdown: {e}")
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+            self._loop = None
+            self._thread = None
@@ -1,11 +1,17 @@
 from .limitless import Limitless
+from .limitless_async import AsyncLimitless
 from .opinion import Opinion
 from .polymarket import Polymarket
+from .polymarket_async import AsyncPolymarket
 from .predictfun import PredictFun
+from .predictfun_async import AsyncPredictFun
 
 __all__ = [
     "Polymarket",
     "Limitless",
     "Opinion",
     "PredictFun",
+    "AsyncPolymarket",
+    "AsyncLimitless",
+    "AsyncPredictFun",
 ]
@@ -24,9 +24,12 @@ from ..base.errors import (
     RateLimitError,
 )
 from ..base.exchange import Exchange
+from ..base.rate_limiter import parse_retry_after
 from ..models.market import Market
 from ..models.order import Order, OrderSide, OrderStatus
+from ..models.orderbook import complement_levels
 from ..models.position import Position
+from .limitless_async import AsyncLimitless
 from .limitless_ws import (
     LimitlessUserWebSocket,
     LimitlessWebSocket,
@@ -123,7 +126,7 @@ class Limitless(Exchange):
         self.host = self.config.get("host", self.BASE_URL)
         self.chain_id = self.config.get("chain_id", self.CHAIN_ID)
 
-        self._session = requests.Session()
+        self._session = self._http
         self._account = None
         self._address = None
         self._authenticated = False
@@ -240,8 +243,10 @@ class Limitless(Exchange):
                 )
 
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 1))
-                    raise RateLimitError(f"Rate limited. Retry after {retry_after}s")
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    raise RateLimitError(
+                        f"Rate limited. Retry after {retry_after}s", retry_after=retry_after
+                    )
 
                 if response.status_code == 401 or response.status_code == 403:
                     # Try to re-authenticate
@@ -326,20 +331,20 @@ class Limitless(Exchange):
 
     def _fetch_all_markets(self, params: Dict[str, Any]) -> List[Market]:
         """Fetch all markets with automatic pagination."""
-        all_markets: List[Market] = []
-        page = 1
-        max_pages = 100
+        base_params = {k: v for k, v in params.items() if k != "all"}
 
-        while page <= max_pages:
-            page_params = {**params, "page": page, "limit": 25}
-            page_params.pop("all", None)
-            batch = self.fetch_markets(page_params)
-            if not batch:
-                break
-            all_markets.extend(batch)
-            page += 1
+        def _fetch_page(page: int, limit: int) -> List[Market]:
+            return self.fetch_markets({**base_params, "page": page, "limit": limit})
 
-        return all_markets
+        # Pages are filtered client-side, so only an empty page marks the end
+        return self._paginate(
+            _fetch_page,
+            initial_offset=1,
+            page_size=25,
+            page_numbers=True,
+            stop_on_short_page=False,
+            max_pages=100,
+        ).collect()
 
     def fetch_market(self, market_id: str) -> Market:
         """
@@ -557,61 +562,61 @@ class Limitless(Exchange):
 
         try:
             response = self._request("GET", f"/markets/{slug}/orderbook")
-
-            bids = []
-            asks = []
-
-            orders = response.get("orders", response.get("data", []))
-            for order in orders:
-                side = order.get("side", "").lower()
-                price = float(order.get("price", 0) or 0)
-                size = float(order.get("size", 0) or 0)
-
-                if price > 0 and size > 0:
-                    entry = {"price": str(price), "size": str(size)}
-                    if side == "buy":
-                        bids.append(entry)
-                    else:
-                        asks.append(entry)
-
-            # Also check for pre-sorted bids/asks
-            if "bids" in response:
-                for bid in response["bids"]:
-                    bids.append(
-                        {"price": str(bid.get("price", 0)), "size": str(bid.get("size", 0))}
-                    )
-            if "asks" in response:
-                for ask in response["asks"]:
-                    asks.append(
-                        {"price": str(ask.get("price", 0)), "size": str(ask.get("size", 0))}
-                    )
-
-            # Sort: bids descending, asks ascending
-            bids.sort(key=lambda x: float(x["price"]), reverse=True)
-            asks.sort(key=lambda x: float(x["price"]))
-
-            # For No token, invert the orderbook
-            # No bids (buy No) = 1 - Yes asks
-            # No asks (sell No) = 1 - Yes bids
-            if is_no_token:
-                inverted_bids = [
-                    {"price": str(round(1 - float(a["price"]), 3)), "size": a["size"]} for a in asks
-                ]
-                inverted_asks = [
-                    {"price": str(round(1 - float(b["price"]), 3)), "size": b["size"]} for b in bids
-                ]
-                # Re-sort after inversion
-                inverted_bids.sort(key=lambda x: float(x["price"]), reverse=True)
-                inverted_asks.sort(key=lambda x: float(x["price"]))
-                return {"bids": inverted_bids, "asks": inverted_asks}
-
-            return {"bids": bids, "asks": asks}
+            return self._parse_orderbook_response(response, is_no_token)
 
         except Exception as e:
             if self.verbose:
                 print(f"Failed to fetch orderbook: {e}")
             return {"bids": [], "asks": []}
 
+    @staticmethod
+    def _parse_orderbook_response(response: Dict[str, Any], is_no_token: bool) -> Dict[str, Any]:
+        """
+        Normalize a /markets/{slug}/orderbook response.
+
+        Args:
+            response: Raw API response
+            is_no_token: Invert the Yes book into the No book
+
+        Returns:
+            Dictionary with sorted 'bids' and 'asks' arrays
+        """
+        bids = []
+        asks = []
+
+        orders = response.get("orders", response.get("data", []))
+        for order in orders:
+            side = order.get("side", "").lower()
+            price = float(order.get("price", 0) or 0)
+            size = float(order.get("size", 0) or 0)
+
+            if price > 0 and size > 0:
+                entry = {"price": str(price), "size": str(size)}
+                if side == "buy":
+                    bids.append(entry)
+                else:
+                    asks.append(entry)
+
+        # Also check for pre-sorted bids/asks
+        if "bids" in response:
+            for bid in response["bids"]:
+                bids.append({"price": str(bid.get("price", 0)), "size": str(bid.get("size", 0))})
+        if "asks" in response:
+            for ask in response["asks"]:
+                asks.append({"price": str(ask.get("price", 0)), "size": str(ask.get("size", 0))})
+
+        # Sort: bids descending, asks ascending
+        bids.sort(key=lambda x: float(x["price"]), reverse=True)
+        asks.sort(key=lambda x: float(x["price"]))
+
+        # For No token, map the Yes book (inversion reverses order, no re-sort)
+        # No bids (buy No) = 1 - Yes asks
+        # No asks (sell No) = 1 - Yes bids
+        if is_no_token:
+            return {"bids": complement_levels(asks), "asks": complement_levels(bids)}
+
+        return {"bids": bids, "asks": asks}
+
     def fetch_token_ids(self, market_id: str) -> List[str]:
         """
         Fetch token IDs for a specific market.
@@ -1269,7 +1274,7 @@ class Limitless(Exchange):
                 "id": 1,
             }
 
-            response = requests.post(base_rpc, json=payload, timeout=10)
+            response = self._http.post(base_rpc, json=payload, timeout=10)
             result = response.json().get("result", "0x0")
 
             # Convert from hex to int, then to USDC (6 decimals)
@@ -1373,8 +1378,8 @@ class Limitless(Exchange):
             page: Page number
             category_id: Filter by category
             sort_by: Sort field
-            query: Text search query
-            keywords: Required keywords
+            query: Words that must all appear (matched as word prefixes)
+            keywords: Additional required words
             binary: If True, only binary markets
             min_liquidity: Minimum liquidity
             predicate: Custom filter function
@@ -1388,7 +1393,6 @@ class Limitless(Exchange):
         def _lower_list(values: Optional[Sequence[str]]) -> List[str]:
             return [v.lower() for v in values] if values else []
 
-        query_lower = query.lower() if query else None
         keyword_lowers = _lower_list(keywords)
 
         # Fetch markets
@@ -1408,12 +1412,10 @@ class Limitless(Exchange):
                 continue
             if m.liquidity < min_liquidity:
                 continue
-            if query_lower or keyword_lowers:
-                text = self._build_search_text(m)
-                if query_lower and query_lower not in text:
-                    continue
-                if any(k not in text for k in keyword_lowers):
-                    continue
+            if (query or keyword_lowers) and not self.search_index.matches(
+                m, query, keywords=keyword_lowers
+            ):
+                continue
             if predicate and not predicate(m):
                 continue
             filtered.append(m)
@@ -1454,8 +1456,8 @@ class Limitless(Exchange):
             market: Market object or slug
             outcome: Outcome index or name (default: first outcome)
             interval: Time interval
-            start_from: Start timestamp (optional)
-            end_to: End timestamp (optional)
+            start_from: Start timestamp in epoch seconds (optional; required for caching)
+            end_to: End timestamp in epoch seconds (optional)
             as_dataframe: Return as pandas DataFrame
 
         Returns:
@@ -1468,20 +1470,30 @@ class Limitless(Exchange):
 
         market_obj = self._ensure_market(market)
 
-        params = {"interval": interval}
-        if start_from:
-            params["from"] = start_from
-        if end_to:
-            params["to"] = end_to
-
         @self._retry_on_failure
-        def _fetch() -> List[Dict[str, Any]]:
+        def _fetch(start: Optional[int], end: Optional[int]) -> List[Dict[str, Any]]:
+            params = {"interval": interval}
+            if start:
+                params["from"] = start
+            if end:
+                params["to"] = end
             response = self._request(
                 "GET", f"/markets/{market_obj.id}/historical-price", params=params
             )
             return response.get("data", response if isinstance(response, list) else [])
 
-        history = _fetch()
+        if self.price_history_cache is not None and start_from:
+            # Only absolute windows can be cached; without start_from the API picks the range
+            history = self._cached_price_history(
+                market_obj,
+                market_obj.id,
+                start_from,
+                end_to or int(time.time()),
+                _fetch,
+                interval=interval,
+            )
+        else:
+            history = _fetch(start_from, end_to)
         points = self._parse_history(history)
 
         if as_dataframe:
@@ -1646,8 +1658,21 @@ class Limitless(Exchange):
                 "get_websocket": True,
                 "get_user_websocket": True,
             },
+            "resilience": self.resilience_stats(),
         }
 
+    def to_async(self) -> AsyncLimitless:
+        """
+        Get the native asyncio counterpart of this exchange.
+
+        Markets and orderbooks are fetched natively over aiohttp; authenticated
+        calls run in a worker thread.
+
+        Returns:
+            AsyncLimitless sharing this instance's config and caches
+        """
+        return AsyncLimitless(self)
+
     def get_websocket(self) -> LimitlessWebSocket:
         """
         Get WebSocket instance for real-time market data.
@@ -0,0 +1,104 @@
+"""
+Async Limitless exchange.
+
+Native asyncio implementation of the Limitless public read paths (markets
+and orderbooks) on the pooled aiohttp transport. Authenticated calls reuse
+the sync session cookie flow in a worker thread.
+"""
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ..base.async_exchange import AsyncExchange
+from ..base.errors import ExchangeError, MarketNotFound
+from ..models.market import Market
+
+if TYPE_CHECKING:
+    from .limitless import Limitless
+
+
+class AsyncLimitless(AsyncExchange):
+    """Async Limitless exchange sharing state with a sync Limitless instance"""
+
+    exchange: "Limitless"
+
+    async def _api_request(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        return await self._request_json(
+            "GET", f"{self.exchange.host}{endpoint}", params=params, endpoint=endpoint
+        )
+
+    async def fetch_markets(self, params: Optional[Dict[str, Any]] = None) -> List[Market]:
+        """
+        Fetch active markets from Limitless.
+
+        Supports the same params as Limitless.fetch_markets, including
+        ``all`` for automatic pagination.
+        """
+        query_params = params or {}
+
+        if query_params.get("all"):
+            return await self._fetch_all_markets(query_params)
+
+        page = query_params.get("page", 1)
+        limit = min(query_params.get("limit", 25), 25)  # API max is 25
+        response = await self._api_request(
+            "/markets/active", params={"page": page, "limit": limit, **query_params}
+        )
+
+        markets_data = response.get("data", response) if isinstance(response, dict) else response
+        markets = [self.exchange._parse_market(m) for m in markets_data or []]
+
+        if query_params.get("active") or (not query_params.get("closed", True)):
+            markets = [m for m in markets if m.is_open]
+
+        return markets
+
+    async def _fetch_all_markets(self, params: Dict[str, Any]) -> List[Market]:
+        """
+        Fetch all markets with automatic pagination.
+
+        Mirrors Limitless._fetch_all_markets: up to 100 pages of 25, requested
+        ``pagination_window`` pages at a time with asyncio.gather, stopping at
+        the first empty page (pages are filtered client-side, so a short page
+        does not mark the end).
+        """
+        base_params = {k: v for k, v in params.items() if k != "all"}
+        window = max(1, self.exchange.pagination_window)
+        all_markets: List[Market] = []
+
+        for first_page in range(1, 101, window):
+            pages = range(first_page, min(first_page + window, 101))
+            batches = await asyncio.gather(
+                *(self.fetch_markets({**base_params, "page": page, "limit": 25}) for page in pages)
+            )
+            for batch in batches:
+                if not batch:
+                    return all_markets
+                all_markets.extend(batch)
+        return all_markets
+
+    async def fetch_market(self, market_id: str) -> Market:
+        """Fetch a specific market by slug or address"""
+        try:
+            data = await self._api_request(f"/markets/{market_id}")
+        except ExchangeError:
+            raise MarketNotFound(f"Market {market_id} not found")
+        return self.exchange._parse_market(data)
+
+    async def get_orderbook(self, market_slug_or_token_id: str) -> Dict[str, Any]:
+        """
+        Fetch orderbook for a market slug or token ID.
+
+        No tokens are served from the inverted Yes book, as in
+        Limitless.get_orderbook.
+        """
+        is_no_token = market_slug_or_token_id in self.exchange._no_tokens
+        slug = self.exchange._token_to_slug.get(market_slug_or_token_id, market_slug_or_token_id)
+
+        try:
+            response = await self._api_request(f"/markets/{slug}/orderbook")
+            return self.exchange._parse_orderbook_response(response, is_no_token)
+        except Exception as e:
+            if self.verbose:
+                print(f"Failed to fetch orderbook: {e}")
+            return {"bids": [], "asks": []}
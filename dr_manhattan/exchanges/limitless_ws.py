@@ -6,6 +6,7 @@ Documentation: https://api.limitless.exchange/api-v1
 """
 
 import asyncio
+import concurrent.futures
 import logging
 import threading
 from dataclasses import dataclass
@@ -15,7 +16,9 @@ from typing import Any, Callable, Dict, List, Optional
 
 import socketio
 
-from ..models.orderbook import OrderbookManager
+from ..base.dispatch import Dispatcher, OverflowPolicy
+from ..base.ws_runtime import WebSocketRuntime
+from ..models.orderbook import ArrayOrderbook, BookSubscription, OrderbookManager
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +40,15 @@ class OrderbookUpdate:
     asks: List[tuple]  # [(price, size), ...]
     timestamp: datetime
 
+    def to_arrays(self) -> ArrayOrderbook:
+        """Array-backed book for depth queries (empty levels are dropped)"""
+        return ArrayOrderbook.from_levels(
+            self.bids,
+            self.asks,
+            timestamp=int(self.timestamp.timestamp() * 1000),
+            market_id=self.slug,
+        )
+
 
 @dataclass
 class PriceUpdate:
@@ -128,9 +140,16 @@ class LimitlessWebSocket:
         self._position_callbacks: List[Callable[[PositionUpdate], None]] = []
         self._error_callbacks: List[Callable[[str], None]] = []
 
+        # Optional dispatch stage: with a policy set, each registered callback
+        # gets a bounded queue drained off the Socket.IO event loop
+        self.dispatcher: Optional[Dispatcher] = None
+        if self.config.get("dispatch_policy"):
+            self._ensure_dispatcher()
+
         # Event loop (public for compatibility with exchange_client)
         self.loop: Optional[asyncio.AbstractEventLoop] = None
         self._thread: Optional[threading.Thread] = None
+        self._run_future: Optional[concurrent.futures.Future] = None
         self._ready = threading.Event()  # Signals when connection is ready
 
         # Orderbook manager for compatibility with exchange_client
@@ -139,6 +158,9 @@ class LimitlessWebSocket:
         # Token ID to slug mapping for watch_orderbook_by_market
         self._token_to_slug: Dict[str, str] = {}
 
+        # Conflating manager subscriptions per market slug
+        self.book_subscriptions: Dict[str, BookSubscription] = {}
+
         # Register event handlers
         self._setup_handlers()
 
@@ -167,10 +189,7 @@ class LimitlessWebSocket:
                 if update:
                     for callback in self._orderbook_callbacks:
                         try:
-                            if asyncio.iscoroutinefunction(callback):
-                                await callback(update)
-                            else:
-                                callback(update)
+                            await self._deliver(callback, update.slug, update)
                         except Exception as e:
                             if self.verbose:
                                 logger.error(f"Orderbook callback error: {e}")
@@ -185,10 +204,7 @@ class LimitlessWebSocket:
                 if update:
                     for callback in self._price_callbacks:
                         try:
-                            if asyncio.iscoroutinefunction(callback):
-                                await callback(update)
-                            else:
-                                callback(update)
+                            await self._deliver(callback, update.market_address, update)
                         except Exception as e:
                             if self.verbose:
                                 logger.error(f"Price callback error: {e}")
@@ -203,10 +219,7 @@ class LimitlessWebSocket:
                 for update in updates:
                     for callback in self._position_callbacks:
                         try:
-                            if asyncio.iscoroutinefunction(callback):
-                                await callback(update)
-                            else:
-                                callback(update)
+                            await self._deliver(callback, update.token_id, update)
                         except Exception as e:
                             if self.verbose:
                                 logger.error(f"Position callback error: {e}")
@@ -235,6 +248,38 @@ class LimitlessWebSocket:
             if self.verbose:
                 logger.debug(f"System message: {data}")
 
+    def _ensure_dispatcher(self) -> Dispatcher:
+        if self.dispatcher is None:
+            self.dispatcher = Dispatcher(
+                maxsize=self.config.get("dispatch_queue_size", 1000),
+                policy=self.config.get("dispatch_policy") or OverflowPolicy.DROP_OLDEST,
+                metrics=self.config.get("metrics"),
+                stream=type(self).__name__,
+            )
+        return self.dispatcher
+
+    def set_overflow_policy(
+        self, callback: Callable, policy: OverflowPolicy | str, maxsize: Optional[int] = None
+    ) -> None:
+        """
+        Queue a registered callback off the event loop with its own overflow policy.
+
+        Args:
+            callback: Callback passed to on_orderbook/on_price/on_position
+            policy: "drop_oldest", "conflate" (per market) or "block"
+            maxsize: Queue bound (default: ``dispatch_queue_size`` config)
+        """
+        self._ensure_dispatcher().configure(callback, policy, maxsize)
+
+    async def _deliver(self, callback: Callable, key: str, update: Any) -> None:
+        """Call a registered callback, or enqueue it (conflating by ``key``) when dispatching"""
+        if self.dispatcher is not None:
+            await self.dispatcher.put(callback, key, callback, update)
+        elif asyncio.iscoroutinefunction(callback):
+            await callback(update)
+        else:
+            callback(update)
+
     def _parse_orderbook_update(self, data: Dict[str, Any]) -> Optional[OrderbookUpdate]:
         """Parse orderbook update from WebSocket"""
         try:
@@ -395,6 +440,11 @@ class LimitlessWebSocket:
         self.state = WebSocketState.CLOSED
         if self.sio.connected:
             await self.sio.disconnect()
+        if self.dispatcher is not None:
+            self.dispatcher.close()
+        for subscription in self.book_subscriptions.values():
+            subscription.close()
+        self.book_subscriptions.clear()
 
     async def close(self):
         """Alias for disconnect"""
@@ -469,38 +519,34 @@ class LimitlessWebSocket:
 
     def start(self, timeout: float = 5.0) -> threading.Thread:
         """
-        Start WebSocket connection in background thread.
+        Start WebSocket connection on the shared WebSocketRuntime loop
+        (``config["runtime"]`` or the process-wide default).
 
         Args:
             timeout: Seconds to wait for connection to establish
 
         Returns:
-            Background thread running the WebSocket
+            The runtime's loop thread
 
         Raises:
             ConnectionError: If connection is not established within timeout
         """
-        self.loop = asyncio.new_event_loop()
+        runtime = self.config.get("runtime") or WebSocketRuntime.default()
+        self.loop = runtime.loop
         self._ready.clear()
 
         async def _run():
-            await self.connect()
-            # Keep running until disconnected
-            while self.state != WebSocketState.CLOSED:
-                await asyncio.sleep(1)
-
-        def _thread_target():
-            asyncio.set_event_loop(self.loop)
             try:
-                self.loop.run_until_complete(_run())
+                await self.connect()
+                # Keep running until disconnected
+                while self.state != WebSocketState.CLOSED:
+                    await asyncio.sleep(1)
             except Exception as e:
                 if self.verbose:
-                    logger.error(f"WebSocket thread error: {e}")
-            finally:
-                self.loop.close()
+                    logger.error(f"WebSocket task error: {e}")
 
-        self._thread = threading.Thread(target=_thread_target, daemon=True)
-        self._thread.start()
+        self._run_future = runtime.submit(_run())
+        self._thread = runtime.thread
 
         # Wait for connection to be ready
         if not self._ready.wait(timeout=timeout):
@@ -518,8 +564,12 @@ class LimitlessWebSocket:
         return self.orderbook_manager
 
     async def watch_orderbook_by_market(
-        self, market_id: str, asset_ids: List[str], callback: Optional[Callable] = None
-    ):
+        self,
+        market_id: str,
+        asset_ids: List[str],
+        callback: Optional[Callable] = None,
+        conflate_ms: Optional[float] = None,
+    ) -> Optional[BookSubscription]:
         """
         Subscribe to orderbook updates for a market.
 
@@ -529,6 +579,12 @@ class LimitlessWebSocket:
             market_id: Market slug
             asset_ids: List of token IDs (used for orderbook_manager keys)
             callback: Optional function to call with orderbook updates
+            conflate_ms: Call ``callback`` from the manager's thread with only
+                the newest book, at most once per this many ms (default:
+                ``conflate_ms`` config; None calls it on every update)
+
+        Returns:
+            The conflating BookSubscription, or None when not conflating
         """
         # Store token_id -> slug mapping
         for asset_id in asset_ids:
@@ -538,11 +594,35 @@ class LimitlessWebSocket:
         yes_token = asset_ids[0] if asset_ids else None
         no_token = asset_ids[1] if len(asset_ids) > 1 else None
 
+        # No token is served as a view over the Yes book:
+        # No bids = 1 - Yes asks, No asks = 1 - Yes bids
+        if yes_token and no_token:
+            self.orderbook_manager.link_complement(no_token, yes_token)
+
+        subscription = None
+        if conflate_ms is None:
+            conflate_ms = self.config.get("conflate_ms")
+        if callback and conflate_ms is not None and yes_token:
+            previous = self.book_subscriptions.pop(market_id, None)
+            if previous is not None:
+                previous.close()
+            user_callback = callback
+
+            def deliver(snapshots):
+                snapshot = snapshots[yes_token]
+                user_callback(market_id, {"bids": list(snapshot.bids), "asks": list(snapshot.asks)})
+
+            subscription = self.orderbook_manager.subscribe(
+                deliver, token_ids=[yes_token], interval_ms=conflate_ms
+            )
+            self.book_subscriptions[market_id] = subscription
+            callback = None
+
         # Create callback that updates orderbook_manager
         def on_orderbook_update(update: OrderbookUpdate):
             ts = int(update.timestamp.timestamp() * 1000)
 
-            # Yes token gets original orderbook
+            # Only the Yes book is stored
             if yes_token:
                 yes_orderbook = {
                     "bids": update.bids,
@@ -552,45 +632,30 @@ class LimitlessWebSocket:
                 }
                 self.orderbook_manager.update(yes_token, yes_orderbook)
 
-            # No token gets inverted orderbook
-            # No bids = 1 - Yes asks, No asks = 1 - Yes bids
-            if no_token:
-                no_bids = [(round(1 - price, 3), size) for price, size in update.asks]
-                no_asks = [(round(1 - price, 3), size) for price, size in update.bids]
-                # Re-sort after inversion
-                no_bids.sort(reverse=True)
-                no_asks.sort()
-                no_orderbook = {
-                    "bids": no_bids,
-                    "asks": no_asks,
-                    "timestamp": ts,
-                    "market_id": update.slug,
-                }
-                self.orderbook_manager.update(no_token, no_orderbook)
-
             if callback:
                 callback(market_id, {"bids": update.bids, "asks": update.asks})
 
         self.on_orderbook(on_orderbook_update)
         await self.subscribe_market(market_id)
+        return subscription
 
     def stop(self, timeout: float = 5.0):
         """
         Stop WebSocket connection and wait for cleanup.
 
         Args:
-            timeout: Seconds to wait for disconnect and thread cleanup
+            timeout: Seconds to wait for disconnect and task cleanup
         """
-        if self.loop and self.sio.connected:
+        if self.loop and not self.loop.is_closed():
             future = asyncio.run_coroutine_threadsafe(self.disconnect(), self.loop)
             try:
                 future.result(timeout=timeout)
+                # The runtime thread is shared, so wait for this socket's task only
+                if self._run_future is not None:
+                    self._run_future.result(timeout=timeout)
             except Exception:
                 pass  # Ignore timeout/errors during shutdown
 
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=timeout)
-
     @property
     def connected(self) -> bool:
         """Check if connected"""
@@ -1,4 +1,5 @@
 import json
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Sequence
@@ -19,6 +20,7 @@ from ..base.errors import (
     RateLimitError,
 )
 from ..base.exchange import Exchange
+from ..base.rate_limiter import parse_retry_after
 from ..models.market import Market
 from ..models.order import Order, OrderSide, OrderStatus
 from ..models.position import Position
@@ -149,13 +151,15 @@ class Opinion(Exchange):
                 headers["X-API-Key"] = self.api_key
 
             try:
-                response = requests.request(
+                response = self._http.request(
                     method, url, params=params, headers=headers, timeout=self.timeout
                 )
 
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 1))
-                    raise RateLimitError(f"Rate limited. Retry after {retry_after}s")
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    raise RateLimitError(
+                        f"Rate limited. Retry after {retry_after}s", retry_after=retry_after
+                    )
 
                 response.raise_for_status()
                 return response.json()
@@ -416,20 +420,20 @@ class Opinion(Exchange):
 
     def _fetch_all_markets(self, params: Dict[str, Any]) -> List[Market]:
         """Fetch all markets with automatic pagination."""
-        all_markets: List[Market] = []
-        page = 1
-        max_pages = 100
+        base_params = {k: v for k, v in params.items() if k != "all"}
 
-        while page <= max_pages:
-            page_params = {**params, "page": page, "limit": 20}
-            page_params.pop("all", None)
-            batch = self.fetch_markets(page_params)
-            if not batch:
-                break
-            all_markets.extend(batch)
-            page += 1
+        def _fetch_page(page: int, limit: int) -> List[Market]:
+            return self.fetch_markets({**base_params, "page": page, "limit": limit})
 
-        return all_markets
+        # The API may cap page sizes, so only an empty page marks the end
+        return self._paginate(
+            _fetch_page,
+            initial_offset=1,
+            page_size=20,
+            page_numbers=True,
+            stop_on_short_page=False,
+            max_pages=100,
+        ).collect()
 
     def fetch_market(self, market_id: str) -> Market:
         """
@@ -1204,8 +1208,8 @@ class Opinion(Exchange):
             market: Market object or ID
             outcome: Outcome index or name (default: first outcome)
             interval: Time interval (1m, 1h, 1d, 1w, max)
-            start_at: Start timestamp (optional)
-            end_at: End timestamp (optional)
+            start_at: Start timestamp in epoch seconds (optional; required for caching)
+            end_at: End timestamp in epoch seconds (optional)
             as_dataframe: Return as pandas DataFrame
 
         Returns:
@@ -1222,12 +1226,12 @@ class Opinion(Exchange):
         token_id = self._lookup_token_id(market_obj, outcome)
 
         @self._retry_on_failure
-        def _fetch() -> List[Any]:
+        def _fetch(start: Optional[int], end: Optional[int]) -> List[Any]:
             response = self._client.get_price_history(
                 token_id=token_id,
                 interval=interval,
-                start_at=start_at,
-                end_at=end_at,
+                start_at=start,
+                end_at=end,
             )
 
             if hasattr(response, "errno") and response.errno != 0:
@@ -1239,7 +1243,18 @@ class Opinion(Exchange):
 
             return getattr(result, "list", []) or getattr(result, "data", []) or []
 
-        history = _fetch()
+        if self.price_history_cache is not None and start_at:
+            # Only absolute windows can be cached; without start_at the API picks the range
+            history = self._cached_price_history(
+                market_obj,
+                token_id,
+                start_at,
+                end_at or int(time.time()),
+                _fetch,
+                interval=interval,
+            )
+        else:
+            history = _fetch(start_at, end_at)
         points = self._parse_history(history)
 
         if as_dataframe:
@@ -1310,8 +1325,8 @@ class Opinion(Exchange):
             page: Page number
             topic_type: TopicType filter
             status: TopicStatusFilter
-            query: Text search query
-            keywords: Required keywords
+            query: Words that must all appear (matched as word prefixes)
+            keywords: Additional required words
             binary: If True, only binary markets
             min_liquidity: Minimum liquidity
             categories: Filter by categories
@@ -1329,7 +1344,6 @@ class Opinion(Exchange):
         def _lower_list(values: Sequence[str] | None) -> List[str]:
             return [v.lower() for v in values] if values else []
 
-        query_lower = query.lower() if query else None
         keyword_lowers = _lower_list(keywords)
         category_lowers = _lower_list(categories)
         outcome_lowers = _lower_list(outcomes)
@@ -1356,16 +1370,10 @@ class Opinion(Exchange):
                 outs = [o.lower() for o in m.outcomes]
                 if not all(x in outs for x in outcome_lowers):
                     continue
-            if category_lowers:
-                cats = self._extract_categories(m)
-                if not cats or not any(c in cats for c in category_lowers):
-                    continue
-            if query_lower or keyword_lowers:
-                text = self._build_search_text(m)
-                if query_lower and query_lower not in text:
-                    continue
-                if any(k not in text for k in keyword_lowers):
-                    continue
+            if (query or keyword_lowers or category_lowers) and not self.search_index.matches(
+                m, query, keywords=keyword_lowers, categories=category_lowers
+            ):
+                continue
             if predicate and not predicate(m):
                 continue
             filtered.append(m)
@@ -1486,4 +1494,5 @@ class Opinion(Exchange):
                 "merge": True,
                 "redeem": True,
             },
+            "resilience": self.resilience_stats(),
         }
@@ -1,12 +1,16 @@
 import json
 import logging
 import re
+import threading
+import time
 import traceback
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Optional, Sequence
+from urllib.parse import urlparse
 
 import pandas as pd
+import pyarrow as pa
 import requests
 from py_clob_client.client import ClobClient
 from py_clob_client.clob_types import AssetType, BalanceAllowanceParams, OrderArgs, OrderType
@@ -20,11 +24,23 @@ from ..base.errors import (
     RateLimitError,
 )
 from ..base.exchange import Exchange
+from ..base.paginator import Paginator
+from ..base.rate_limiter import parse_retry_after
 from ..models import CryptoHourlyMarket
 from ..models.market import Market
 from ..models.order import Order, OrderSide, OrderStatus
+from ..models.orderbook import Orderbook
 from ..models.position import Position
 from ..utils import setup_logger
+from ..utils.columnar import (
+    Column,
+    ColumnarBuilder,
+    to_epoch_seconds,
+    to_float,
+    to_optional_int,
+)
+from .polymarket_async import AsyncPolymarket
+from .polymarket_tokens import END_CURSOR, TokenIndex
 from .polymarket_ws import PolymarketUserWebSocket, PolymarketWebSocket
 
 
@@ -58,6 +74,62 @@ class PricePoint:
     raw: Dict[str, Any]
 
 
+# Columnar layouts for as_arrow / as_dataframe pulls (built straight from JSON rows)
+_UTC_SECONDS = pa.timestamp("s", tz="UTC")
+
+PUBLIC_TRADE_COLUMNS: List[Column] = [
+    Column("timestamp", _UTC_SECONDS, convert=to_epoch_seconds),
+    Column("side", pa.string(), default=""),
+    Column("asset", pa.string(), default=""),
+    Column("condition_id", pa.string(), "conditionId", default=""),
+    Column("size", pa.float64(), convert=to_float),
+    Column("price", pa.float64(), convert=to_float),
+    Column("proxy_wallet", pa.string(), "proxyWallet", default=""),
+    Column("title", pa.string()),
+    Column("slug", pa.string()),
+    Column("event_slug", pa.string(), "eventSlug"),
+    Column("outcome", pa.string()),
+    Column("outcome_index", pa.int64(), "outcomeIndex", convert=to_optional_int),
+    Column("name", pa.string()),
+    Column("pseudonym", pa.string()),
+    Column("bio", pa.string()),
+    Column("profile_image", pa.string(), "profileImage"),
+    Column("profile_image_optimized", pa.string(), "profileImageOptimized"),
+    Column("transaction_hash", pa.string(), "transactionHash"),
+]
+
+PRICE_HISTORY_COLUMNS: List[Column] = [
+    Column("timestamp", _UTC_SECONDS, "t", convert=int),
+    Column("price", pa.float64(), "p", convert=float),
+]
+
+MARKET_COLUMNS: List[Column] = [
+    Column("id", pa.string(), lambda m: m.id),
+    Column("question", pa.string(), lambda m: m.question),
+    Column("outcomes", pa.list_(pa.string()), lambda m: m.outcomes),
+    Column(
+        "outcome_prices",
+        pa.list_(pa.float64()),
+        lambda m: [m.prices.get(o) for o in m.outcomes],
+    ),
+    Column(
+        "token_ids",
+        pa.list_(pa.string()),
+        lambda m: [str(t) for t in m.metadata.get("clobTokenIds") or [] if not isinstance(t, dict)],
+    ),
+    Column(
+        "condition_id",
+        pa.string(),
+        lambda m: m.metadata.get("conditionId") or m.metadata.get("condition_id"),
+    ),
+    Column("slug", pa.string(), lambda m: m.metadata.get("slug")),
+    Column("close_time", pa.timestamp("us", tz="UTC"), lambda m: m.close_time),
+    Column("volume", pa.float64(), lambda m: m.volume),
+    Column("liquidity", pa.float64(), lambda m: m.liquidity),
+    Column("tick_size", pa.float64(), lambda m: m.tick_size),
+]
+
+
 @dataclass
 class Tag:
     id: str
@@ -83,6 +155,30 @@ class Polymarket(Exchange):
     PRICES_HISTORY_URL = f"{CLOB_URL}/prices-history"
     DATA_API_URL = "https://data-api.polymarket.com"
     SUPPORTED_INTERVALS: Sequence[str] = ("1m", "1h", "6h", "1d", "1w", "max")
+    # Seconds covered by each prices-history interval ("1m" is one month; "max" is unbounded)
+    PRICE_HISTORY_LOOKBACK: Dict[str, int] = {
+        "1h": 3600,
+        "6h": 6 * 3600,
+        "1d": 86400,
+        "1w": 7 * 86400,
+        "1m": 30 * 86400,
+    }
+
+    # Max token IDs per POST /books request
+    BOOKS_BATCH_SIZE = 100
+
+    # Order placement/cancellation gets its own budget so market data
+    # polling never starves trading (requests/sec, burst)
+    RATE_LIMITS = {"orders": (5.0, 10.0)}
+
+    # Gamma, CLOB and Data-API each get their own rate budget
+    RATE_LIMIT_PER_REQUEST_HOST = True
+
+    # Gamma markets carry updatedAt, so catalog syncs can be incremental
+    MARKET_UPDATED_AT_KEY = "updatedAt"
+
+    # Maximum Gamma markets listed by one catalog sync
+    CATALOG_SYNC_LIMIT = 50_000
 
     # Market type tags (Polymarket-specific)
     TAG_1H = "102175"  # 1-hour crypto price markets
@@ -94,6 +190,10 @@ class Polymarket(Exchange):
         "SOLANA": "SOL",
     }
 
+    def _rate_limit_key(self) -> str:
+        """Requests without a URL (order placement via the CLOB client) use the CLOB host"""
+        return urlparse(self.CLOB_URL).netloc
+
     @staticmethod
     def normalize_token(token: str) -> str:
         """Normalize token symbol to standard format (e.g., BITCOIN -> BTC)"""
@@ -159,6 +259,10 @@ class Polymarket(Exchange):
         self._clob_client = None
         self._address = None
 
+        # condition_id -> token IDs, optionally persisted between runs
+        self._token_index = TokenIndex(self.config.get("token_index_path"))
+        self._token_sync_lock = threading.Lock()
+
         # Initialize CLOB client if private key is provided
         if self.private_key:
             self._initialize_clob_client()
@@ -202,26 +306,34 @@ class Polymarket(Exchange):
         except Exception as e:
             raise AuthenticationError(f"Failed to initialize CLOB client: {e}")
 
-    def _request(self, method: str, endpoint: str, params: Optional[Dict] = None) -> Any:
-        """Make HTTP request to Polymarket API with retry logic"""
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        base_url: Optional[str] = None,
+    ) -> Any:
+        """Make HTTP request to Polymarket API (Gamma unless base_url is given) with retry logic"""
 
         @self._retry_on_failure
         def _make_request():
-            url = f"{self.BASE_URL}{endpoint}"
+            url = f"{base_url or self.BASE_URL}{endpoint}"
             headers = {}
 
             if self.api_key:
                 headers["Authorization"] = f"Bearer {self.api_key}"
 
             try:
-                response = requests.request(
+                response = self._http.request(
                     method, url, params=params, headers=headers, timeout=self.timeout
                 )
 
                 # Handle rate limiting
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 1))
-                    raise RateLimitError(f"Rate limited. Retry after {retry_after}s")
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    raise RateLimitError(
+                        f"Rate limited. Retry after {retry_after}s", retry_after=retry_after
+                    )
 
                 response.raise_for_status()
                 return response.json()
@@ -243,39 +355,31 @@ class Polymarket(Exchange):
 
         return _make_request()
 
-    def fetch_markets(self, params: Optional[Dict[str, Any]] = None) -> list[Market]:
+    def fetch_markets(
+        self,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        as_dataframe: bool = False,
+        as_arrow: bool = False,
+    ) -> list[Market] | pd.DataFrame | pa.Table:
         """
         Fetch all markets from Polymarket
 
         Uses CLOB API instead of Gamma API because CLOB includes token IDs
         which are required for trading.
+
+        Set ``as_arrow`` or ``as_dataframe`` to get one row per market
+        (MARKET_COLUMNS) instead of Market objects.
         """
 
         @self._retry_on_failure
         def _fetch():
             # Fetch from CLOB API /sampling-markets (includes token IDs and live markets)
             try:
-                response = requests.get(f"{self.CLOB_URL}/sampling-markets", timeout=self.timeout)
+                response = self._http.get(f"{self.CLOB_URL}/sampling-markets", timeout=self.timeout)
 
                 if response.status_code == 200:
-                    result = response.json()
-                    markets_data = result.get("data", result if isinstance(result, list) else [])
-
-                    markets = []
-                    for item in markets_data:
-                        market = self._parse_sampling_market(item)
-                        if market:
-                            markets.append(market)
-
-                    # Apply filters if provided
-                    query_params = params or {}
-                    if query_params.get("active") or (not query_params.get("closed", True)):
-                        markets = [m for m in markets if m.is_open]
-
-                    # Apply limit if provided
-                    limit = query_params.get("limit")
-                    if limit:
-                        markets = markets[:limit]
+                    markets = self._parse_sampling_markets(response.json(), params)
 
                     if self.verbose:
                         print(f"✓ Fetched {len(markets)} markets from CLOB API (sampling-markets)")
@@ -298,7 +402,12 @@ class Polymarket(Exchange):
                 markets.append(market)
             return markets
 
-        return _fetch()
+        markets = _fetch()
+        if as_arrow or as_dataframe:
+            builder = ColumnarBuilder(MARKET_COLUMNS)
+            builder.extend(markets)
+            return self._columnar_result(builder, as_arrow)
+        return markets
 
     def fetch_market(self, market_id: str) -> Market:
         """Fetch specific market by ID with retry logic"""
@@ -332,7 +441,7 @@ class Polymarket(Exchange):
             raise ValueError("Empty slug provided")
 
         try:
-            response = requests.get(f"{self.BASE_URL}/events?slug={slug}", timeout=self.timeout)
+            response = self._http.get(f"{self.BASE_URL}/events?slug={slug}", timeout=self.timeout)
         except requests.Timeout as e:
             raise NetworkError(f"Request timeout: {e}")
         except requests.ConnectionError as e:
@@ -372,6 +481,7 @@ class Polymarket(Exchange):
 
             if clob_token_ids:
                 market.metadata["clobTokenIds"] = clob_token_ids
+                market.token_ids = [str(token_id) for token_id in clob_token_ids]
 
             markets.append(market)
 
@@ -394,7 +504,7 @@ class Polymarket(Exchange):
             >>> best_ask = float(orderbook['asks'][0]['price'])
         """
         try:
-            response = requests.get(
+            response = self._http.get(
                 f"{self.CLOB_URL}/book", params={"token_id": token_id}, timeout=self.timeout
             )
 
@@ -408,6 +518,89 @@ class Polymarket(Exchange):
                 print(f"Failed to fetch orderbook: {e}")
             return {"bids": [], "asks": []}
 
+    def get_orderbooks(self, token_ids: List[str]) -> Dict[str, Orderbook]:
+        """
+        Fetch orderbooks for many tokens using the CLOB multi-book endpoint.
+
+        Sends one POST /books request per BOOKS_BATCH_SIZE tokens instead of
+        one GET /book per token. Falls back to per-token fan-out if a batch
+        request fails.
+
+        Args:
+            token_ids: Token IDs to fetch
+
+        Returns:
+            Dict mapping token_id to normalized Orderbook. Tokens missing from
+            a successful batch get an empty book; tokens whose fallback fetch
+            failed are left out.
+        """
+        unique_ids = list(dict.fromkeys(token_ids))
+        books: Dict[str, Orderbook] = {}
+
+        for start in range(0, len(unique_ids), self.BOOKS_BATCH_SIZE):
+            batch = unique_ids[start : start + self.BOOKS_BATCH_SIZE]
+            try:
+                response = self._http.post(
+                    f"{self.CLOB_URL}/books",
+                    json=[{"token_id": token_id} for token_id in batch],
+                    timeout=self.timeout,
+                )
+                response.raise_for_status()
+                parsed = self._parse_books_response(response.json())
+            except Exception as e:
+                if self.verbose:
+                    print(f"Batch orderbook fetch failed: {e}, fetching per token")
+                books.update(super().get_orderbooks(batch))
+                continue
+            # Tokens without a book in the response get an empty one
+            for token_id in batch:
+                books[token_id] = parsed.get(token_id) or Orderbook(asset_id=token_id)
+
+        return {token_id: books[token_id] for token_id in unique_ids if token_id in books}
+
+    @staticmethod
+    def _parse_books_response(data: Any) -> Dict[str, Orderbook]:
+        """Parse a POST /books response into Orderbooks keyed by asset_id"""
+        books: Dict[str, Orderbook] = {}
+        for raw in data if isinstance(data, list) else []:
+            token_id = str(raw.get("asset_id", ""))
+            if not token_id:
+                continue
+            orderbook = Orderbook.from_rest_response(raw, token_id)
+            orderbook.market_id = raw.get("market", "") or ""
+            try:
+                orderbook.timestamp = int(raw.get("timestamp") or 0)
+            except (TypeError, ValueError):
+                pass
+            books[token_id] = orderbook
+        return books
+
+    def _parse_sampling_markets(
+        self, result: Any, params: Optional[Dict[str, Any]] = None
+    ) -> List[Market]:
+        """Parse a /sampling-markets response and apply fetch_markets filters"""
+        markets_data = result.get("data", result) if isinstance(result, dict) else result
+        if not isinstance(markets_data, list):
+            markets_data = []
+
+        markets = []
+        for item in markets_data:
+            market = self._parse_sampling_market(item)
+            if market:
+                markets.append(market)
+
+        # Apply filters if provided
+        query_params = params or {}
+        if query_params.get("active") or (not query_params.get("closed", True)):
+            markets = [m for m in markets if m.is_open]
+
+        # Apply limit if provided
+        limit = query_params.get("limit")
+        if limit:
+            markets = markets[:limit]
+
+        return markets
+
     def _parse_sampling_market(self, data: Dict[str, Any]) -> Optional[Market]:
         """Parse market data from CLOB sampling-markets API response"""
         try:
@@ -635,7 +828,9 @@ class Polymarket(Exchange):
         The Gamma API doesn't include token IDs, so we need to fetch them
         from the CLOB API when we need to trade.
 
-        Based on actual CLOB API response structure.
+        Lookups are served from the token index (see sync_token_index). On a
+        miss the single market is requested from /markets/{condition_id};
+        only if that fails is the index synced from its last cursor.
 
         Args:
             condition_id: The market/condition ID
@@ -646,132 +841,78 @@ class Polymarket(Exchange):
         Raises:
             ExchangeError: If token IDs cannot be fetched
         """
-        try:
-            # Try simplified-markets endpoint
-            # Response structure: {"data": [{"condition_id": ..., "tokens": [{"token_id": ..., "outcome": ...}]}]}
-            try:
-                response = requests.get(f"{self.CLOB_URL}/simplified-markets", timeout=self.timeout)
+        token_ids = self._token_index.get(condition_id)
+        if token_ids:
+            return token_ids
 
-                if response.status_code == 200:
-                    result = response.json()
-
-                    # Check if response has "data" key
-                    markets_list = result.get("data", result if isinstance(result, list) else [])
-
-                    # Find the market with matching condition_id
-                    for market in markets_list:
-                        market_id = market.get("condition_id") or market.get("id")
-                        if market_id == condition_id:
-                            # Extract token IDs from tokens array
-                            # Each token is an object: {"token_id": "...", "outcome": "...", "price": ...}
-                            tokens = market.get("tokens", [])
-                            if tokens and isinstance(tokens, list):
-                                # Extract just the token_id strings
-                                token_ids = []
-                                for token in tokens:
-                                    if isinstance(token, dict) and "token_id" in token:
-                                        token_ids.append(str(token["token_id"]))
-                                    elif isinstance(token, str):
-                                        # In case it's already a string
-                                        token_ids.append(token)
-
-                                if token_ids:
-                                    if self.verbose:
-                                        print(
-                                            f"✓ Found {len(token_ids)} token IDs via simplified-markets"
-                                        )
-                                        for i, tid in enumerate(token_ids):
-                                            outcome = (
-                                                tokens[i].get("outcome", f"outcome_{i}")
-                                                if isinstance(tokens[i], dict)
-                                                else f"outcome_{i}"
-                                            )
-                                            print(f"  [{i}] {outcome}: {tid}")
-                                    return token_ids
-
-                            # Fallback: check for clobTokenIds
-                            clob_tokens = market.get("clobTokenIds")
-                            if clob_tokens and isinstance(clob_tokens, list):
-                                token_ids = [str(t) for t in clob_tokens]
-                                if self.verbose:
-                                    print(f"✓ Found token IDs via clobTokenIds: {token_ids}")
-                                return token_ids
-            except Exception as e:
+        try:
+            market = self._request("GET", f"/markets/{condition_id}", base_url=self.CLOB_URL)
+            if isinstance(market, dict) and self._token_index.update([market]):
                 if self.verbose:
-                    print(f"simplified-markets failed: {e}")
+                    print(f"✓ Found token IDs via markets endpoint for {condition_id}")
+                return self._token_index.get(condition_id)
+        except Exception as e:
+            if self.verbose:
+                print(f"markets endpoint failed: {e}")
 
-            # Try sampling-simplified-markets endpoint
-            try:
-                response = requests.get(
-                    f"{self.CLOB_URL}/sampling-simplified-markets", timeout=self.timeout
-                )
+        try:
+            self.sync_token_index()
+        except Exception as e:
+            if self.verbose:
+                print(f"Token index sync failed: {e}")
 
-                if response.status_code == 200:
-                    markets_list = response.json()
-                    if not isinstance(markets_list, list):
-                        markets_list = markets_list.get("data", [])
-
-                    for market in markets_list:
-                        market_id = market.get("condition_id") or market.get("id")
-                        if market_id == condition_id:
-                            # Extract from tokens array
-                            tokens = market.get("tokens", [])
-                            if tokens and isinstance(tokens, list):
-                                token_ids = []
-                                for token in tokens:
-                                    if isinstance(token, dict) and "token_id" in token:
-                                        token_ids.append(str(token["token_id"]))
-                                    elif isinstance(token, str):
-                                        token_ids.append(token)
-
-                                if token_ids:
-                                    if self.verbose:
-                                        print(
-                                            f"✓ Found token IDs via sampling-simplified-markets: {len(token_ids)} tokens"
-                                        )
-                                    return token_ids
-            except Exception as e:
-                if self.verbose:
-                    print(f"sampling-simplified-markets failed: {e}")
+        token_ids = self._token_index.get(condition_id)
+        if token_ids:
+            return token_ids
 
-            # Try markets endpoint
-            try:
-                response = requests.get(f"{self.CLOB_URL}/markets", timeout=self.timeout)
+        raise ExchangeError(
+            f"Could not fetch token IDs for market {condition_id} from any CLOB endpoint"
+        )
 
-                if response.status_code == 200:
-                    markets_list = response.json()
-                    if not isinstance(markets_list, list):
-                        markets_list = markets_list.get("data", [])
-
-                    for market in markets_list:
-                        market_id = market.get("condition_id") or market.get("id")
-                        if market_id == condition_id:
-                            # Extract from tokens array
-                            tokens = market.get("tokens", [])
-                            if tokens and isinstance(tokens, list):
-                                token_ids = []
-                                for token in tokens:
-                                    if isinstance(token, dict) and "token_id" in token:
-                                        token_ids.append(str(token["token_id"]))
-                                    elif isinstance(token, str):
-                                        token_ids.append(token)
-
-                                if token_ids:
-                                    if self.verbose:
-                                        print(
-                                            f"✓ Found token IDs via markets endpoint: {len(token_ids)} tokens"
-                                        )
-                                    return token_ids
-            except Exception as e:
-                if self.verbose:
-                    print(f"markets endpoint failed: {e}")
+    @property
+    def token_index(self) -> TokenIndex:
+        """condition_id -> token IDs/outcomes index used by fetch_token_ids"""
+        return self._token_index
 
-            raise ExchangeError(
-                f"Could not fetch token IDs for market {condition_id} from any CLOB endpoint"
-            )
+    def sync_token_index(self, max_pages: Optional[int] = None) -> int:
+        """
+        Bring the token index up to date with the CLOB /simplified-markets listing.
 
-        except requests.RequestException as e:
-            raise ExchangeError(f"Network error fetching token IDs: {e}")
+        Paging resumes from the index's saved cursor, so after the first full
+        sync only the last page and anything listed since are downloaded.
+        Call once before resolving many markets with fetch_token_ids(). The
+        index is saved to ``token_index_path`` when configured.
+
+        Args:
+            max_pages: Maximum pages to fetch (None for all)
+
+        Returns:
+            Number of markets indexed by this sync
+        """
+        index = self._token_index
+        with self._token_sync_lock:
+            cursor = index.cursor
+            indexed = 0
+            pages = 0
+            while max_pages is None or pages < max_pages:
+                params = {"next_cursor": cursor} if cursor else None
+                data = self._request("GET", "/simplified-markets", params, base_url=self.CLOB_URL)
+                if isinstance(data, list):
+                    data = {"data": data}
+                indexed += index.update(data.get("data") or [])
+                index.cursor = cursor
+                pages += 1
+
+                next_cursor = data.get("next_cursor")
+                if not next_cursor or next_cursor == END_CURSOR or next_cursor == cursor:
+                    break
+                cursor = next_cursor
+
+            index.save()
+
+        if self.verbose:
+            print(f"✓ Token index synced: {indexed} markets from {pages} pages, {len(index)} total")
+        return indexed
 
     def create_order(
         self,
@@ -790,6 +931,8 @@ class Polymarket(Exchange):
         if not token_id:
             raise InvalidOrder("token_id required in params")
 
+        self._check_rate_limit("orders")
+
         try:
             # Create and sign order
             order_args = OrderArgs(
@@ -799,8 +942,10 @@ class Polymarket(Exchange):
                 side=side.value.upper(),
             )
 
-            signed_order = self._clob_client.create_order(order_args)
-            result = self._clob_client.post_order(signed_order, OrderType.GTC)
+            signed_order = self._observed("sign_order", self._clob_client.create_order, order_args)
+            result = self._observed(
+                "post_order", self._clob_client.post_order, signed_order, OrderType.GTC
+            )
 
             # Parse result
             order_id = result.get("orderID", "") if isinstance(result, dict) else str(result)
@@ -833,6 +978,8 @@ class Polymarket(Exchange):
         if not self._clob_client:
             raise AuthenticationError("CLOB client not initialized. Private key required.")
 
+        self._check_rate_limit("orders")
+
         try:
             result = self._clob_client.cancel(order_id)
             if isinstance(result, dict):
@@ -1053,7 +1200,7 @@ class Polymarket(Exchange):
                 query_params["tag_id"] = tag_id
 
             try:
-                response = requests.get(url, params=query_params, timeout=10)
+                response = self._http.get(url, params=query_params, timeout=10)
                 response.raise_for_status()
                 data = response.json()
 
@@ -1278,6 +1425,18 @@ class Polymarket(Exchange):
         except (ValueError, TypeError):
             return None
 
+    def to_async(self) -> AsyncPolymarket:
+        """
+        Get the native asyncio counterpart of this exchange.
+
+        Markets and orderbooks are fetched natively over aiohttp; trading and
+        balance calls run the CLOB client in a worker thread.
+
+        Returns:
+            AsyncPolymarket sharing this instance's config and caches
+        """
+        return AsyncPolymarket(self)
+
     def get_websocket(self) -> PolymarketWebSocket:
         """
         Get WebSocket instance for real-time orderbook updates.
@@ -1384,7 +1543,8 @@ class Polymarket(Exchange):
         interval: Literal["1m", "1h", "6h", "1d", "1w", "max"] = "1m",
         fidelity: int = 10,
         as_dataframe: bool = False,
-    ) -> List[PricePoint] | pd.DataFrame:
+        as_arrow: bool = False,
+    ) -> List[PricePoint] | pd.DataFrame | pa.Table:
         if interval not in self.SUPPORTED_INTERVALS:
             raise ValueError(
                 f"Unsupported interval '{interval}'. Pick from {self.SUPPORTED_INTERVALS}."
@@ -1393,15 +1553,9 @@ class Polymarket(Exchange):
         market_obj = self._ensure_market(market)
         token_id = self._lookup_token_id(market_obj, outcome)
 
-        params = {
-            "market": token_id,
-            "interval": interval,
-            "fidelity": fidelity,
-        }
-
         @self._retry_on_failure
-        def _fetch() -> List[Dict[str, Any]]:
-            resp = requests.get(self.PRICES_HISTORY_URL, params=params, timeout=self.timeout)
+        def _fetch(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+            resp = self._http.get(self.PRICES_HISTORY_URL, params=params, timeout=self.timeout)
             resp.raise_for_status()
             payload = resp.json()
             history = payload.get("history", [])
@@ -1409,19 +1563,41 @@ class Polymarket(Exchange):
                 raise ExchangeError("Invalid response: 'history' must be a list.")
             return history
 
-        history = _fetch()
-        points = self._parse_history(history)
+        if self.price_history_cache is not None:
+            # The interval is a lookback from now; fetch the uncached parts by
+            # startTs/endTs. Buckets are set by fidelity, so it keys the series.
+            now = int(time.time())
+            lookback = self.PRICE_HISTORY_LOOKBACK.get(interval)
+            history = self._cached_price_history(
+                market_obj,
+                token_id,
+                now - lookback if lookback else 0,
+                now,
+                lambda start, end: _fetch(
+                    {"market": token_id, "startTs": start, "endTs": end, "fidelity": fidelity}
+                ),
+                fidelity=fidelity,
+                min_gap=fidelity * 60,
+            )
+        else:
+            history = _fetch({"market": token_id, "interval": interval, "fidelity": fidelity})
+
+        if as_arrow or as_dataframe:
+            builder = ColumnarBuilder(PRICE_HISTORY_COLUMNS)
+            builder.extend(
+                row for row in history if row.get("t") is not None and row.get("p") is not None
+            )
+            return self._columnar_result(builder, as_arrow, sort_by="timestamp")
 
-        if as_dataframe:
-            data = {
-                "timestamp": [p.timestamp for p in points],
-                "price": [p.price for p in points],
-            }
-            return pd.DataFrame(data).sort_values("timestamp").reset_index(drop=True)
+        return self._parse_history(history)
 
-        return points
+    @staticmethod
+    def _columnar_result(
+        builder: ColumnarBuilder, as_arrow: bool, **kwargs: Any
+    ) -> pd.DataFrame | pa.Table:
+        return builder.to_arrow(**kwargs) if as_arrow else builder.to_dataframe(**kwargs)
 
-    def _collect_paginated(
+    def _iter_paginated(
         self,
         fetch_page: Callable[[int, int], List[Any]],
         *,
@@ -1430,58 +1606,138 @@ class Polymarket(Exchange):
         page_size: int = 500,
         dedup_key: Callable[[Any], Any] | None = None,
         log: bool | None = False,
-    ) -> List[Any]:
-        if total_limit <= 0:
-            return []
-
-        results: List[Any] = []
-        current_offset = int(initial_offset)
-        total_limit = int(total_limit)
-        page_size = max(1, int(page_size))
-
-        seen: set[Any] = set() if dedup_key else set()
-
-        while len(results) < total_limit:
-            remaining = total_limit - len(results)
-            page_limit = min(page_size, remaining)
-
-            if log:
-                print("current-offset:", current_offset)
-                print("page_limit:", page_limit)
-                print("----------")
-
-            page = fetch_page(current_offset, page_limit)
-
-            if not page:
-                break
-
-            if dedup_key:
-                new_items: List[Any] = []
-                for item in page:
-                    key = dedup_key(item)
-                    if key in seen:
-                        continue
-                    seen.add(key)
-                    new_items.append(item)
-
-                if not new_items:
-                    break
-
-                results.extend(new_items)
-            else:
-                results.extend(page)
-
-            current_offset += len(page)
+    ) -> Paginator:
+        return self._paginate(
+            fetch_page,
+            total_limit=total_limit,
+            initial_offset=initial_offset,
+            page_size=page_size,
+            dedup_key=dedup_key,
+            log=bool(log),
+        )
 
-            if len(page) < page_limit:
-                break
+    def search_markets(
+        self,
+        *,
+        # Gamma-side
+        limit: int = 200,
+        offset: int = 0,
+        order: str | None = "id",
+        ascending: bool | None = False,
+        closed: bool | None = False,
+        tag_id: int | None = None,
+        ids: Sequence[int] | None = None,
+        slugs: Sequence[str] | None = None,
+        clob_token_ids: Sequence[str] | None = None,
+        condition_ids: Sequence[str] | None = None,
+        market_maker_addresses: Sequence[str] | None = None,
+        liquidity_num_min: float | None = None,
+        liquidity_num_max: float | None = None,
+        volume_num_min: float | None = None,
+        volume_num_max: float | None = None,
+        start_date_min: datetime | None = None,
+        start_date_max: datetime | None = None,
+        end_date_min: datetime | None = None,
+        end_date_max: datetime | None = None,
+        related_tags: bool | None = None,
+        cyom: bool | None = None,
+        uma_resolution_status: str | None = None,
+        game_id: str | None = None,
+        sports_market_types: Sequence[str] | None = None,
+        rewards_min_size: float | None = None,
+        question_ids: Sequence[str] | None = None,
+        include_tag: bool | None = None,
+        extra_params: Dict[str, Any] | None = None,
+        # Client-side
+        query: str | None = None,
+        keywords: Sequence[str] | None = None,
+        binary: bool | None = None,
+        min_liquidity: float = 0.0,
+        categories: Sequence[str] | None = None,
+        outcomes: Sequence[str] | None = None,
+        predicate: Callable[[Market], bool] | None = None,
+        # Log
+        log: bool | None = False,
+        # Output
+        as_dataframe: bool = False,
+        as_arrow: bool = False,
+    ) -> List[Market] | pd.DataFrame | pa.Table:
+        """
+        Search Gamma markets and return every match as a list.
 
-        if len(results) > total_limit:
-            results = results[:total_limit]
+        Takes the same filters as iter_markets(); ``limit`` caps both the
+        markets fetched and the matches returned. Set ``as_arrow`` or
+        ``as_dataframe`` to get one row per match (MARKET_COLUMNS).
+        """
+        markets = self.iter_markets(
+            limit=limit,
+            offset=offset,
+            order=order,
+            ascending=ascending,
+            closed=closed,
+            tag_id=tag_id,
+            ids=ids,
+            slugs=slugs,
+            clob_token_ids=clob_token_ids,
+            condition_ids=condition_ids,
+            market_maker_addresses=market_maker_addresses,
+            liquidity_num_min=liquidity_num_min,
+            liquidity_num_max=liquidity_num_max,
+            volume_num_min=volume_num_min,
+            volume_num_max=volume_num_max,
+            start_date_min=start_date_min,
+            start_date_max=start_date_max,
+            end_date_min=end_date_min,
+            end_date_max=end_date_max,
+            related_tags=related_tags,
+            cyom=cyom,
+            uma_resolution_status=uma_resolution_status,
+            game_id=game_id,
+            sports_market_types=sports_market_types,
+            rewards_min_size=rewards_min_size,
+            question_ids=question_ids,
+            include_tag=include_tag,
+            extra_params=extra_params,
+            query=query,
+            keywords=keywords,
+            binary=binary,
+            min_liquidity=min_liquidity,
+            categories=categories,
+            outcomes=outcomes,
+            predicate=predicate,
+            log=log,
+            max_items=limit,
+        )
+        if as_arrow or as_dataframe:
+            builder = ColumnarBuilder(MARKET_COLUMNS)
+            builder.extend(markets)
+            return self._columnar_result(builder, as_arrow)
+        return list(markets)
 
-        return results
+    def iter_updated_markets(self, since: Optional[str] = None) -> Iterator[Market]:
+        """
+        Gamma markets ordered by update time, newest first (see MarketCatalog).
 
-    def search_markets(
+        A full sync (``since`` is None) lists open markets. An incremental
+        sync also includes closed markets, so resolutions reach the catalog,
+        and stops at the first market not updated after ``since``.
+        """
+        markets = self.iter_markets(
+            limit=self.CATALOG_SYNC_LIMIT,
+            order=self.MARKET_UPDATED_AT_KEY,
+            ascending=False,
+            closed=None if since else False,
+        )
+        try:
+            for market in markets:
+                updated_at = market.metadata.get(self.MARKET_UPDATED_AT_KEY)
+                if since is not None and updated_at is not None and str(updated_at) <= since:
+                    return
+                yield market
+        finally:
+            markets.close()
+
+    def iter_markets(
         self,
         *,
         # Gamma-side
@@ -1521,13 +1777,28 @@ class Polymarket(Exchange):
         categories: Sequence[str] | None = None,
         outcomes: Sequence[str] | None = None,
         predicate: Callable[[Market], bool] | None = None,
+        max_items: int | None = None,
         # Log
         log: bool | None = False,
-    ) -> List[Market]:
+    ) -> Iterator[Market]:
+        """
+        Stream Gamma markets page by page, applying client-side filters as pages arrive.
+
+        Gamma pages are prefetched concurrently (``pagination_window``) and
+        parsed in the worker threads, so matches can be consumed before the
+        whole listing has loaded.
+
+        Args:
+            limit: Maximum markets to fetch from Gamma (before client-side filtering)
+            max_items: Stop fetching once this many markets matched the filters
+
+        Yields:
+            Market objects matching every filter
+        """
         # ---------- 0) Pre-process ----------
         total_limit = int(limit)
-        if total_limit <= 0:
-            return []
+        if total_limit <= 0 or (max_items is not None and max_items <= 0):
+            return
 
         initial_offset = max(0, int(offset))
         default_page_size_markets = 200
@@ -1539,7 +1810,6 @@ class Polymarket(Exchange):
         def _lower_list(values: Sequence[str] | None) -> List[str]:
             return [v.lower() for v in values] if values else []
 
-        query_lower = query.lower() if query else None
         keyword_lowers = _lower_list(keywords)
         category_lowers = _lower_list(categories)
         outcome_lowers = _lower_list(outcomes)
@@ -1613,7 +1883,7 @@ class Polymarket(Exchange):
                 "limit": limit_,
                 "offset": offset_,
             }
-            resp = requests.get(
+            resp = self._http.get(
                 f"{self.BASE_URL}/markets",
                 params=params,
                 timeout=self.timeout,
@@ -1624,7 +1894,7 @@ class Polymarket(Exchange):
                 raise ExchangeError("Gamma /markets response must be a list.")
             return [self._parse_market(m) for m in raw]
 
-        gamma_results: List[Market] = self._collect_paginated(
+        paginator = self._iter_paginated(
             _fetch_page,
             total_limit=total_limit,
             initial_offset=initial_offset,
@@ -1634,35 +1904,36 @@ class Polymarket(Exchange):
         )
 
         # ---------- 3) Client-side filtering ----------
-        filtered: List[Market] = []
-
-        for m in gamma_results:
+        def _matches(m: Market) -> bool:
             if binary is not None and m.is_binary != binary:
-                continue
+                return False
             if m.liquidity < min_liquidity:
-                continue
+                return False
             if outcome_lowers:
                 outs = [o.lower() for o in m.outcomes]
                 if not all(x in outs for x in outcome_lowers):
-                    continue
-            if category_lowers:
-                cats = self._extract_categories(m)
-                if not cats or not any(c in cats for c in category_lowers):
-                    continue
-            if query_lower or keyword_lowers:
-                text = self._build_search_text(m)
-                if query_lower and query_lower not in text:
-                    continue
-                if any(k not in text for k in keyword_lowers):
-                    continue
+                    return False
+            if (query or keyword_lowers or category_lowers) and not self.search_index.matches(
+                m, query, keywords=keyword_lowers, categories=category_lowers
+            ):
+                return False
             if predicate and not predicate(m):
-                continue
-            filtered.append(m)
-
-        if len(filtered) > total_limit:
-            filtered = filtered[:total_limit]
+                return False
+            return True
 
-        return filtered
+        matched = 0
+        markets = iter(paginator)
+        try:
+            for m in markets:
+                if not _matches(m):
+                    continue
+                yield m
+                matched += 1
+                if max_items is not None and matched >= max_items:
+                    return
+        finally:
+            # Cancel pages still in flight
+            markets.close()
 
     def fetch_public_trades(
         self,
@@ -1677,11 +1948,97 @@ class Polymarket(Exchange):
         filter_type: Literal["CASH", "TOKENS"] | None = None,
         filter_amount: float | None = None,
         as_dataframe: bool = False,
+        as_arrow: bool = False,
         log: bool = False,
-    ) -> List[PublicTrade] | pd.DataFrame:
+    ) -> List[PublicTrade] | pd.DataFrame | pa.Table:
+        """
+        Fetch public trades from the Data-API.
+
+        With ``as_arrow`` or ``as_dataframe`` the JSON pages are written
+        straight into columns (PUBLIC_TRADE_COLUMNS), sorted by timestamp,
+        without building a PublicTrade per row.
+        """
+        paginator = self._public_trades_paginator(
+            market,
+            limit=limit,
+            offset=offset,
+            event_id=event_id,
+            user=user,
+            side=side,
+            taker_only=taker_only,
+            filter_type=filter_type,
+            filter_amount=filter_amount,
+            log=log,
+        )
+
+        if paginator is None and not as_arrow:
+            return []
+
+        if as_arrow or as_dataframe:
+            builder = ColumnarBuilder(PUBLIC_TRADE_COLUMNS)
+            if paginator is not None:
+                for page in paginator.pages():
+                    builder.extend(page)
+            return self._columnar_result(builder, as_arrow, sort_by="timestamp", limit=int(limit))
+
+        return [self._parse_public_trade(row) for row in paginator]
+
+    def iter_public_trades(
+        self,
+        market: Market | str | None = None,
+        *,
+        limit: int = 100,
+        offset: int = 0,
+        event_id: int | None = None,
+        user: str | None = None,
+        side: Literal["BUY", "SELL"] | None = None,
+        taker_only: bool = True,
+        filter_type: Literal["CASH", "TOKENS"] | None = None,
+        filter_amount: float | None = None,
+        log: bool = False,
+    ) -> Iterator[PublicTrade]:
+        """
+        Stream public trades from the Data-API page by page.
+
+        Arguments are validated eagerly; pages are prefetched concurrently
+        (``pagination_window``) and each row is parsed only when consumed.
+
+        Yields:
+            PublicTrade objects, at most ``limit``
+        """
+        paginator = self._public_trades_paginator(
+            market,
+            limit=limit,
+            offset=offset,
+            event_id=event_id,
+            user=user,
+            side=side,
+            taker_only=taker_only,
+            filter_type=filter_type,
+            filter_amount=filter_amount,
+            log=log,
+        )
+        if paginator is None:
+            return iter(())
+        return (self._parse_public_trade(row) for row in paginator)
+
+    def _public_trades_paginator(
+        self,
+        market: Market | str | None = None,
+        *,
+        limit: int = 100,
+        offset: int = 0,
+        event_id: int | None = None,
+        user: str | None = None,
+        side: Literal["BUY", "SELL"] | None = None,
+        taker_only: bool = True,
+        filter_type: Literal["CASH", "TOKENS"] | None = None,
+        filter_amount: float | None = None,
+        log: bool = False,
+    ) -> Paginator | None:
         total_limit = int(limit)
         if total_limit <= 0:
-            return []
+            return None
 
         if offset < 0 or offset > 10000:
             raise ValueError("offset must be between 0 and 10000")
@@ -1725,7 +2082,7 @@ class Polymarket(Exchange):
                 "offset": offset_,
             }
 
-            resp = requests.get(
+            resp = self._http.get(
                 f"{self.DATA_API_URL}/trades",
                 params=params,
                 timeout=self.timeout,
@@ -1740,7 +2097,7 @@ class Polymarket(Exchange):
             # transactionHash + timestamp + side + asset + size + price
             return (row.get("transactionHash"), row.get("outcomeIndex"))
 
-        raw_trades: List[Dict[str, Any]] = self._collect_paginated(
+        return self._iter_paginated(
             _fetch_page,
             total_limit=total_limit,
             initial_offset=initial_offset,
@@ -1749,75 +2106,38 @@ class Polymarket(Exchange):
             log=log,
         )
 
-        # ---------- Dict -> PublicTrade ----------
-        trades: List[PublicTrade] = []
-
-        for row in raw_trades[:total_limit]:
-            ts = row.get("timestamp")
-            if isinstance(ts, (int, float)):
-                ts_dt = datetime.fromtimestamp(int(ts), tz=timezone.utc)
-            elif isinstance(ts, str) and ts.isdigit():
-                ts_dt = datetime.fromtimestamp(int(ts), tz=timezone.utc)
-            else:
-                ts_dt = datetime.fromtimestamp(0, tz=timezone.utc)
-
-            trades.append(
-                PublicTrade(
-                    proxy_wallet=row.get("proxyWallet", ""),
-                    side=row.get("side", ""),
-                    asset=row.get("asset", ""),
-                    condition_id=row.get("conditionId", ""),
-                    size=float(row.get("size", 0) or 0),
-                    price=float(row.get("price", 0) or 0),
-                    timestamp=ts_dt,
-                    title=row.get("title"),
-                    slug=row.get("slug"),
-                    icon=row.get("icon"),
-                    event_slug=row.get("eventSlug"),
-                    outcome=row.get("outcome"),
-                    outcome_index=row.get("outcomeIndex"),
-                    name=row.get("name"),
-                    pseudonym=row.get("pseudonym"),
-                    bio=row.get("bio"),
-                    profile_image=row.get("profileImage"),
-                    profile_image_optimized=row.get("profileImageOptimized"),
-                    transaction_hash=row.get("transactionHash"),
-                )
-            )
-
-        if not as_dataframe:
-            return trades
-
-        # ---------- as_dataframe=True: Convert to DataFrame----------
-
-        df = pd.DataFrame(
-            [
-                {
-                    "timestamp": t.timestamp,
-                    "side": t.side,
-                    "asset": t.asset,
-                    "condition_id": t.condition_id,
-                    "size": t.size,
-                    "price": t.price,
-                    "proxy_wallet": t.proxy_wallet,
-                    "title": t.title,
-                    "slug": t.slug,
-                    "event_slug": t.event_slug,
-                    "outcome": t.outcome,
-                    "outcome_index": t.outcome_index,
-                    "name": t.name,
-                    "pseudonym": t.pseudonym,
-                    "bio": t.bio,
-                    "profile_image": t.profile_image,
-                    "profile_image_optimized": t.profile_image_optimized,
-                    "transaction_hash": t.transaction_hash,
-                }
-                for t in trades
-            ]
+    @staticmethod
+    def _parse_public_trade(row: Dict[str, Any]) -> PublicTrade:
+        ts = row.get("timestamp")
+        if isinstance(ts, (int, float)):
+            ts_dt = datetime.fromtimestamp(int(ts), tz=timezone.utc)
+        elif isinstance(ts, str) and ts.isdigit():
+            ts_dt = datetime.fromtimestamp(int(ts), tz=timezone.utc)
+        else:
+            ts_dt = datetime.fromtimestamp(0, tz=timezone.utc)
+
+        return PublicTrade(
+            proxy_wallet=row.get("proxyWallet", ""),
+            side=row.get("side", ""),
+            asset=row.get("asset", ""),
+            condition_id=row.get("conditionId", ""),
+            size=float(row.get("size", 0) or 0),
+            price=float(row.get("price", 0) or 0),
+            timestamp=ts_dt,
+            title=row.get("title"),
+            slug=row.get("slug"),
+            icon=row.get("icon"),
+            event_slug=row.get("eventSlug"),
+            outcome=row.get("outcome"),
+            outcome_index=row.get("outcomeIndex"),
+            name=row.get("name"),
+            pseudonym=row.get("pseudonym"),
+            bio=row.get("bio"),
+            profile_image=row.get("profileImage"),
+            profile_image_optimized=row.get("profileImageOptimized"),
+            transaction_hash=row.get("transactionHash"),
         )
 
-        return df.sort_values("timestamp").reset_index(drop=True)
-
     @staticmethod
     def _extract_categories(market: Market) -> List[str]:
         buckets: List[str] = []
@@ -1897,7 +2217,7 @@ class Polymarket(Exchange):
 
         @self._retry_on_failure
         def _fetch() -> dict:
-            resp = requests.get(url, timeout=self.timeout)
+            resp = self._http.get(url, timeout=self.timeout)
             resp.raise_for_status()
             data = resp.json()
             if not isinstance(data, dict):
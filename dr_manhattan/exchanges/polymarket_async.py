@@ -0,0 +1,128 @@
+"""
+Async Polymarket exchange.
+
+Native asyncio implementation of the Polymarket read paths (markets and
+orderbooks) on the pooled aiohttp transport. Order and balance calls go
+through the CLOB SDK in a worker thread.
+"""
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ..base.async_exchange import AsyncExchange
+from ..base.errors import ExchangeError, MarketNotFound
+from ..models.market import Market
+from ..models.orderbook import Orderbook
+
+if TYPE_CHECKING:
+    from .polymarket import Polymarket
+
+
+class AsyncPolymarket(AsyncExchange):
+    """Async Polymarket exchange sharing state with a sync Polymarket instance"""
+
+    exchange: "Polymarket"
+
+    def _gamma_headers(self) -> Dict[str, str]:
+        if self.exchange.api_key:
+            return {"Authorization": f"Bearer {self.exchange.api_key}"}
+        return {}
+
+    async def _gamma_request(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        return await self._request_json(
+            "GET",
+            f"{self.exchange.BASE_URL}{endpoint}",
+            params=params,
+            headers=self._gamma_headers(),
+            endpoint=endpoint,
+        )
+
+    async def fetch_markets(self, params: Optional[Dict[str, Any]] = None) -> List[Market]:
+        """
+        Fetch markets from the CLOB /sampling-markets endpoint.
+
+        Falls back to the Gamma API (without token IDs) when CLOB fails,
+        matching Polymarket.fetch_markets.
+        """
+        try:
+            result = await self._request_json(
+                "GET",
+                f"{self.exchange.CLOB_URL}/sampling-markets",
+                endpoint="/sampling-markets",
+            )
+            markets = self.exchange._parse_sampling_markets(result, params)
+            if self.verbose:
+                print(f"✓ Fetched {len(markets)} markets from CLOB API (sampling-markets)")
+            return markets
+        except Exception as e:
+            if self.verbose:
+                print(f"CLOB API fetch failed: {e}, falling back to Gamma API")
+
+        query_params = params or {}
+        if "active" not in query_params and "closed" not in query_params:
+            query_params = {"active": True, "closed": False, **query_params}
+
+        data = await self._gamma_request("/markets", query_params)
+        return [self.exchange._parse_market(item) for item in data]
+
+    async def fetch_market(self, market_id: str) -> Market:
+        """Fetch a specific market by ID from the Gamma API"""
+        try:
+            data = await self._gamma_request(f"/markets/{market_id}")
+        except ExchangeError:
+            raise MarketNotFound(f"Market {market_id} not found")
+        return self.exchange._parse_market(data)
+
+    async def get_orderbook(self, token_id: str) -> Dict[str, Any]:
+        """
+        Fetch orderbook for a token from the CLOB API.
+
+        Returns:
+            Dictionary with 'bids' and 'asks' arrays (empty on failure)
+        """
+        try:
+            response = await self._http.get(
+                f"{self.exchange.CLOB_URL}/book", params={"token_id": token_id}
+            )
+            if response.status_code == 200:
+                return response.json()
+            return {"bids": [], "asks": []}
+        except Exception as e:
+            if self.verbose:
+                print(f"Failed to fetch orderbook: {e}")
+            return {"bids": [], "asks": []}
+
+    async def get_orderbooks(self, token_ids: List[str]) -> Dict[str, Orderbook]:
+        """
+        Fetch orderbooks for many tokens via the CLOB POST /books endpoint.
+
+        Batches are sent concurrently; a failed batch falls back to
+        per-token fan-out, which leaves out tokens that still fail.
+        """
+        exchange = self.exchange
+        unique_ids = list(dict.fromkeys(token_ids))
+        size = exchange.BOOKS_BATCH_SIZE
+        batches = [unique_ids[i : i + size] for i in range(0, len(unique_ids), size)]
+
+        async def _fetch_batch(batch: List[str]) -> Dict[str, Orderbook]:
+            try:
+                data = await self._request_json(
+                    "POST",
+                    f"{exchange.CLOB_URL}/books",
+                    json=[{"token_id": token_id} for token_id in batch],
+                    endpoint="/books",
+                )
+            except Exception as e:
+                if self.verbose:
+                    print(f"Batch orderbook fetch failed: {e}, fetching per token")
+                return await super(AsyncPolymarket, self).get_orderbooks(batch)
+            parsed = exchange._parse_books_response(data)
+            return {
+                token_id: parsed.get(token_id) or Orderbook(asset_id=token_id) for token_id in batch
+            }
+
+        books: Dict[str, Orderbook] = {}
+        for result in await asyncio.gather(*(_fetch_batch(batch) for batch in batches)):
+            books.update(result)
+
+        return {token_id: books[token_id] for token_id in unique_ids if token_id in books}
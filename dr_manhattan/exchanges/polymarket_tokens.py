@@ -0,0 +1,153 @@
+"""
+Persistent condition_id -> token_ids index for Polymarket.
+
+The CLOB API only lists token IDs as part of full market listings, so
+resolving one market used to mean downloading and scanning every page.
+``TokenIndex`` keeps the mapping in memory, remembers the listing cursor so
+later syncs only fetch pages past it, and can snapshot itself to disk so a
+new process starts warm.
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# next_cursor value the CLOB API returns after the last page
+END_CURSOR = "LTE="
+
+
+def parse_tokens(market: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    """
+    Extract token IDs and outcomes from a CLOB market listing entry.
+
+    Args:
+        market: Entry from /simplified-markets, /sampling-simplified-markets or /markets
+
+    Returns:
+        Tuple of (token_ids, outcomes); outcomes may be shorter when unknown
+    """
+    token_ids: List[str] = []
+    outcomes: List[str] = []
+    tokens = market.get("tokens")
+    if isinstance(tokens, list):
+        for token in tokens:
+            if isinstance(token, dict) and token.get("token_id"):
+                token_ids.append(str(token["token_id"]))
+                outcomes.append(str(token.get("outcome", "")))
+            elif isinstance(token, str):
+                token_ids.append(token)
+    if not token_ids:
+        clob_tokens = market.get("clobTokenIds")
+        if isinstance(clob_tokens, list):
+            token_ids = [str(t) for t in clob_tokens]
+    return token_ids, outcomes
+
+
+class TokenIndex:
+    """
+    Thread-safe condition_id -> (token_ids, outcomes) map with a sync cursor.
+
+    Example:
+        >>> index = TokenIndex("~/.cache/dr_manhattan/polymarket_tokens.json")
+        >>> index.get("0xabc...")
+        ['1234...', '5678...']
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize index, loading the snapshot at ``path`` if it exists.
+
+        Args:
+            path: JSON snapshot file (None keeps the index in memory only)
+        """
+        self.path = os.path.expanduser(path) if path else None
+        self.cursor: Optional[str] = None
+        self._entries: Dict[str, Tuple[List[str], List[str]]] = {}
+        self._lock = threading.Lock()
+        if self.path and os.path.exists(self.path):
+            self.load()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, condition_id: str) -> bool:
+        with self._lock:
+            return condition_id in self._entries
+
+    def get(self, condition_id: str) -> Optional[List[str]]:
+        """Token IDs for a condition, or None if not indexed."""
+        with self._lock:
+            entry = self._entries.get(condition_id)
+        return list(entry[0]) if entry else None
+
+    def outcomes(self, condition_id: str) -> Optional[List[str]]:
+        """Outcome names aligned with get(), or None if not indexed."""
+        with self._lock:
+            entry = self._entries.get(condition_id)
+        return list(entry[1]) if entry else None
+
+    def add(self, condition_id: str, token_ids: List[str], outcomes: List[str]) -> None:
+        """Index one condition."""
+        if condition_id and token_ids:
+            with self._lock:
+                self._entries[condition_id] = (list(token_ids), list(outcomes))
+
+    def update(self, markets: Iterable[Dict[str, Any]]) -> int:
+        """
+        Index a page of CLOB market entries.
+
+        Args:
+            markets: Market dicts carrying condition_id and tokens
+
+        Returns:
+            Number of entries indexed
+        """
+        added = 0
+        for market in markets:
+            if not isinstance(market, dict):
+                continue
+            condition_id = market.get("condition_id") or market.get("id")
+            token_ids, outcomes = parse_tokens(market)
+            if condition_id and token_ids:
+                self.add(str(condition_id), token_ids, outcomes)
+                added += 1
+        return added
+
+    def clear(self) -> None:
+        """Drop all entries and the sync cursor."""
+        with self._lock:
+            self._entries.clear()
+            self.cursor = None
+
+    def load(self) -> None:
+        """Replace the contents with the on-disk snapshot."""
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        with self._lock:
+            self.cursor = data.get("cursor")
+            self._entries = {
+                condition_id: (list(entry.get("token_ids", [])), list(entry.get("outcomes", [])))
+                for condition_id, entry in data.get("markets", {}).items()
+            }
+
+    def save(self) -> None:
+        """Write the snapshot atomically (no-op without a path)."""
+        if not self.path:
+            return
+        with self._lock:
+            data = {
+                "cursor": self.cursor,
+                "markets": {
+                    condition_id: {"token_ids": token_ids, "outcomes": outcomes}
+                    for condition_id, (token_ids, outcomes) in self._entries.items()
+                },
+            }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
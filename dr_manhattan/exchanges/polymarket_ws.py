@@ -1,18 +1,20 @@
 import asyncio
+import concurrent.futures
 import json
 import logging
 import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import websockets
 import websockets.exceptions
 
-from ..base.websocket import OrderBookWebSocket
-from ..models.orderbook import OrderbookManager
+from ..base.websocket import OrderBookWebSocket, WebSocketPool, WebSocketState
+from ..base.ws_runtime import WebSocketRuntime
+from ..models.orderbook import BookSubscription, L2Book, OrderbookManager
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +45,68 @@ class Trade:
     transaction_hash: str = ""
 
 
+@dataclass
+class BookSyncState:
+    """Sequence and staleness tracking for one asset's incremental book"""
+
+    market_id: str = ""
+    timestamp: int = 0  # Exchange timestamp (ms) of the last applied message
+    received_at: float = 0.0  # Local time.time() of the last confirmed update
+    stale: bool = True
+    resyncing: bool = False
+    resyncs: int = 0
+    # (timestamp, side, price, size) deltas received while a resync is in flight
+    pending: List[Tuple[int, str, float, float]] = field(default_factory=list)
+
+
+def _timestamp_ms(value: Any) -> int:
+    """Parse a Polymarket millisecond timestamp (sent as str or int)"""
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _book_callback(
+    manager: OrderbookManager, exchange, token_id: str, callback: Optional[Callable] = None
+) -> Callable:
+    """Subscription callback storing a token's books in ``manager`` and the exchange cache"""
+
+    def cb(market_id, orderbook):
+        # Update orderbook manager
+        manager.update(token_id, orderbook)
+        # Update exchange mid-price cache
+        if exchange:
+            exchange.update_mid_price_from_orderbook(token_id, orderbook)
+        # Call user callback if provided
+        if callback:
+            callback(market_id, orderbook)
+
+    return cb
+
+
+def _conflate(
+    manager: OrderbookManager,
+    subscriptions: Dict[str, BookSubscription],
+    market_id: str,
+    asset_ids: List[str],
+    callback: Callable,
+    conflate_ms: float,
+) -> BookSubscription:
+    """Hand ``callback`` only the newest book of each changed asset, at most every conflate_ms"""
+    previous = subscriptions.pop(market_id, None)
+    if previous is not None:
+        previous.close()
+
+    def deliver(snapshots):
+        for token_id, snapshot in snapshots.items():
+            callback(token_id, snapshot.to_dict())
+
+    subscription = manager.subscribe(deliver, token_ids=asset_ids, interval_ms=conflate_ms)
+    subscriptions[market_id] = subscription
+    return subscription
+
+
 class PolymarketWebSocket(OrderBookWebSocket):
     """
     Polymarket WebSocket implementation for real-time orderbook updates.
@@ -54,20 +118,39 @@ class PolymarketWebSocket(OrderBookWebSocket):
     WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
 
     def __init__(self, config: Optional[Dict[str, Any]] = None, exchange=None):
-        super().__init__(config)
-
-        # Reference to parent exchange for updating mid-price cache
+        # Reference to parent exchange for updating mid-price cache (and its
+        # metrics hook, which the base class hands to the dispatcher)
         self.exchange = exchange
 
+        super().__init__(config)
+
         # Market ID to asset ID mapping
         self.market_to_asset: Dict[str, str] = {}
 
-        # Track subscribed asset IDs
-        self.subscribed_assets = set()
+        # Asset IDs that should be subscribed
+        self.subscribed_assets: Set[str] = set()
 
         # Orderbook manager
         self.orderbook_manager = OrderbookManager()
 
+        # Conflating manager subscriptions per market (see watch_orderbook_by_market)
+        self.book_subscriptions: Dict[str, BookSubscription] = {}
+
+        # Per-asset level books that price_change deltas are applied to
+        self._books: Dict[str, L2Book] = {}
+        self._book_state: Dict[str, BookSyncState] = {}
+
+        # Fetch a REST snapshot when a book is found out of sync
+        self.resync_books = self.config.get("resync_books", True)
+
+        # Assets the server has been sent on the current connection; flushes
+        # diff subscribed_assets (desired) against it
+        self._active_assets: Set[str] = set()
+        self._handshake_sent = False
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self.max_assets_per_frame = self.config.get("max_assets_per_frame", 500)
+
     @property
     def ws_url(self) -> str:
         """WebSocket endpoint URL for Polymarket CLOB market channel"""
@@ -85,24 +168,14 @@ class PolymarketWebSocket(OrderBookWebSocket):
         Subscribe to orderbook updates for a market.
 
         For Polymarket, we need to subscribe using asset_id (token ID).
-        The market_id is the condition_id, and we need to map it to asset_ids.
+        The asset is added to the desired set and sent with every other
+        change made in the same event-loop tick (see ``flush_subscriptions``).
 
         Args:
             market_id: Market condition ID or asset ID
         """
-        # Store the market_id as asset_id for subscription
-        asset_id = market_id
-
-        # Mark as subscribed
-        self.subscribed_assets.add(asset_id)
-
-        # Send subscription message
-        subscribe_message = {"auth": {}, "markets": [], "assets_ids": [asset_id], "type": "market"}
-
-        await self.ws.send(json.dumps(subscribe_message))
-
-        if self.verbose:
-            logger.debug(f"Subscribed to market/asset: {asset_id}")
+        self.subscribed_assets.add(market_id)
+        self._schedule_flush()
 
     async def _unsubscribe_orderbook(self, market_id: str):
         """
@@ -113,29 +186,74 @@ class PolymarketWebSocket(OrderBookWebSocket):
         """
         asset_id = market_id
 
-        # Remove from subscribed set
+        # Remove from subscribed set and drop its stored book
         self.subscribed_assets.discard(asset_id)
+        self._books.pop(asset_id, None)
+        self._book_state.pop(asset_id, None)
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Flush subscription changes once the current event-loop tick is done"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self.flush_subscriptions())
+
+    def _frames(self, operation: str, asset_ids: List[str]) -> List[Dict[str, Any]]:
+        """Split a subscription change into frames of at most max_assets_per_frame"""
+        size = max(1, self.max_assets_per_frame)
+        return [
+            {"assets_ids": asset_ids[i : i + size], "operation": operation}
+            for i in range(0, len(asset_ids), size)
+        ]
+
+    async def flush_subscriptions(self):
+        """
+        Send the difference between desired and active subscriptions.
 
-        # Send unsubscription (resubscribe with remaining assets)
-        subscribe_message = {
-            "auth": {},
-            "markets": [],
-            "assets_ids": list(self.subscribed_assets),
-            "type": "market",
-        }
-
-        await self.ws.send(json.dumps(subscribe_message))
-
-        if self.verbose:
-            logger.debug(f"Unsubscribed from market/asset: {asset_id}")
+        Adds and removes queued since the last flush are sent as one frame
+        per ``max_assets_per_frame`` assets. The first frame of a connection
+        uses the initial ``type: market`` handshake. Does nothing while
+        disconnected: ``connect()`` replays the full set.
+        """
+        async with self._flush_lock:
+            sent = 0
+            # Loop: assets changed while a frame was being sent go out in this flush too
+            while self.ws is not None and self.state == WebSocketState.CONNECTED:
+                added = sorted(self.subscribed_assets - self._active_assets)
+                removed = sorted(self._active_assets - self.subscribed_assets)
+                if not added and not removed:
+                    break
+                for frame in self._frames("unsubscribe", removed) + self._frames(
+                    "subscribe", added
+                ):
+                    if frame["operation"] == "subscribe" and not self._handshake_sent:
+                        frame = {"assets_ids": frame["assets_ids"], "type": "market"}
+                        self._handshake_sent = True
+                    await self.ws.send(json.dumps(frame))
+                    sent += 1
+                    if frame.get("operation") == "unsubscribe":
+                        self._active_assets.difference_update(frame["assets_ids"])
+                    else:
+                        self._active_assets.update(frame["assets_ids"])
+
+            if self.verbose and sent:
+                logger.debug(
+                    f"Subscriptions flushed: {len(self._active_assets)} assets active, {sent} frames"
+                )
+
+    async def _resubscribe(self):
+        """Send the whole subscription set on a fresh connection in batched frames"""
+        self._active_assets.clear()
+        self._handshake_sent = False
+        self.subscribed_assets.clear()
+        self.subscribed_assets.update(self.subscriptions)
+        await self.flush_subscriptions()
 
     def _parse_orderbook_message(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Parse incoming WebSocket message into standardized orderbook format.
 
-        Handles two message types:
-        1. book - Full orderbook snapshot (bids/asks arrays)
-        2. price_change - Price updates with best bid/ask
+        Returns the first book from _parse_orderbook_updates(); a
+        price_change touching several assets yields more than one.
 
         Args:
             message: Raw message from WebSocket
@@ -143,14 +261,45 @@ class PolymarketWebSocket(OrderBookWebSocket):
         Returns:
             Standardized orderbook data or None if not an orderbook message
         """
+        updates = self._parse_orderbook_updates(message)
+        return updates[0] if updates else None
+
+    def _parse_orderbook_updates(self, message: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Apply a message to the stored books and return the updated books.
+
+        Handles two message types:
+        1. book - Full orderbook snapshot, resets the asset's book
+        2. price_change - Level deltas applied to the stored books
+
+        Args:
+            message: Raw message from WebSocket
+
+        Returns:
+            Standardized orderbook data for each asset the message changed
+        """
         event_type = message.get("event_type")
 
         if event_type == "book":
-            return self._parse_book_message(message)
+            return [self._parse_book_message(message)]
         elif event_type == "price_change":
             return self._parse_price_change_message(message)
 
-        return None
+        return []
+
+    def _book_snapshot(
+        self, asset_id: str, market_id: str, timestamp: Any, hash_: str
+    ) -> Dict[str, Any]:
+        """Standardized orderbook dict for the stored book of an asset"""
+        book = self._books[asset_id]
+        return {
+            "market_id": market_id,
+            "asset_id": asset_id,
+            "bids": book.bids,
+            "asks": book.asks,
+            "timestamp": timestamp,
+            "hash": hash_,
+        }
 
     def _parse_book_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -170,44 +319,26 @@ class PolymarketWebSocket(OrderBookWebSocket):
         asset_id = message.get("asset_id", "")
         market_id = message.get("market", asset_id)
 
-        # Parse bids and asks
-        bids = []
-        for bid in message.get("bids", []):
-            try:
-                price = float(bid.get("price", 0))
-                size = float(bid.get("size", 0))
-                if price > 0 and size > 0:
-                    bids.append((price, size))
-            except (ValueError, TypeError):
-                continue
-
-        asks = []
-        for ask in message.get("asks", []):
-            try:
-                price = float(ask.get("price", 0))
-                size = float(ask.get("size", 0))
-                if price > 0 and size > 0:
-                    asks.append((price, size))
-            except (ValueError, TypeError):
-                continue
+        self._books[asset_id] = L2Book(message.get("bids", []), message.get("asks", []))
 
-        # Sort bids descending, asks ascending
-        bids.sort(reverse=True)
-        asks.sort()
+        # A full snapshot puts the book back in sync; buffered deltas are obsolete
+        state = self._state(asset_id, market_id)
+        state.timestamp = _timestamp_ms(message.get("timestamp"))
+        state.received_at = time.time()
+        state.stale = False
+        state.pending.clear()
 
-        return {
-            "market_id": market_id,
-            "asset_id": asset_id,
-            "bids": bids,
-            "asks": asks,
-            "timestamp": message.get("timestamp", 0),
-            "hash": message.get("hash", ""),
-        }
+        return self._book_snapshot(
+            asset_id, market_id, message.get("timestamp", 0), message.get("hash", "")
+        )
 
-    def _parse_price_change_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
+    def _parse_price_change_message(self, message: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Parse price_change message (incremental updates).
 
+        Each change sets the total size at one price level; size 0 removes
+        the level. Changes are applied in order to the asset's stored book.
+
         Message format:
         {
             "event_type": "price_change",
@@ -226,47 +357,187 @@ class PolymarketWebSocket(OrderBookWebSocket):
         """
         market_id = message.get("market", "")
         timestamp = message.get("timestamp", 0)
+        ts = _timestamp_ms(timestamp)
 
-        price_changes = message.get("price_changes", [])
-        if not price_changes:
-            return None
+        # Latest change per asset carries its hash and the exchange's top of book
+        latest: Dict[str, Dict[str, Any]] = {}
+        for change in message.get("price_changes", []):
+            asset_id = change.get("asset_id", "")
+            if asset_id not in self._books and asset_id not in self.subscribed_assets:
+                continue
+            try:
+                price = float(change.get("price", 0))
+                size = float(change.get("size", 0))
+                side = str(change.get("side", "")).lower()
+                state = self._state(asset_id, market_id or asset_id)
+                if ts and ts < state.timestamp:
+                    # Already reflected in a newer snapshot (e.g. a REST resync)
+                    continue
+                if state.stale:
+                    if state.resyncing:
+                        state.pending.append((ts, side, price, size))
+                    else:
+                        self._schedule_resync(asset_id)
+                    continue
+                self._books[asset_id].apply(side, price, size)
+            except (ValueError, TypeError):
+                continue
+            latest[asset_id] = change
+
+        updates = []
+        for asset_id, change in latest.items():
+            state = self._book_state[asset_id]
+            state.timestamp = max(state.timestamp, ts)
+            if not self._top_matches(self._books[asset_id], change):
+                self._mark_stale(asset_id, "top of book mismatch")
+                self._schedule_resync(asset_id)
+                continue
+            state.received_at = time.time()
+            updates.append(
+                self._book_snapshot(
+                    asset_id, market_id or asset_id, timestamp, change.get("hash", "")
+                )
+            )
+        return updates
+
+    # Book sync: gap detection and REST resync
 
-        # Use first price change (usually one per message)
-        change = price_changes[0]
-        asset_id = change.get("asset_id", "")
+    def _state(self, asset_id: str, market_id: str = "") -> BookSyncState:
+        """Sync state of an asset, created stale (no snapshot yet)"""
+        state = self._book_state.get(asset_id)
+        if state is None:
+            state = self._book_state[asset_id] = BookSyncState(market_id=market_id or asset_id)
+        return state
 
-        # Build orderbook from best bid/ask
-        bids = []
-        asks = []
+    @staticmethod
+    def _top_matches(book: L2Book, change: Dict[str, Any]) -> bool:
+        """
+        Check the local top of book against the best_bid/best_ask a change reports.
 
+        The message hash covers fields the market channel does not send
+        (tick size, min order size), so it cannot be recomputed locally; the
+        reported best prices serve as the checksum instead.
+        """
+        for key, local in (("best_bid", book.best_bid), ("best_ask", book.best_ask)):
+            reported = change.get(key)
+            if reported in (None, ""):
+                continue
+            try:
+                expected = float(reported)
+            except (TypeError, ValueError):
+                continue
+            if expected <= 0 and local is None:
+                continue
+            if local is None or abs(local - expected) > 1e-9:
+                return False
+        return True
+
+    def _mark_stale(self, asset_id: str, reason: str) -> None:
+        state = self._state(asset_id)
+        if not state.stale:
+            logger.debug(f"Orderbook for {asset_id} out of sync: {reason}")
+        state.stale = True
+
+    def _schedule_resync(self, asset_id: str) -> None:
+        """Start a background REST resync for an asset unless one is running"""
+        state = self._state(asset_id)
+        if state.resyncing or not self.resync_books or self.exchange is None:
+            return
         try:
-            best_bid = change.get("best_bid")
-            best_ask = change.get("best_ask")
-
-            if best_bid:
-                price = float(best_bid)
-                if price > 0:
-                    # We don't get size from price_change, use placeholder
-                    bids.append((price, 0.0))
-
-            if best_ask:
-                price = float(best_ask)
-                if price > 0:
-                    asks.append((price, 0.0))
-        except (ValueError, TypeError):
-            pass
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        state.resyncing = True
+        self.tasks.append(loop.create_task(self._resync(asset_id)))
 
-        return {
-            "market_id": market_id,
-            "asset_id": asset_id,
-            "bids": bids,
-            "asks": asks,
-            "timestamp": timestamp,
-            "hash": change.get("hash", ""),
-            "side": change.get("side"),
-            "price": float(change.get("price", 0)) if change.get("price") else None,
-            "size": float(change.get("size", 0)) if change.get("size") else None,
-        }
+    async def _resync(self, asset_id: str) -> None:
+        """
+        Fetch a REST snapshot and swap it in for a stale book.
+
+        Deltas buffered while the request was in flight are replayed on top
+        of the snapshot if they are newer than it. The swap is skipped when a
+        WebSocket snapshot already brought the book back in sync.
+        """
+        state = self._state(asset_id)
+        try:
+            loop = asyncio.get_running_loop()
+            snapshot = await loop.run_in_executor(None, self.exchange.get_orderbook, asset_id)
+        except Exception as e:
+            logger.debug(f"Orderbook resync failed for {asset_id}: {e}")
+            snapshot = None
+        finally:
+            state.resyncing = False
+
+        # get_orderbook returns an empty dict-like book (no hash) on failure
+        if not snapshot or "hash" not in snapshot:
+            state.pending.clear()
+            return
+        if not state.stale:
+            return
+
+        snapshot_ts = _timestamp_ms(snapshot.get("timestamp"))
+        book = L2Book(snapshot.get("bids", []), snapshot.get("asks", []))
+        latest_ts = snapshot_ts
+        for ts, side, price, size in state.pending:
+            if ts > snapshot_ts:
+                book.apply(side, price, size)
+                latest_ts = max(latest_ts, ts)
+        state.pending.clear()
+
+        self._books[asset_id] = book
+        state.timestamp = latest_ts
+        state.received_at = time.time()
+        state.stale = False
+        state.resyncs += 1
+
+        await self._dispatch(
+            self._book_snapshot(asset_id, state.market_id, latest_ts, snapshot.get("hash", ""))
+        )
+
+    async def _on_reconnect(self):
+        """Deltas sent while disconnected are lost: resync every subscribed book"""
+        for asset_id in self.subscribed_assets:
+            self._mark_stale(asset_id, "reconnected")
+            self._schedule_resync(asset_id)
+
+    def resync_count(self, asset_id: str) -> int:
+        """Number of REST resyncs performed for an asset's book."""
+        state = self._book_state.get(asset_id)
+        return state.resyncs if state else 0
+
+    @property
+    def resync_counts(self) -> Dict[str, int]:
+        """REST resyncs performed per asset."""
+        return {asset_id: state.resyncs for asset_id, state in self._book_state.items()}
+
+    def is_book_fresh(self, asset_id: str, max_age_ms: float) -> bool:
+        """
+        Check that an asset's book is in sync and was confirmed recently.
+
+        Safe to call from any thread. A book that is in sync but older than
+        ``max_age_ms`` (e.g. a quiet market) gets a background resync so the
+        next call can succeed.
+
+        Args:
+            asset_id: Token ID
+            max_age_ms: Maximum milliseconds since the last update or resync
+
+        Returns:
+            True if the book can be quoted against
+        """
+        state = self._book_state.get(asset_id)
+        if state is None or state.stale:
+            return False
+        if (time.time() - state.received_at) * 1000 <= max_age_ms:
+            return True
+        if self.loop is not None and self.loop.is_running():
+
+            def refresh():
+                self._mark_stale(asset_id, "older than requested age")
+                self._schedule_resync(asset_id)
+
+            self.loop.call_soon_threadsafe(refresh)
+        return False
 
     async def watch_orderbook_by_asset(self, asset_id: str, callback):
         """
@@ -278,7 +549,13 @@ class PolymarketWebSocket(OrderBookWebSocket):
         """
         await self.watch_orderbook(asset_id, callback)
 
-    async def watch_orderbook_by_market(self, market_id: str, asset_ids: list[str], callback=None):
+    async def watch_orderbook_by_market(
+        self,
+        market_id: str,
+        asset_ids: list[str],
+        callback=None,
+        conflate_ms: Optional[float] = None,
+    ) -> Optional[BookSubscription]:
         """
         Subscribe to orderbook updates for a market with multiple assets.
 
@@ -289,26 +566,43 @@ class PolymarketWebSocket(OrderBookWebSocket):
             asset_ids: List of asset (token) IDs for this market
             callback: Optional function to call with orderbook updates.
                      If None, data will be stored in orderbook_manager only.
+            conflate_ms: Call ``callback`` from the manager's thread with only
+                the newest book of each changed asset, at most once per this
+                many ms (default: ``conflate_ms`` config; None calls it on
+                every update)
+
+        Returns:
+            The conflating BookSubscription (``flush()`` delivers on demand),
+            or None when not conflating
         """
+        subscription = None
+        if conflate_ms is None:
+            conflate_ms = self.config.get("conflate_ms")
+        if callback and conflate_ms is not None:
+            subscription = _conflate(
+                self.orderbook_manager,
+                self.book_subscriptions,
+                market_id,
+                asset_ids,
+                callback,
+                conflate_ms,
+            )
+            callback = None
+
         # Store mapping
         for asset_id in asset_ids:
             self.market_to_asset[market_id] = asset_id
+            await self.watch_orderbook(
+                asset_id, _book_callback(self.orderbook_manager, self.exchange, asset_id, callback)
+            )
+        return subscription
 
-            # Create callback that updates manager and exchange mid-price cache
-            def make_callback(tid):
-                def cb(market_id, orderbook):
-                    # Update orderbook manager
-                    self.orderbook_manager.update(tid, orderbook)
-                    # Update exchange mid-price cache
-                    if self.exchange:
-                        self.exchange.update_mid_price_from_orderbook(tid, orderbook)
-                    # Call user callback if provided
-                    if callback:
-                        callback(market_id, orderbook)
-
-                return cb
-
-            await self.watch_orderbook(asset_id, make_callback(asset_id))
+    async def disconnect(self):
+        """Close the connection and any conflating subscriptions"""
+        for subscription in self.book_subscriptions.values():
+            subscription.close()
+        self.book_subscriptions.clear()
+        await super().disconnect()
 
     def get_orderbook_manager(self) -> OrderbookManager:
         """
@@ -327,43 +621,128 @@ class PolymarketWebSocket(OrderBookWebSocket):
         """
         return self.orderbook_manager
 
+    async def _dispatch(self, orderbook: Dict[str, Any]):
+        """Call the subscription callback for an orderbook by asset_id or market_id."""
+        market_id = orderbook.get("market_id")
+        asset_id = orderbook.get("asset_id")
+
+        # Check which key is in subscriptions
+        callback = None
+        callback_key = None
+
+        if asset_id and asset_id in self.subscriptions:
+            callback = self.subscriptions[asset_id]
+            callback_key = asset_id
+        elif market_id and market_id in self.subscriptions:
+            callback = self.subscriptions[market_id]
+            callback_key = market_id
+
+        if callback and callback_key:
+            await self._deliver(callback_key, callback, callback_key, orderbook)
+
     async def _process_message_item(self, data: dict):
         """
         Process a single message item.
         Override to handle both market_id and asset_id lookups.
         """
         try:
-            # Parse orderbook data
-            orderbook = self._parse_orderbook_message(data)
-            if not orderbook:
-                return
-
-            # Try both market_id and asset_id as subscription keys
-            market_id = orderbook.get("market_id")
-            asset_id = orderbook.get("asset_id")
-
-            # Check which key is in subscriptions
-            callback = None
-            callback_key = None
-
-            if asset_id and asset_id in self.subscriptions:
-                callback = self.subscriptions[asset_id]
-                callback_key = asset_id
-            elif market_id and market_id in self.subscriptions:
-                callback = self.subscriptions[market_id]
-                callback_key = market_id
-
-            if callback and callback_key:
-                # Call callback in a non-blocking way
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(callback_key, orderbook)
-                else:
-                    callback(callback_key, orderbook)
+            # Parse orderbook data (one book per asset the message changed)
+            for orderbook in self._parse_orderbook_updates(data):
+                await self._dispatch(orderbook)
         except Exception as e:
             if self.verbose:
                 logger.debug(f"Error processing message item: {e}")
 
 
+class PolymarketWebSocketPool(WebSocketPool):
+    """
+    Polymarket market channel sharded over several connections.
+
+    Every shard is a ``PolymarketWebSocket`` writing into one shared
+    ``OrderbookManager``, so books are read the same way as with a single
+    socket. Use it when subscribing more assets than one connection should
+    carry (``max_assets_per_connection`` config, default 500).
+
+    Example:
+        >>> pool = PolymarketWebSocketPool(exchange=polymarket)
+        >>> for market in markets:
+        ...     await pool.watch_orderbook_by_market(market.id, market.metadata["clobTokenIds"])
+        >>> pool.get_orderbook_manager().get_best_bid_ask(token_id)
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, exchange=None):
+        config = config or {}
+        super().__init__(
+            self._new_shard,
+            max_per_connection=config.get("max_assets_per_connection", 500),
+            verbose=config.get("verbose", False),
+        )
+        self.config = config
+        self.exchange = exchange
+        self.orderbook_manager = OrderbookManager()
+        self.book_subscriptions: Dict[str, BookSubscription] = {}
+
+    def _new_shard(self) -> PolymarketWebSocket:
+        shard = PolymarketWebSocket(self.config, exchange=self.exchange)
+        shard.orderbook_manager = self.orderbook_manager
+        return shard
+
+    async def watch_orderbook_by_market(
+        self,
+        market_id: str,
+        asset_ids: list[str],
+        callback=None,
+        conflate_ms: Optional[float] = None,
+    ) -> Optional[BookSubscription]:
+        """
+        Subscribe to every asset of a market, storing books in the shared manager.
+
+        Args:
+            market_id: Market condition ID
+            asset_ids: List of asset (token) IDs for this market
+            callback: Optional function to call with orderbook updates
+            conflate_ms: See ``PolymarketWebSocket.watch_orderbook_by_market``
+
+        Returns:
+            The conflating BookSubscription, or None when not conflating
+        """
+        subscription = None
+        if conflate_ms is None:
+            conflate_ms = self.config.get("conflate_ms")
+        if callback and conflate_ms is not None:
+            subscription = _conflate(
+                self.orderbook_manager,
+                self.book_subscriptions,
+                market_id,
+                asset_ids,
+                callback,
+                conflate_ms,
+            )
+            callback = None
+
+        for asset_id in asset_ids:
+            await self.watch_orderbook(
+                asset_id, _book_callback(self.orderbook_manager, self.exchange, asset_id, callback)
+            )
+        return subscription
+
+    async def disconnect(self):
+        """Close every shard and conflating subscription."""
+        for subscription in self.book_subscriptions.values():
+            subscription.close()
+        self.book_subscriptions.clear()
+        await super().disconnect()
+
+    def get_orderbook_manager(self) -> OrderbookManager:
+        """Orderbook manager shared by all shards."""
+        return self.orderbook_manager
+
+    def is_book_fresh(self, asset_id: str, max_age_ms: float) -> bool:
+        """Check an asset's book on the shard it is subscribed on."""
+        shard = self.shard_for(asset_id)
+        return shard is not None and shard.is_book_fresh(asset_id, max_age_ms)
+
+
 TradeCallback = Callable[[Trade], None]
 
 
@@ -386,16 +765,19 @@ class PolymarketUserWebSocket:
         api_secret: str,
         api_passphrase: str,
         verbose: bool = False,
+        runtime: Optional[WebSocketRuntime] = None,
     ):
         self.api_key = api_key
         self.api_secret = api_secret
         self.api_passphrase = api_passphrase
         self.verbose = verbose
+        self.runtime = runtime  # None uses WebSocketRuntime.default()
 
         self.ws = None
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._run_future: Optional[concurrent.futures.Future] = None
         self._callbacks: List[TradeCallback] = []
         self._connected = False
 
@@ -525,19 +907,15 @@ class PolymarketUserWebSocket:
                     logger.warning(f"Trade callback error: {e}")
 
     def start(self) -> threading.Thread:
-        """Start WebSocket in background thread"""
+        """Start WebSocket on the shared WebSocketRuntime loop"""
         if self._running:
             return self._thread
 
         self._running = True
-        self._loop = asyncio.new_event_loop()
-
-        def run():
-            asyncio.set_event_loop(self._loop)
-            self._loop.run_until_complete(self._receive_loop())
-
-        self._thread = threading.Thread(target=run, daemon=True)
-        self._thread.start()
+        runtime = self.runtime or WebSocketRuntime.default()
+        self._loop = runtime.loop
+        self._run_future = runtime.submit(self._receive_loop())
+        self._thread = runtime.thread
 
         if self.verbose:
             logger.info("User WebSocket started")
@@ -556,9 +934,14 @@ class PolymarketUserWebSocket:
 
             asyncio.run_coroutine_threadsafe(close(), self._loop)
 
-        if self._thread:
-            self._thread.join(timeout=5)
-            self._thread = None
+        # The runtime thread is shared, so wait for this socket's task only
+        if self._run_future is not None:
+            try:
+                self._run_future.result(timeout=5)
+            except Exception:
+                self._run_future.cancel()
+            self._run_future = None
+        self._thread = None
 
         if self.verbose:
             logger.info("User WebSocket stopped")
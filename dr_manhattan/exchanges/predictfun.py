@@ -27,9 +27,12 @@ from ..base.errors import (
     RateLimitError,
 )
 from ..base.exchange import Exchange
+from ..base.rate_limiter import parse_retry_after
 from ..models.market import Market
 from ..models.order import Order, OrderSide, OrderStatus
+from ..models.orderbook import complement_levels
 from ..models.position import Position
+from .predictfun_async import AsyncPredictFun
 
 __all__ = ["PredictFun"]
 
@@ -160,7 +163,7 @@ class PredictFun(Exchange):
             self._usdt_address = USDT_ADDRESS_MAINNET
             self._rpc_url = BNB_RPC_MAINNET
 
-        self._session = requests.Session()
+        self._session = self._http
         self._account = None
         self._address = None
         self._owner_account = None  # Smart wallet owner account for signing
@@ -359,7 +362,10 @@ class PredictFun(Exchange):
                     )
 
                 if response.status_code == 429:
-                    raise RateLimitError("Rate limited")
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    raise RateLimitError(
+                        f"Rate limited. Retry after {retry_after}s", retry_after=retry_after
+                    )
 
                 if response.status_code == 401:
                     # Try to get error message from response body
@@ -892,42 +898,7 @@ class PredictFun(Exchange):
         def _fetch():
             try:
                 response = self._request("GET", f"/v1/markets/{market_id}/orderbook")
-                data = response.get("data", {})
-
-                raw_bids = data.get("bids", [])
-                raw_asks = data.get("asks", [])
-
-                bids = []
-                asks = []
-
-                if is_second_outcome:
-                    # For second outcome (No), invert prices: No bid = 1 - Yes ask
-                    for entry in raw_asks:
-                        if len(entry) >= 2:
-                            inverted_price = 1.0 - float(entry[0])
-                            if inverted_price > 0:
-                                bids.append({"price": str(inverted_price), "size": str(entry[1])})
-
-                    for entry in raw_bids:
-                        if len(entry) >= 2:
-                            inverted_price = 1.0 - float(entry[0])
-                            if inverted_price > 0:
-                                asks.append({"price": str(inverted_price), "size": str(entry[1])})
-                else:
-                    # First outcome (Yes) - use as-is
-                    for entry in raw_bids:
-                        if len(entry) >= 2:
-                            bids.append({"price": str(entry[0]), "size": str(entry[1])})
-
-                    for entry in raw_asks:
-                        if len(entry) >= 2:
-                            asks.append({"price": str(entry[0]), "size": str(entry[1])})
-
-                # Sort: bids descending, asks ascending
-                bids.sort(key=lambda x: float(x["price"]), reverse=True)
-                asks.sort(key=lambda x: float(x["price"]))
-
-                return {"bids": bids, "asks": asks}
+                return self._parse_orderbook_response(response, is_second_outcome)
             except Exception as e:
                 if self.verbose:
                     print(f"Failed to fetch orderbook for {market_id}: {e}")
@@ -935,6 +906,43 @@ class PredictFun(Exchange):
 
         return _fetch()
 
+    @staticmethod
+    def _parse_orderbook_response(
+        response: Dict[str, Any], is_second_outcome: bool
+    ) -> Dict[str, Any]:
+        """
+        Normalize a /v1/markets/{id}/orderbook response.
+
+        Args:
+            response: Raw API response
+            is_second_outcome: Invert the first-outcome book (No token)
+
+        Returns:
+            Dictionary with sorted 'bids' and 'asks' arrays
+        """
+        data = response.get("data", {})
+
+        raw_bids = data.get("bids", [])
+        raw_asks = data.get("asks", [])
+
+        bids = [
+            {"price": str(entry[0]), "size": str(entry[1])} for entry in raw_bids if len(entry) >= 2
+        ]
+        asks = [
+            {"price": str(entry[0]), "size": str(entry[1])} for entry in raw_asks if len(entry) >= 2
+        ]
+
+        # Sort: bids descending, asks ascending
+        bids.sort(key=lambda x: float(x["price"]), reverse=True)
+        asks.sort(key=lambda x: float(x["price"]))
+
+        if is_second_outcome:
+            # For second outcome (No), map the first-outcome book: No bid = 1 - Yes ask.
+            # Inversion reverses price order, so no re-sort is needed.
+            return {"bids": complement_levels(asks), "asks": complement_levels(bids)}
+
+        return {"bids": bids, "asks": asks}
+
     def _is_second_outcome_token(self, token_id: str, market_id: str) -> bool:
         """Check if token_id is the second outcome (No) for a binary market."""
         # Use the cached index mapping (0=Yes, 1=No)
@@ -1520,6 +1528,18 @@ class PredictFun(Exchange):
         """Get the wallet address."""
         return self._address
 
+    def to_async(self) -> AsyncPredictFun:
+        """
+        Get the native asyncio counterpart of this exchange.
+
+        Markets and orderbooks are fetched natively over aiohttp; order signing
+        and on-chain balance queries run in a worker thread.
+
+        Returns:
+            AsyncPredictFun sharing this instance's config and caches
+        """
+        return AsyncPredictFun(self)
+
     def describe(self) -> Dict[str, Any]:
         """Return exchange metadata and capabilities."""
         return {
@@ -1548,4 +1568,5 @@ class PredictFun(Exchange):
                     "PREDICTFUN_SMART_WALLET_OWNER_PRIVATE_KEY and PREDICTFUN_SMART_WALLET_ADDRESS."
                 ),
             },
+            "resilience": self.resilience_stats(),
         }
@@ -0,0 +1,105 @@
+"""
+Async Predict.fun exchange.
+
+Native asyncio implementation of the Predict.fun read paths (markets and
+orderbooks) on the pooled aiohttp transport. Order signing and on-chain
+balance queries run in a worker thread.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ..base.async_exchange import AsyncExchange
+from ..base.async_http import AsyncResponse
+from ..base.errors import AuthenticationError, ExchangeError, MarketNotFound
+from ..models.market import Market
+
+if TYPE_CHECKING:
+    from .predictfun import PredictFun
+
+
+class AsyncPredictFun(AsyncExchange):
+    """Async Predict.fun exchange sharing state with a sync PredictFun instance"""
+
+    exchange: "PredictFun"
+
+    def _raise_for_status(self, response: AsyncResponse, endpoint: str) -> None:
+        if response.status_code == 401:
+            raise AuthenticationError(
+                "API key required. Predict.fun requires api_key for all API calls."
+            )
+        super()._raise_for_status(response, endpoint)
+
+    async def _api_request(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        result = await self._request_json(
+            "GET",
+            f"{self.exchange.host}{endpoint}",
+            params=params,
+            headers=self.exchange._get_headers(),
+            endpoint=endpoint,
+        )
+        # API returns {"success": false, "message": "..."} for errors
+        if isinstance(result, dict) and result.get("success") is False:
+            error_msg = result.get("message", "Unknown error")
+            if "invalid api key" in error_msg.lower():
+                raise AuthenticationError(f"Invalid API key: {error_msg}")
+            raise ExchangeError(f"API error: {error_msg}")
+        return result
+
+    async def fetch_markets(self, params: Optional[Dict[str, Any]] = None) -> List[Market]:
+        """Fetch markets with cursor pagination, as in PredictFun.fetch_markets"""
+        query_params = params or {}
+        limit = query_params.get("limit", 100)
+        max_pages = 10 if query_params.get("all", False) else 1
+
+        all_markets: List[Market] = []
+        cursor = None
+
+        for _ in range(max_pages):
+            api_params: Dict[str, Any] = {"first": min(limit, 100)}
+            if cursor:
+                api_params["after"] = cursor
+
+            response = await self._api_request("/v1/markets", params=api_params)
+
+            markets_data = response if isinstance(response, list) else response.get("data", [])
+            all_markets.extend(self.exchange._parse_market(m) for m in markets_data)
+
+            cursor = response.get("cursor") if isinstance(response, dict) else None
+            if not cursor or len(markets_data) < 100:
+                break
+
+        if query_params.get("active", True):
+            all_markets = [m for m in all_markets if not m.metadata.get("closed")]
+
+        if limit and len(all_markets) > limit:
+            all_markets = all_markets[:limit]
+
+        return all_markets
+
+    async def fetch_market(self, market_id: str) -> Market:
+        """Fetch a specific market by ID"""
+        try:
+            response = await self._api_request(f"/v1/markets/{market_id}")
+        except ExchangeError as e:
+            if "not found" in str(e).lower():
+                raise MarketNotFound(f"Market {market_id} not found")
+            raise
+        return self.exchange._parse_market(response.get("data", response))
+
+    async def get_orderbook(self, market_id_or_token_id: str) -> Dict[str, Any]:
+        """Fetch orderbook for a market or token (second outcome is inverted)"""
+        exchange = self.exchange
+        market_id = market_id_or_token_id
+        is_second_outcome = False
+
+        if market_id_or_token_id in exchange._token_to_market:
+            market_id = exchange._token_to_market[market_id_or_token_id]
+            is_second_outcome = exchange._is_second_outcome_token(market_id_or_token_id, market_id)
+
+        try:
+            response = await self._api_request(f"/v1/markets/{market_id}/orderbook")
+            return exchange._parse_orderbook_response(response, is_second_outcome)
+        except Exception as e:
+            if self.verbose:
+                print(f"Failed to fetch orderbook for {market_id}: {e}")
+            return {"bids": [], "asks": []}
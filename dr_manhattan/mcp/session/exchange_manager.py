@@ -22,6 +22,9 @@ DEFAULT_SIGNATURE_TYPE = 0  # EOA (normal MetaMask accounts)
 # which corrupts the JSON-RPC protocol. The checkmarks (✓) and debug info
 # from polymarket.py would break Claude Desktop's message parsing.
 DEFAULT_VERBOSE = False
+# Concurrent tool calls often ask for the same market/orderbook/balance;
+# share one in-flight request between them
+DEFAULT_COALESCE_REQUESTS = True
 
 
 def _run_with_timeout(func, args=(), kwargs=None, timeout=10.0, description="operation"):
@@ -96,6 +99,7 @@ def _get_mcp_credentials() -> Dict[str, Dict[str, Any]]:
             # Defaults in code per CLAUDE.md Rule #4
             "signature_type": _get_polymarket_signature_type(),
             "verbose": DEFAULT_VERBOSE,
+            "coalesce_requests": DEFAULT_COALESCE_REQUESTS,
         }
         # Note: Opinion and Limitless are supported but use the base project's
         # credential loading (create_exchange with use_env=True) since they
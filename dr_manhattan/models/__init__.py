@@ -2,7 +2,7 @@ from .crypto_hourly import CryptoHourlyMarket
 from .market import ExchangeOutcomeRef, Market, OutcomeRef, OutcomeToken
 from .nav import NAV, PositionBreakdown
 from .order import Order, OrderSide, OrderStatus
-from .orderbook import Orderbook, PriceLevel
+from .orderbook import ArrayOrderbook, BookSnapshot, BookSubscription, Orderbook, PriceLevel
 from .position import Position
 
 __all__ = [
@@ -14,6 +14,9 @@ __all__ = [
     "OrderSide",
     "OrderStatus",
     "Orderbook",
+    "ArrayOrderbook",
+    "BookSnapshot",
+    "BookSubscription",
     "PriceLevel",
     "Position",
     "CryptoHourlyMarket",
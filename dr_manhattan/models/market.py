@@ -1,6 +1,7 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 # Readable market ID as a path-like list:
 # - ["61"] for simple ID (Opinion)
@@ -54,9 +55,55 @@ class ExchangeOutcomeRef:
         return OutcomeRef(market_id=self.market_path[0], outcome=self.outcome)
 
 
-@dataclass
+# Metadata keys kept by Market.compact(): the ones library code reads
+COMPACT_METADATA_KEYS = (
+    "clobTokenIds",
+    "token_ids",
+    "tokens",
+    "closed",
+    "readable_id",
+    "match_id",
+    "slug",
+    "category",
+    "categories",
+    "tags",
+    "topics",
+    "description",
+    "minimum_tick_size",
+    "conditionId",
+    "condition_id",
+    "isNegRisk",
+    "feeRateBps",
+    "venue",
+    "markets",
+    "isYieldBearing",
+    "updatedAt",
+)
+
+
+def _promoted_token_ids(metadata: Dict[str, Any]) -> List[str]:
+    """Token IDs from the metadata keys exchanges populate"""
+    for key in ("clobTokenIds", "token_ids"):
+        raw = metadata.get(key)
+        if isinstance(raw, list) and raw:
+            token_ids = [
+                str(item.get("token_id", "")) if isinstance(item, dict) else str(item)
+                for item in raw
+            ]
+            return [sys.intern(token_id) for token_id in token_ids if token_id]
+    return []
+
+
+@dataclass(slots=True)
 class Market:
-    """Represents a prediction market"""
+    """
+    Represents a prediction market
+
+    ``token_ids`` and ``condition_id`` are promoted out of ``metadata``
+    (taken from ``clobTokenIds``/``token_ids`` and ``conditionId``/
+    ``condition_id`` when not given). Outcome names are interned, since the
+    same few strings repeat across every market.
+    """
 
     id: str
     question: str
@@ -68,11 +115,46 @@ class Market:
     metadata: Dict[str, Any]
     tick_size: float
     description: str = ""  # Resolution criteria
+    token_ids: List[str] = field(default_factory=list)
+    condition_id: str = ""
 
     def __post_init__(self):
         for outcome, price in self.prices.items():
             if not (0 <= price <= 1):
                 raise ValueError(f"Price for '{outcome}' must be between 0 and 1, got {price}")
+        self.outcomes = [
+            sys.intern(outcome) if isinstance(outcome, str) else outcome
+            for outcome in self.outcomes
+        ]
+        if self.prices:
+            self.prices = {
+                sys.intern(outcome) if isinstance(outcome, str) else outcome: price
+                for outcome, price in self.prices.items()
+            }
+        if self.metadata:
+            if not self.token_ids:
+                self.token_ids = _promoted_token_ids(self.metadata)
+            if not self.condition_id:
+                self.condition_id = str(
+                    self.metadata.get("conditionId") or self.metadata.get("condition_id") or ""
+                )
+
+    def compact(self, keep: Iterable[str] = COMPACT_METADATA_KEYS) -> "Market":
+        """
+        Drop the raw API payload from ``metadata``, keeping only ``keep`` keys.
+
+        Exchanges copy the full response into metadata; most of it is never
+        read again. Enable ``compact_markets`` in the exchange config to
+        apply this to every parsed market.
+
+        Args:
+            keep: Metadata keys to retain
+
+        Returns:
+            This market (modified in place)
+        """
+        self.metadata = {key: self.metadata[key] for key in keep if key in self.metadata}
+        return self
 
     @property
     def readable_id(self) -> ReadableMarketId:
@@ -1,11 +1,125 @@
+import bisect
+import logging
+import threading
+import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from .order import OrderSide
+
+logger = logging.getLogger(__name__)
 
 # Price level: (price, size)
 PriceLevel = Tuple[float, float]
 
 
-@dataclass
+def parse_price_levels(entries: Iterable[Any]) -> List[PriceLevel]:
+    """
+    Parse raw orderbook levels, dropping malformed and empty ones.
+
+    Accepts dict levels ({"price": "0.5", "size": "100"}) and
+    (price, size) pairs. The result keeps the input order.
+    """
+    levels: List[PriceLevel] = []
+    for entry in entries or []:
+        try:
+            if isinstance(entry, dict):
+                price = float(entry.get("price", 0))
+                size = float(entry.get("size", 0))
+            else:
+                price = float(entry[0])
+                size = float(entry[1])
+        except (ValueError, TypeError, IndexError):
+            continue
+        if price > 0 and size > 0:
+            levels.append((price, size))
+    return levels
+
+
+# Decimals kept when mapping a price to the complementary binary outcome
+COMPLEMENT_DECIMALS = 6
+
+
+def complement_price(price: float) -> float:
+    """Price of the complementary binary outcome (1 - price, float noise removed)."""
+    return round(1.0 - price, COMPLEMENT_DECIMALS)
+
+
+def complement_levels(levels: Iterable[Any]) -> List[Any]:
+    """
+    Map one sorted side of a binary book onto the complementary outcome.
+
+    Yes asks become No bids and Yes bids become No asks. Inversion
+    reverses price order, so ascending asks map straight to descending
+    bids (and vice versa) without re-sorting. Dict levels keep string
+    prices; levels whose complement is not positive are dropped.
+
+    Args:
+        levels: Dict levels ({"price": "0.52", "size": "10"}) or (price, size) pairs
+
+    Returns:
+        Complementary levels in the same format
+    """
+    result: List[Any] = []
+    for level in levels:
+        if isinstance(level, dict):
+            price = complement_price(float(level["price"]))
+            if price > 0:
+                result.append({"price": str(price), "size": level["size"]})
+        else:
+            price = complement_price(level[0])
+            if price > 0:
+                result.append((price, level[1]))
+    return result
+
+
+class ComplementLevels(Sequence):
+    """
+    Lazy view of one side of a binary book as seen from the other outcome.
+
+    Wraps the opposite side of the source book (asks for a bids view) and
+    maps each price to ``1 - price`` on access. Nothing is copied or
+    re-sorted when the source book changes.
+    """
+
+    __slots__ = ("_levels",)
+
+    def __init__(self, levels: Sequence[PriceLevel]):
+        self._levels = levels
+
+    def __len__(self) -> int:
+        return len(self._levels)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [(complement_price(p), size) for p, size in self._levels[index]]
+        price, size = self._levels[index]
+        return (complement_price(price), size)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"ComplementLevels({list(self)!r})"
+
+
+@dataclass(slots=True)
 class Orderbook:
     """Normalized orderbook data structure."""
 
@@ -46,26 +160,8 @@ class Orderbook:
 
         REST format: {"bids": [{"price": "0.5", "size": "100"}, ...], "asks": [...]}
         """
-        bids: List[PriceLevel] = []
-        asks: List[PriceLevel] = []
-
-        for bid in data.get("bids", []):
-            try:
-                price = float(bid.get("price", 0))
-                size = float(bid.get("size", 0))
-                if price > 0 and size > 0:
-                    bids.append((price, size))
-            except (ValueError, TypeError):
-                continue
-
-        for ask in data.get("asks", []):
-            try:
-                price = float(ask.get("price", 0))
-                size = float(ask.get("size", 0))
-                if price > 0 and size > 0:
-                    asks.append((price, size))
-            except (ValueError, TypeError):
-                continue
+        bids = parse_price_levels(data.get("bids", []))
+        asks = parse_price_levels(data.get("asks", []))
 
         # Sort: bids descending, asks ascending
         bids.sort(reverse=True)
@@ -73,6 +169,16 @@ class Orderbook:
 
         return cls(bids=bids, asks=asks, asset_id=token_id)
 
+    def to_arrays(self) -> "ArrayOrderbook":
+        """Convert to an array-backed book for depth queries."""
+        return ArrayOrderbook.from_levels(
+            self.bids,
+            self.asks,
+            timestamp=self.timestamp,
+            asset_id=self.asset_id,
+            market_id=self.market_id,
+        )
+
     def to_dict(self) -> dict:
         """Convert to dict format for OrderbookManager compatibility."""
         return {
@@ -84,43 +190,683 @@ class Orderbook:
         }
 
 
+def _is_buy(side: Union[OrderSide, str]) -> bool:
+    """True for BUY, False for SELL (accepts OrderSide or case-insensitive strings)"""
+    value = side.value if isinstance(side, OrderSide) else str(side).lower()
+    if value not in (OrderSide.BUY.value, OrderSide.SELL.value):
+        raise ValueError(f"Invalid order side: {side}")
+    return value == OrderSide.BUY.value
+
+
+def _empty() -> np.ndarray:
+    return np.empty(0, dtype=np.float64)
+
+
+def _level_arrays(levels: Iterable[Any], descending: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorted price and size arrays of one book side"""
+    parsed = parse_price_levels(levels)
+    if not parsed:
+        return _empty(), _empty()
+    data = np.asarray(parsed, dtype=np.float64)
+    order = np.argsort(-data[:, 0] if descending else data[:, 0], kind="stable")
+    data = data[order]
+    return np.ascontiguousarray(data[:, 0]), np.ascontiguousarray(data[:, 1])
+
+
+@dataclass(slots=True)
+class ArrayOrderbook:
+    """
+    Orderbook held as NumPy price/size arrays per side.
+
+    Bids are sorted descending and asks ascending, so index 0 is the top of
+    book. Depth queries take the side of the order being placed: a BUY walks
+    the asks and a SELL walks the bids.
+
+    Example:
+        >>> book = ArrayOrderbook.from_rest_response(client.get_orderbook(token_id))
+        >>> book.vwap(OrderSide.SELL, 250)  # average price selling 250 shares
+        >>> book.slippage(OrderSide.BUY, 100)  # cost above the best ask
+    """
+
+    bid_prices: np.ndarray = field(default_factory=_empty)
+    bid_sizes: np.ndarray = field(default_factory=_empty)
+    ask_prices: np.ndarray = field(default_factory=_empty)
+    ask_sizes: np.ndarray = field(default_factory=_empty)
+    timestamp: int = 0
+    asset_id: str = ""
+    market_id: str = ""
+
+    @classmethod
+    def from_levels(
+        cls,
+        bids: Iterable[Any],
+        asks: Iterable[Any],
+        timestamp: int = 0,
+        asset_id: str = "",
+        market_id: str = "",
+    ) -> "ArrayOrderbook":
+        """
+        Build a book from raw or parsed levels in any order.
+
+        Args:
+            bids: Bid levels as dicts or (price, size) pairs
+            asks: Ask levels as dicts or (price, size) pairs
+            timestamp: Book timestamp
+            asset_id: Token ID
+            market_id: Market ID
+
+        Returns:
+            ArrayOrderbook with sorted sides
+        """
+        bid_prices, bid_sizes = _level_arrays(bids, descending=True)
+        ask_prices, ask_sizes = _level_arrays(asks, descending=False)
+        return cls(
+            bid_prices=bid_prices,
+            bid_sizes=bid_sizes,
+            ask_prices=ask_prices,
+            ask_sizes=ask_sizes,
+            timestamp=timestamp,
+            asset_id=asset_id,
+            market_id=market_id,
+        )
+
+    @classmethod
+    def from_rest_response(cls, data: Mapping[str, Any], token_id: str = "") -> "ArrayOrderbook":
+        """Create from a REST orderbook response (same format as Orderbook)."""
+        return cls.from_levels(data.get("bids", []), data.get("asks", []), asset_id=token_id)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ArrayOrderbook":
+        """Create from the dict format stored by OrderbookManager and WebSocket parsers."""
+        return cls.from_levels(
+            data.get("bids", []),
+            data.get("asks", []),
+            timestamp=data.get("timestamp") or 0,
+            asset_id=data.get("asset_id", ""),
+            market_id=data.get("market_id", ""),
+        )
+
+    def to_orderbook(self) -> Orderbook:
+        """Convert back to a list-based Orderbook."""
+        return Orderbook(
+            bids=list(zip(self.bid_prices.tolist(), self.bid_sizes.tolist())),
+            asks=list(zip(self.ask_prices.tolist(), self.ask_sizes.tolist())),
+            timestamp=self.timestamp,
+            asset_id=self.asset_id,
+            market_id=self.market_id,
+        )
+
+    @property
+    def best_bid(self) -> float | None:
+        """Get best bid price."""
+        return float(self.bid_prices[0]) if self.bid_prices.size else None
+
+    @property
+    def best_ask(self) -> float | None:
+        """Get best ask price."""
+        return float(self.ask_prices[0]) if self.ask_prices.size else None
+
+    @property
+    def mid_price(self) -> float | None:
+        """Get mid price."""
+        if self.best_bid is None or self.best_ask is None:
+            return None
+        return (self.best_bid + self.best_ask) / 2
+
+    @property
+    def spread(self) -> float | None:
+        """Get bid-ask spread."""
+        if self.best_bid is None or self.best_ask is None:
+            return None
+        return self.best_ask - self.best_bid
+
+    def _levels(self, side: Union[OrderSide, str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Price and size arrays an order on ``side`` trades against"""
+        if _is_buy(side):
+            return self.ask_prices, self.ask_sizes
+        return self.bid_prices, self.bid_sizes
+
+    def _fill(
+        self, side: Union[OrderSide, str], size: float
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Prices and sizes taken from each level to fill ``size``, or None if too thin"""
+        prices, sizes = self._levels(side)
+        if size <= 0 or not sizes.size:
+            return None
+        cumulative = np.cumsum(sizes)
+        if cumulative[-1] < size:
+            return None
+        last = int(np.searchsorted(cumulative, size))
+        taken = sizes[: last + 1].copy()
+        taken[last] -= cumulative[last] - size
+        return prices[: last + 1], taken
+
+    def cumulative_depth(self, side: Union[OrderSide, str]) -> np.ndarray:
+        """
+        Running size available to an order, level by level.
+
+        Args:
+            side: Side of the order (BUY walks asks, SELL walks bids)
+
+        Returns:
+            Array where element i is the total size of the first i+1 levels
+        """
+        return np.cumsum(self._levels(side)[1])
+
+    def depth_at(self, side: Union[OrderSide, str], price: float) -> float:
+        """
+        Size an order could fill at ``price`` or better.
+
+        Args:
+            side: Side of the order
+            price: Limit price
+
+        Returns:
+            Total size of the levels priced at or better than ``price``
+        """
+        prices, sizes = self._levels(side)
+        mask = prices <= price if _is_buy(side) else prices >= price
+        return float(sizes[mask].sum())
+
+    def vwap(self, side: Union[OrderSide, str], size: float) -> Optional[float]:
+        """
+        Volume-weighted average price of filling ``size`` against the book.
+
+        Args:
+            side: Side of the order
+            size: Order size
+
+        Returns:
+            Average fill price, or None if the book is too thin
+        """
+        fill = self._fill(side, size)
+        if fill is None:
+            return None
+        prices, taken = fill
+        return float(np.dot(prices, taken) / size)
+
+    def fill_price(self, side: Union[OrderSide, str], size: float) -> Optional[float]:
+        """
+        Worst price reached when filling ``size`` (the limit price that clears it).
+
+        Args:
+            side: Side of the order
+            size: Order size
+
+        Returns:
+            Price of the last level touched, or None if the book is too thin
+        """
+        fill = self._fill(side, size)
+        if fill is None:
+            return None
+        return float(fill[0][-1])
+
+    def slippage(self, side: Union[OrderSide, str], size: float) -> Optional[float]:
+        """
+        Price cost of filling ``size`` compared with the top of book.
+
+        Args:
+            side: Side of the order
+            size: Order size
+
+        Returns:
+            Non-negative distance between the VWAP and the best price,
+            or None if the book is too thin
+        """
+        average = self.vwap(side, size)
+        if average is None:
+            return None
+        best = float(self._levels(side)[0][0])
+        return abs(average - best)
+
+    def imbalance(self, levels: Optional[int] = None) -> Optional[float]:
+        """
+        Bid/ask size imbalance over the top ``levels`` of each side.
+
+        Args:
+            levels: Levels per side to include (all if None)
+
+        Returns:
+            (bid size - ask size) / (bid size + ask size) in [-1, 1],
+            or None if the book is empty
+        """
+        bid_size = float(self.bid_sizes[:levels].sum())
+        ask_size = float(self.ask_sizes[:levels].sum())
+        total = bid_size + ask_size
+        if total <= 0:
+            return None
+        return (bid_size - ask_size) / total
+
+
+class L2Book:
+    """
+    Mutable price-level book for applying incremental updates.
+
+    Sizes are kept in a dict per side and prices in a sorted list, so a
+    level update costs a dict write plus a bisect insert/delete instead of
+    re-sorting the whole side. Bid prices are stored negated so both lists
+    sort ascending from the top of book.
+    """
+
+    __slots__ = ("_bids", "_asks", "_bid_keys", "_ask_keys")
+
+    def __init__(self, bids: Iterable[Any] = (), asks: Iterable[Any] = ()):
+        self._bids: Dict[float, float] = {}
+        self._asks: Dict[float, float] = {}
+        self._bid_keys: List[float] = []
+        self._ask_keys: List[float] = []
+        self.reset(bids, asks)
+
+    def reset(self, bids: Iterable[Any] = (), asks: Iterable[Any] = ()) -> None:
+        """Replace the book with a full snapshot."""
+        self._bids = dict(parse_price_levels(bids))
+        self._asks = dict(parse_price_levels(asks))
+        self._bid_keys = sorted(-price for price in self._bids)
+        self._ask_keys = sorted(self._asks)
+
+    def apply(self, side: Union[OrderSide, str], price: float, size: float) -> None:
+        """
+        Set the size of one level; a zero size removes it.
+
+        Args:
+            side: BUY updates bids, SELL updates asks
+            price: Level price
+            size: New total size at the level
+        """
+        if _is_buy(side):
+            levels, keys, key = self._bids, self._bid_keys, -price
+        else:
+            levels, keys, key = self._asks, self._ask_keys, price
+
+        if size > 0:
+            if price not in levels:
+                bisect.insort(keys, key)
+            levels[price] = size
+        elif price in levels:
+            del levels[price]
+            del keys[bisect.bisect_left(keys, key)]
+
+    @property
+    def best_bid(self) -> float | None:
+        """Get best bid price."""
+        return -self._bid_keys[0] if self._bid_keys else None
+
+    @property
+    def best_ask(self) -> float | None:
+        """Get best ask price."""
+        return self._ask_keys[0] if self._ask_keys else None
+
+    @property
+    def bids(self) -> List[PriceLevel]:
+        """Bid levels, sorted descending by price."""
+        return [(-key, self._bids[-key]) for key in self._bid_keys]
+
+    @property
+    def asks(self) -> List[PriceLevel]:
+        """Ask levels, sorted ascending by price."""
+        return [(key, self._asks[key]) for key in self._ask_keys]
+
+
+@dataclass(frozen=True, slots=True)
+class BookSnapshot:
+    """
+    Immutable orderbook for one token as of one OrderbookManager update.
+
+    Bids and asks always come from the same update. ``version`` increases
+    with every update the manager applies, so a consumer can skip a book
+    whose version it has already processed.
+    """
+
+    token_id: str
+    bids: Sequence[PriceLevel]  # Sorted descending by price
+    asks: Sequence[PriceLevel]  # Sorted ascending by price
+    version: int
+    updated_at: float  # Local time.time() of the update
+    fields: Mapping[str, Any] = field(default_factory=dict)  # Other keys of the update
+
+    @property
+    def best_bid(self) -> float | None:
+        """Get best bid price."""
+        return self.bids[0][0] if self.bids else None
+
+    @property
+    def best_ask(self) -> float | None:
+        """Get best ask price."""
+        return self.asks[0][0] if self.asks else None
+
+    @property
+    def mid_price(self) -> float | None:
+        """Get mid price."""
+        if self.best_bid is None or self.best_ask is None:
+            return None
+        return (self.best_bid + self.best_ask) / 2
+
+    @property
+    def has_data(self) -> bool:
+        """True if both sides have at least one level."""
+        return bool(self.bids) and bool(self.asks)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Mutable copy in the dict format the manager was updated with."""
+        return {**self.fields, "bids": list(self.bids), "asks": list(self.asks)}
+
+    def to_arrays(self) -> ArrayOrderbook:
+        """Convert to an array-backed book for depth queries."""
+        return ArrayOrderbook.from_dict(self.to_dict())
+
+
+class BookSubscription:
+    """
+    Conflating subscription to an OrderbookManager.
+
+    Updates only mark their token as changed. The subscriber sees the newest
+    snapshot of every changed token, either on demand (``poll``/``flush``)
+    or through ``callback``, which the manager fires at most once every
+    ``interval_ms`` no matter how many updates arrived in between.
+
+    Example:
+        >>> sub = manager.subscribe(on_books, token_ids=[yes, no], interval_ms=250)
+        >>> sub.flush()  # deliver pending changes now
+        >>> sub.close()
+    """
+
+    def __init__(
+        self,
+        manager: "OrderbookManager",
+        callback: Optional[Callable[[Dict[str, "BookSnapshot"]], None]] = None,
+        token_ids: Optional[Iterable[str]] = None,
+        interval_ms: float = 100.0,
+    ):
+        """
+        Initialize subscription (use ``OrderbookManager.subscribe``).
+
+        Args:
+            manager: Manager publishing the books
+            callback: Function called with {token_id: snapshot} of changed tokens
+            token_ids: Tokens to follow (None follows every token)
+            interval_ms: Minimum milliseconds between two callback calls
+        """
+        self.manager = manager
+        self.callback = callback
+        self.token_ids = frozenset(token_ids) if token_ids is not None else None
+        self.interval = max(0.0, interval_ms) / 1000
+        self.updates = 0  # Updates marked since creation
+        self.deliveries = 0  # Callback calls (or non-empty polls)
+        self.last_delivery = 0.0
+        self._dirty: Dict[str, None] = {}  # Insertion-ordered set
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Tokens changed since the last delivery."""
+        return len(self._dirty)
+
+    def _mark(self, token_id: str) -> bool:
+        """Record a change; True if the token was not pending yet"""
+        if self.token_ids is not None and token_id not in self.token_ids:
+            return False
+        with self._lock:
+            self.updates += 1
+            if token_id in self._dirty:
+                return False
+            self._dirty[token_id] = None
+            return True
+
+    def poll(self) -> Dict[str, "BookSnapshot"]:
+        """Take the newest snapshot of every token changed since the last delivery."""
+        with self._lock:
+            dirty = list(self._dirty)
+            self._dirty.clear()
+        snapshots: Dict[str, BookSnapshot] = {}
+        for token_id in dirty:
+            snapshot = self.manager.snapshot(token_id)
+            if snapshot is not None:
+                snapshots[token_id] = snapshot
+        if snapshots:
+            self.deliveries += 1
+            self.last_delivery = time.time()
+        return snapshots
+
+    def flush(self) -> int:
+        """
+        Deliver pending changes to the callback now.
+
+        Returns:
+            Number of tokens delivered
+        """
+        snapshots = self.poll()
+        if snapshots and self.callback is not None:
+            self.callback(snapshots)
+        return len(snapshots)
+
+    def close(self) -> None:
+        """Stop receiving updates."""
+        self.manager.unsubscribe(self)
+
+
 class OrderbookManager:
     """
     Helper class to manage multiple orderbooks efficiently.
     Stores orderbooks for multiple tokens and provides easy access.
+
+    Each update is copied into an immutable BookSnapshot and published by
+    replacing a single dict entry, so readers on other threads never take a
+    lock and always see bids and asks from the same update. Writers are
+    serialized so versions are assigned in publication order.
+
+    Example:
+        >>> snapshot = manager.snapshot(token_id)
+        >>> if snapshot and snapshot.version != last_seen:
+        ...     last_seen = snapshot.version
+        ...     quote(snapshot.best_bid, snapshot.best_ask)
     """
 
     def __init__(self):
-        self.orderbooks: Dict[str, Dict[str, List[PriceLevel]]] = {}
+        self._snapshots: Dict[str, BookSnapshot] = {}
+        self._version = 0
+        self._write_lock = threading.Lock()
+
+        # Binary complements: derived token -> token whose book is stored
+        self._complements: Dict[str, str] = {}
+        self._dependents: Dict[str, List[str]] = {}
+        self._derived: Dict[str, BookSnapshot] = {}
+
+        # Conflating subscribers (replaced, never mutated, so update() iterates lock-free)
+        self._subscriptions: Tuple[BookSubscription, ...] = ()
+        self._timer: Optional[threading.Thread] = None
+        self._timer_cond = threading.Condition()
+
+    def update(self, token_id: str, orderbook: Dict[str, Any]) -> BookSnapshot:
+        """
+        Publish a new orderbook for a token.
+
+        Args:
+            token_id: Token ID
+            orderbook: Dict with "bids" and "asks" (price, size) lists; other
+                keys (timestamp, hash, ...) are kept on the snapshot
+
+        Returns:
+            The published snapshot
+        """
+        bids = tuple(tuple(level) for level in orderbook.get("bids") or ())
+        asks = tuple(tuple(level) for level in orderbook.get("asks") or ())
+        fields = MappingProxyType(
+            {key: value for key, value in orderbook.items() if key not in ("bids", "asks")}
+        )
+        with self._write_lock:
+            self._version += 1
+            snapshot = BookSnapshot(token_id, bids, asks, self._version, time.time(), fields)
+            self._snapshots[token_id] = snapshot
+        if self._subscriptions:
+            self._notify(token_id)
+        return snapshot
+
+    def _notify(self, token_id: str) -> None:
+        """Mark a token (and the tokens derived from it) changed for every subscriber"""
+        wake = False
+        for changed in (token_id, *self._dependents.get(token_id, ())):
+            for subscription in self._subscriptions:
+                if subscription._mark(changed) and subscription.callback is not None:
+                    wake = True
+        if wake:
+            with self._timer_cond:
+                self._timer_cond.notify()
+
+    def subscribe(
+        self,
+        callback: Optional[Callable[[Dict[str, BookSnapshot]], None]] = None,
+        token_ids: Optional[Iterable[str]] = None,
+        interval_ms: float = 100.0,
+    ) -> BookSubscription:
+        """
+        Follow the latest books of some tokens without seeing every update.
+
+        Bursts of updates to a token collapse into its newest snapshot. With
+        a callback, the manager calls it from a background thread at most
+        once every ``interval_ms``; without one, call ``poll()`` when needed.
+
+        Args:
+            callback: Function called with {token_id: snapshot} of changed tokens
+            token_ids: Tokens to follow (None follows every token)
+            interval_ms: Minimum milliseconds between two callback calls
+
+        Returns:
+            Subscription (``close()`` it to stop)
+        """
+        subscription = BookSubscription(self, callback, token_ids, interval_ms)
+        with self._timer_cond:
+            self._subscriptions = self._subscriptions + (subscription,)
+            if callback is not None and (self._timer is None or not self._timer.is_alive()):
+                self._timer = threading.Thread(
+                    target=self._run_timer, name="orderbook-conflation", daemon=True
+                )
+                self._timer.start()
+        return subscription
+
+    def unsubscribe(self, subscription: BookSubscription) -> None:
+        """Remove a subscription (no-op if already removed)."""
+        with self._timer_cond:
+            self._subscriptions = tuple(s for s in self._subscriptions if s is not subscription)
+            self._timer_cond.notify()
+
+    def _run_timer(self) -> None:
+        """Fire each callback subscription once its interval has passed and it has changes"""
+        while True:
+            with self._timer_cond:
+                subscriptions = [s for s in self._subscriptions if s.callback is not None]
+                if not subscriptions:
+                    self._timer = None
+                    return
+                now = time.time()
+                due = [
+                    s for s in subscriptions if s.pending and now >= s.last_delivery + s.interval
+                ]
+                if not due:
+                    waits = [s.last_delivery + s.interval - now for s in subscriptions if s.pending]
+                    self._timer_cond.wait(min(waits) if waits else None)
+                    continue
+            for subscription in due:
+                try:
+                    subscription.flush()
+                except Exception as e:
+                    logger.error(f"Orderbook subscription callback error: {e}")
+
+    @property
+    def version(self) -> int:
+        """Version of the most recent update across all tokens."""
+        return self._version
+
+    def link_complement(self, token_id: str, source_token_id: str) -> None:
+        """
+        Serve a binary outcome's book as a view over its complement's book.
 
-    def update(self, token_id: str, orderbook: Dict[str, List[PriceLevel]]):
-        """Update orderbook for a token."""
-        self.orderbooks[token_id] = orderbook
+        Only the source token's book is stored and updated; the linked
+        token's bids and asks are ComplementLevels over the source's asks
+        and bids, sharing its version.
 
-    def get(self, token_id: str) -> Optional[Dict[str, List[PriceLevel]]]:
-        """Get orderbook for a token."""
-        return self.orderbooks.get(token_id)
+        Args:
+            token_id: Token to derive (e.g. No)
+            source_token_id: Token whose book is stored (e.g. Yes)
+        """
+        with self._write_lock:
+            previous = self._complements.get(token_id)
+            if previous is not None:
+                self._dependents[previous].remove(token_id)
+            self._complements[token_id] = source_token_id
+            self._dependents.setdefault(source_token_id, []).append(token_id)
+            self._snapshots.pop(token_id, None)
+            self._derived.pop(token_id, None)
+
+    def snapshot(self, token_id: str) -> Optional[BookSnapshot]:
+        """Get the current immutable snapshot for a token (lock-free)."""
+        snapshot = self._snapshots.get(token_id)
+        if snapshot is not None:
+            return snapshot
+        source_id = self._complements.get(token_id)
+        if source_id is None:
+            return None
+        source = self._snapshots.get(source_id)
+        if source is None:
+            return None
+
+        derived = self._derived.get(token_id)
+        if derived is None or derived.version != source.version:
+            fields = dict(source.fields)
+            if "asset_id" in fields:
+                fields["asset_id"] = token_id
+            derived = BookSnapshot(
+                token_id,
+                ComplementLevels(source.asks),
+                ComplementLevels(source.bids),
+                source.version,
+                source.updated_at,
+                MappingProxyType(fields),
+            )
+            self._derived[token_id] = derived
+        return derived
+
+    def snapshots(self) -> Dict[str, BookSnapshot]:
+        """Get the current snapshot of every token, including derived ones."""
+        result = dict(self._snapshots)
+        for token_id in list(self._complements):
+            snapshot = self.snapshot(token_id)
+            if snapshot is not None:
+                result[token_id] = snapshot
+        return result
+
+    @property
+    def orderbooks(self) -> Dict[str, Dict[str, Any]]:
+        """Mutable copies of every orderbook, keyed by token ID."""
+        return {token_id: snap.to_dict() for token_id, snap in self.snapshots().items()}
+
+    def age_ms(self, token_id: str) -> Optional[float]:
+        """Milliseconds since the token's orderbook was last updated (None if never)."""
+        snapshot = self.snapshot(token_id)
+        if snapshot is None:
+            return None
+        return (time.time() - snapshot.updated_at) * 1000
+
+    def get(self, token_id: str) -> Optional[Dict[str, Any]]:
+        """Get a mutable copy of the orderbook for a token."""
+        snapshot = self.snapshot(token_id)
+        return snapshot.to_dict() if snapshot else None
 
     def get_best_bid_ask(self, token_id: str) -> Tuple[Optional[float], Optional[float]]:
         """Get best bid and ask for a token."""
-        orderbook = self.get(token_id)
-        if not orderbook:
+        snapshot = self.snapshot(token_id)
+        if snapshot is None:
             return None, None
+        return snapshot.best_bid, snapshot.best_ask
 
-        bids: List[PriceLevel] = orderbook.get("bids", [])
-        asks: List[PriceLevel] = orderbook.get("asks", [])
-
-        best_bid = bids[0][0] if bids else None
-        best_ask = asks[0][0] if asks else None
-
-        return best_bid, best_ask
+    def get_arrays(self, token_id: str) -> Optional[ArrayOrderbook]:
+        """Get the orderbook for a token as an ArrayOrderbook for depth queries."""
+        snapshot = self.snapshot(token_id)
+        return snapshot.to_arrays() if snapshot else None
 
     def has_data(self, token_id: str) -> bool:
         """Check if we have orderbook data for a token."""
-        orderbook = self.get(token_id)
-        if not orderbook:
-            return False
-        return len(orderbook.get("bids", [])) > 0 and len(orderbook.get("asks", [])) > 0
+        snapshot = self.snapshot(token_id)
+        return snapshot is not None and snapshot.has_data
 
     def has_all_data(self, token_ids: List[str]) -> bool:
         """Check if we have orderbook data for all tokens."""
@@ -1,9 +1,14 @@
 """Utility functions and helpers for Dr. Manhattan."""
 
+from .columnar import Column, ColumnarBuilder
 from .logger import ColoredFormatter, default_logger, setup_logger
+from .search import MarketSearchIndex
 from .tui import prompt_confirm, prompt_market_selection, prompt_selection
 
 __all__ = [
+    "Column",
+    "ColumnarBuilder",
+    "MarketSearchIndex",
     "setup_logger",
     "ColoredFormatter",
     "default_logger",
@@ -0,0 +1,256 @@
+"""
+Inverted full-text index for client-side market search.
+
+``MarketSearchIndex`` tokenizes each market's searchable text (question,
+description, slug, tags, categories) once when it is added and keeps
+posting sets per token and per category. Queries match word prefixes
+against a sorted vocabulary, so lookups cost a few set intersections
+instead of a substring scan over every market.
+"""
+
+import bisect
+import heapq
+import re
+import threading
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set
+
+from ..models.market import Market
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased word tokens of a text."""
+    return _TOKEN.findall(text.lower())
+
+
+def default_search_text(market: Market) -> str:
+    """Question, description and slug of a market."""
+    meta = market.metadata
+    fields = [market.question or "", meta.get("description", ""), meta.get("slug", "")]
+    return " ".join(str(field) for field in fields)
+
+
+def default_categories(market: Market) -> List[str]:
+    """Lower-cased category/topic names from market metadata."""
+    categories: List[str] = []
+    for key in ("category", "categories", "topics"):
+        value = market.metadata.get(key)
+        if value is None:
+            continue
+        items = value if isinstance(value, (list, tuple)) else [value]
+        categories.extend(str(item).lower() for item in items)
+    return categories
+
+
+class MarketSearchIndex:
+    """
+    Token -> market postings with prefix lookup and category filters.
+
+    Markets are keyed by ``Market.id``; adding a market again replaces its
+    previous entry, so the index can be fed as pages arrive.
+
+    Example:
+        >>> index = MarketSearchIndex(markets)
+        >>> index.search("btc 100k")  # every word must match (AND)
+        >>> index.search(any_keywords=["trump", "biden"], categories=["politics"])
+    """
+
+    def __init__(
+        self,
+        markets: Iterable[Market] = (),
+        text: Callable[[Market], str] = default_search_text,
+        categories: Callable[[Market], Iterable[str]] = default_categories,
+    ):
+        """
+        Initialize index.
+
+        Args:
+            markets: Markets to index
+            text: Function building a market's searchable text
+            categories: Function listing a market's lower-cased categories
+        """
+        self._text = text
+        self._categories = categories
+        self._markets: Dict[str, Market] = {}
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+        self._tokens: Dict[str, FrozenSet[str]] = {}
+        self._market_categories: Dict[str, FrozenSet[str]] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._category_postings: Dict[str, Set[str]] = {}
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+        self._lock = threading.RLock()
+        self.add_many(markets)
+
+    def __len__(self) -> int:
+        return len(self._markets)
+
+    def __contains__(self, market_id: str) -> bool:
+        return market_id in self._markets
+
+    def add(self, market: Market) -> None:
+        """Index a market, replacing any previous entry with the same id."""
+        if self._markets.get(market.id) is market:
+            return
+        tokens = frozenset(tokenize(self._text(market)))
+        categories = frozenset(str(c).lower() for c in self._categories(market))
+        with self._lock:
+            self._remove(market.id)
+            self._markets[market.id] = market
+            self._order[market.id] = self._next_order
+            self._next_order += 1
+            self._tokens[market.id] = tokens
+            self._market_categories[market.id] = categories
+            for token in tokens:
+                posting = self._postings.get(token)
+                if posting is None:
+                    posting = self._postings[token] = set()
+                    self._vocabulary_dirty = True
+                posting.add(market.id)
+            for category in categories:
+                self._category_postings.setdefault(category, set()).add(market.id)
+
+    def add_many(self, markets: Iterable[Market]) -> None:
+        """Index several markets."""
+        for market in markets:
+            self.add(market)
+
+    def remove(self, market_id: str) -> None:
+        """Drop a market from the index (no-op if absent)."""
+        with self._lock:
+            self._remove(market_id)
+
+    def _remove(self, market_id: str) -> None:
+        if market_id not in self._markets:
+            return
+        del self._markets[market_id]
+        del self._order[market_id]
+        for token in self._tokens.pop(market_id):
+            posting = self._postings[token]
+            posting.discard(market_id)
+            if not posting:
+                del self._postings[token]
+                self._vocabulary_dirty = True
+        for category in self._market_categories.pop(market_id):
+            posting = self._category_postings[category]
+            posting.discard(market_id)
+            if not posting:
+                del self._category_postings[category]
+
+    def _term_postings(self, term: str, prefix: bool) -> Set[str]:
+        """Markets having a token equal to (or starting with) ``term``"""
+        if not prefix:
+            return self._postings.get(term, set())
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        start = bisect.bisect_left(self._vocabulary, term)
+        end = bisect.bisect_left(self._vocabulary, term + "\uffff", start)
+        if end - start == 1:
+            return self._postings[self._vocabulary[start]]
+        matched: Set[str] = set()
+        for token in self._vocabulary[start:end]:
+            matched |= self._postings[token]
+        return matched
+
+    @staticmethod
+    def _terms(query: Optional[str], keywords: Optional[Sequence[str]]) -> List[str]:
+        """Words that must all match"""
+        required = tokenize(query) if query else []
+        for keyword in keywords or ():
+            required.extend(tokenize(keyword))
+        return required
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        *,
+        keywords: Optional[Sequence[str]] = None,
+        any_keywords: Optional[Sequence[str]] = None,
+        categories: Optional[Sequence[str]] = None,
+        prefix: bool = True,
+        limit: Optional[int] = None,
+    ) -> List[Market]:
+        """
+        Find indexed markets.
+
+        Args:
+            query: Words that must all match (AND)
+            keywords: More words that must all match (AND)
+            any_keywords: Words of which at least one must match (OR)
+            categories: Categories of which at least one must match
+            prefix: Match word prefixes ("bitc" matches "bitcoin")
+            limit: Maximum markets to return
+
+        Returns:
+            Matching markets in insertion order
+        """
+        required = self._terms(query, keywords)
+        optional = [t for keyword in any_keywords or () for t in tokenize(keyword)]
+        with self._lock:
+            candidates: Optional[Set[str]] = None
+            postings = [self._term_postings(term, prefix) for term in required]
+            for posting in sorted(postings, key=len):
+                candidates = set(posting) if candidates is None else candidates & posting
+                if not candidates:
+                    return []
+            if optional:
+                union: Set[str] = set()
+                for term in optional:
+                    union |= self._term_postings(term, prefix)
+                candidates = union if candidates is None else candidates & union
+            if categories:
+                union = set()
+                for category in categories:
+                    union |= self._category_postings.get(category.lower(), set())
+                candidates = union if candidates is None else candidates & union
+
+            if candidates is None:
+                ids: List[str] = list(self._markets)
+                if limit is not None:
+                    ids = ids[: max(0, limit)]
+            elif limit is not None:
+                ids = heapq.nsmallest(max(0, limit), candidates, key=self._order.__getitem__)
+            else:
+                ids = sorted(candidates, key=self._order.__getitem__)
+            return [self._markets[market_id] for market_id in ids]
+
+    def matches(
+        self,
+        market: Market,
+        query: Optional[str] = None,
+        *,
+        keywords: Optional[Sequence[str]] = None,
+        categories: Optional[Sequence[str]] = None,
+        prefix: bool = True,
+    ) -> bool:
+        """
+        Index ``market`` and check it against a query.
+
+        Used by exchanges to filter markets as pages stream in.
+
+        Args:
+            market: Market to index and test
+            query: Words that must all match
+            keywords: More words that must all match
+            categories: Categories of which at least one must match
+            prefix: Match word prefixes
+
+        Returns:
+            True if the market satisfies every filter
+        """
+        self.add(market)
+        with self._lock:
+            tokens = self._tokens[market.id]
+            market_categories = self._market_categories[market.id]
+        if categories and not any(c.lower() in market_categories for c in categories):
+            return False
+        required = self._terms(query, keywords)
+        for term in required:
+            if term in tokens:
+                continue
+            if not prefix or not any(token.startswith(term) for token in tokens):
+                return False
+        return True
@@ -259,6 +259,13 @@ def collect_all_bets(
     """Collect all betting opportunities with entry prices and outcomes."""
     all_bets = []
     
+    # Resolve token IDs for many markets with one bulk index sync
+    if len(markets) > 20:
+        try:
+            exchange.sync_token_index()
+        except Exception as e:
+            print(f"  ! Token index sync failed: {e}")
+    
     for idx, market in enumerate(markets, start=1):
         print(f"  [{idx}/{len(markets)}] {market.question[:60]}...")
         
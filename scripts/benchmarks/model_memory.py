@@ -0,0 +1,149 @@
+"""Compare per-object memory of the legacy and slotted market/order models."""
+
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from dr_manhattan.exchanges.polymarket import Polymarket
+from dr_manhattan.models.order import Order, OrderSide, OrderStatus
+from dr_manhattan.models.orderbook import Orderbook
+from dr_manhattan.models.position import Position
+
+COUNT = 20_000
+
+
+@dataclass
+class LegacyMarket:
+    id: str
+    question: str
+    outcomes: list
+    close_time: Optional[datetime]
+    volume: float
+    liquidity: float
+    prices: Dict[str, float]
+    metadata: Dict[str, Any]
+    tick_size: float
+    description: str = ""
+
+
+@dataclass
+class LegacyOrder:
+    id: str
+    market_id: str
+    outcome: str
+    side: OrderSide
+    price: float
+    size: float
+    filled: float
+    status: OrderStatus
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
+@dataclass
+class LegacyPosition:
+    market_id: str
+    outcome: str
+    size: float
+    average_price: float
+    current_price: float
+
+
+@dataclass
+class LegacyOrderbook:
+    bids: List = field(default_factory=list)
+    asks: List = field(default_factory=list)
+    timestamp: int = 0
+    asset_id: str = ""
+    market_id: str = ""
+
+
+def gamma_payload(i: int) -> Dict[str, Any]:
+    """Gamma /markets entry shaped like the live API (about 60 keys)"""
+    payload: Dict[str, Any] = {
+        "id": str(i),
+        "question": f"Will event {i} happen?",
+        "conditionId": f"0x{i:064x}",
+        "slug": f"event-{i}",
+        "endDate": "2026-12-31T00:00:00Z",
+        "outcomes": '["Yes", "No"]',
+        "outcomePrices": '["0.4", "0.6"]',
+        "clobTokenIds": f'["{i}1{"0" * 70}", "{i}2{"0" * 70}"]',
+        "volumeNum": 1000.0 + i,
+        "liquidityNum": 500.0,
+        "description": "Resolution criteria " * 20,
+        "updatedAt": "2026-01-01T00:00:00Z",
+    }
+    payload.update({f"field_{k}": f"value {k} for market {i}" for k in range(48)})
+    return payload
+
+
+def measure(factory: Callable[[int], Any]) -> float:
+    """Average bytes allocated per object built by factory"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory(i) for i in range(COUNT)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del objects
+    return size / COUNT
+
+
+def main() -> None:
+    full = Polymarket()
+    compact = Polymarket({"compact_markets": True})
+    now = datetime.now(timezone.utc)
+
+    def legacy_market(i: int) -> LegacyMarket:
+        m = full._parse_market(gamma_payload(i))
+        return LegacyMarket(
+            m.id,
+            m.question,
+            list(m.outcomes),
+            m.close_time,
+            m.volume,
+            m.liquidity,
+            dict(m.prices),
+            m.metadata,
+            m.tick_size,
+            m.description,
+        )
+
+    rows = [
+        ("Market (full metadata)", legacy_market, lambda i: full._parse_market(gamma_payload(i))),
+        (
+            "Market (compact_markets)",
+            legacy_market,
+            lambda i: compact._parse_market(gamma_payload(i)),
+        ),
+        (
+            "Order",
+            lambda i: LegacyOrder(
+                str(i), "m", "Yes", OrderSide.BUY, 0.5, 10, 0, OrderStatus.OPEN, now
+            ),
+            lambda i: Order(str(i), "m", "Yes", OrderSide.BUY, 0.5, 10, 0, OrderStatus.OPEN, now),
+        ),
+        (
+            "Position",
+            lambda i: LegacyPosition(str(i), "Yes", 10.0, 0.5, 0.6),
+            lambda i: Position(str(i), "Yes", 10.0, 0.5, 0.6),
+        ),
+        (
+            "Orderbook",
+            lambda i: LegacyOrderbook([(0.5, 1.0)], [(0.6, 1.0)], i, str(i)),
+            lambda i: Orderbook([(0.5, 1.0)], [(0.6, 1.0)], i, str(i)),
+        ),
+    ]
+
+    print(f"{'Model':<26}{'legacy B/obj':>14}{'new B/obj':>12}{'saved':>8}")
+    for name, legacy, new in rows:
+        old_size = measure(legacy)
+        new_size = measure(new)
+        saved = 1 - new_size / old_size if old_size else 0.0
+        print(f"{name:<26}{old_size:>14,.0f}{new_size:>12,.0f}{saved:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
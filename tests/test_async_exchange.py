@@ -0,0 +1,213 @@
+"""Tests for AsyncExchange and native async exchange implementations"""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from dr_manhattan.base.async_exchange import AsyncExchange
+from dr_manhattan.base.async_http import AsyncHTTPTransport
+from dr_manhattan.base.errors import MarketNotFound, NetworkError
+from dr_manhattan.exchanges.limitless import Limitless
+from dr_manhattan.exchanges.polymarket import Polymarket
+from dr_manhattan.exchanges.polymarket_async import AsyncPolymarket
+from tests.test_base import MockExchange
+
+
+async def _start_server(routes):
+    app = web.Application()
+    app.add_routes(routes)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def _polymarket(base_url: str) -> Polymarket:
+    exchange = Polymarket({"retry_delay": 0, "rate_limit": 1000})
+    exchange.BASE_URL = base_url
+    exchange.CLOB_URL = base_url
+    return exchange
+
+
+def test_base_to_async_runs_sync_methods():
+    """Test default AsyncExchange delegates to the sync exchange"""
+
+    async def _test():
+        async with MockExchange().to_async() as exchange:
+            assert isinstance(exchange, AsyncExchange)
+            assert exchange.id == "mock"
+            market = await exchange.fetch_market("m1")
+            balance = await exchange.fetch_balance()
+            orders = await exchange.fetch_open_orders()
+        return market, balance, orders
+
+    market, balance, orders = asyncio.run(_test())
+    assert market.id == "m1"
+    assert balance == {"USDC": 1000.0}
+    assert orders == []
+
+
+def test_polymarket_to_async_is_native():
+    """Test Polymarket returns the native async implementation"""
+    assert isinstance(Polymarket().to_async(), AsyncPolymarket)
+
+
+def test_async_polymarket_orderbooks_share_pool():
+    """Test concurrent orderbook fetches run over pooled connections"""
+
+    async def book(request):
+        await asyncio.sleep(0.01)
+        token_id = request.query["token_id"]
+        return web.json_response(
+            {"asset_id": token_id, "bids": [{"price": "0.4", "size": "10"}], "asks": []}
+        )
+
+    async def _test():
+        runner, base_url = await _start_server([web.get("/book", book)])
+        exchange = _polymarket(base_url).to_async()
+        try:
+            first = await asyncio.gather(*(exchange.get_orderbook(f"t{i}") for i in range(20)))
+            second = await asyncio.gather(*(exchange.get_orderbook(f"t{i}") for i in range(20)))
+            return first + second, exchange.http.stats()
+        finally:
+            await exchange.close()
+            await runner.cleanup()
+
+    books, stats = asyncio.run(_test())
+    assert [b["asset_id"] for b in books[:3]] == ["t0", "t1", "t2"]
+    assert stats["requests"] == 40
+    assert stats["new_connections"] <= stats["limit_per_host"]
+    assert stats["reused_connections"] > 0
+
+
+def test_async_polymarket_fetch_market_retries_rate_limit():
+    """Test 429 responses are retried without blocking the loop"""
+    calls = {"n": 0}
+
+    async def market(request):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return web.json_response({}, status=429, headers={"Retry-After": "0"})
+        return web.json_response(
+            {
+                "id": request.match_info["market_id"],
+                "question": "Test question?",
+                "outcomes": '["Yes", "No"]',
+                "outcomePrices": '["0.5", "0.5"]',
+                "clobTokenIds": '["token1", "token2"]',
+                "active": True,
+                "closed": False,
+            }
+        )
+
+    async def _test():
+        runner, base_url = await _start_server([web.get("/markets/{market_id}", market)])
+        exchange = _polymarket(base_url).to_async()
+        try:
+            return await exchange.fetch_market("0xabc")
+        finally:
+            await exchange.close()
+            await runner.cleanup()
+
+    result = asyncio.run(_test())
+    assert result.id == "0xabc"
+    assert calls["n"] == 2
+
+
+def test_async_polymarket_fetch_market_not_found():
+    """Test 404 maps to MarketNotFound"""
+
+    async def _test():
+        runner, base_url = await _start_server([])
+        exchange = _polymarket(base_url).to_async()
+        try:
+            await exchange.fetch_market("missing")
+        finally:
+            await exchange.close()
+            await runner.cleanup()
+
+    with pytest.raises(MarketNotFound):
+        asyncio.run(_test())
+
+
+def test_async_polymarket_get_orderbooks_batches():
+    """Test async get_orderbooks posts token IDs to /books"""
+    received = []
+
+    async def books(request):
+        body = await request.json()
+        received.append(body)
+        return web.json_response(
+            [
+                {"asset_id": item["token_id"], "bids": [{"price": "0.3", "size": "1"}], "asks": []}
+                for item in body
+            ]
+        )
+
+    async def _test():
+        runner, base_url = await _start_server([web.post("/books", books)])
+        exchange = _polymarket(base_url).to_async()
+        try:
+            return await exchange.get_orderbooks(["a", "b", "a"])
+        finally:
+            await exchange.close()
+            await runner.cleanup()
+
+    result = asyncio.run(_test())
+    assert received == [[{"token_id": "a"}, {"token_id": "b"}]]
+    assert list(result) == ["a", "b"]
+    assert result["b"].best_bid == 0.3
+
+
+def test_async_transport_keeps_default_timeout():
+    """Test requests without a timeout override still honour the session timeout"""
+
+    async def slow(request):
+        await asyncio.sleep(2)
+        return web.json_response({})
+
+    async def _test():
+        runner, base_url = await _start_server([web.get("/slow", slow)])
+        transport = AsyncHTTPTransport(timeout=0.3)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            with pytest.raises(NetworkError):
+                await transport.get(f"{base_url}/slow")
+            return loop.time() - start
+        finally:
+            await transport.close()
+            await runner.cleanup()
+
+    assert asyncio.run(_test()) < 1.5
+
+
+def test_async_limitless_fetches_all_pages_concurrently():
+    """Test fetch_markets(all=True) fans pages out and stops at the first empty page"""
+    active = {"now": 0, "peak": 0}
+
+    async def markets(request):
+        page = int(request.query["page"])
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.05)
+        active["now"] -= 1
+        data = [{"slug": f"m{page}-{i}", "title": "Q?"} for i in range(2)] if page <= 5 else []
+        return web.json_response({"data": data})
+
+    async def _test():
+        runner, base_url = await _start_server([web.get("/markets/active", markets)])
+        exchange = Limitless({"host": base_url, "retry_delay": 0, "rate_limit": 1000}).to_async()
+        try:
+            return await exchange.fetch_markets({"all": True})
+        finally:
+            await exchange.close()
+            await runner.cleanup()
+
+    result = asyncio.run(_test())
+    assert [m.id for m in result][:3] == ["m1-0", "m1-1", "m2-0"]
+    assert len(result) == 10
+    assert active["peak"] > 1
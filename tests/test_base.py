@@ -185,3 +185,113 @@ def test_fetch_positions():
 
     assert isinstance(positions, list)
     assert len(positions) == 0
+
+
+def test_http_transport_configured_from_config():
+    """Test pooled HTTP transport picks up pool settings"""
+    exchange = MockExchange({"pool_maxsize": 4, "keep_alive": False})
+
+    assert exchange.http.pool_maxsize == 4
+    assert exchange.http.headers["Connection"] == "close"
+    assert "gzip" in exchange.http.headers["Accept-Encoding"]
+
+
+def test_http_transport_reuses_connections():
+    """Test keep-alive connections are reused and counted"""
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            body = b'{"ok": true}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        exchange = MockExchange()
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        for _ in range(3):
+            assert exchange.http.get(url, timeout=5).json() == {"ok": True}
+
+        stats = exchange.http.stats()
+        assert stats["requests"] == 3
+        assert stats["new_connections"] == 1
+        assert stats["reused_connections"] == 2
+    finally:
+        exchange.http.close()
+        server.shutdown()
+        server.server_close()
+
+
+class MockOrderbookExchange(MockExchange):
+    """Mock exchange with a per-token REST orderbook"""
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.orderbook_calls = []
+
+    def get_orderbook(self, token_id):
+        self.orderbook_calls.append(token_id)
+        if token_id == "bad":
+            raise RuntimeError("boom")
+        return {
+            "bids": [{"price": "0.4", "size": "10"}, {"price": "0.45", "size": "5"}],
+            "asks": [{"price": "0.55", "size": "7"}],
+        }
+
+
+def test_get_orderbooks_fans_out():
+    """Test default get_orderbooks fetches each unique token once"""
+    exchange = MockOrderbookExchange({"orderbook_concurrency": 4})
+    books = exchange.get_orderbooks(["a", "b", "a", "c"])
+
+    assert list(books) == ["a", "b", "c"]
+    assert sorted(exchange.orderbook_calls) == ["a", "b", "c"]
+    assert books["a"].asset_id == "a"
+    assert books["a"].best_bid == 0.45
+    assert books["a"].best_ask == 0.55
+
+
+def test_get_orderbooks_isolates_failures():
+    """Test a failing token is left out without failing the batch"""
+    exchange = MockOrderbookExchange()
+    books = exchange.get_orderbooks(["good", "bad"])
+
+    assert books["good"].best_bid == 0.45
+    assert "bad" not in books
+
+
+def test_refresh_orderbooks_keeps_last_good_book_on_failure():
+    """Test a failed REST refresh does not wipe a token's last good book"""
+    from dr_manhattan.base.exchange_client import ExchangeClient
+    from dr_manhattan.models.orderbook import OrderbookManager
+
+    exchange = MockOrderbookExchange()
+    client = ExchangeClient(exchange)
+    client._orderbook_manager = OrderbookManager()
+    good_book = {"bids": [(0.45, 5.0)], "asks": [(0.55, 7.0)]}
+    client._orderbook_manager.update("bad", good_book)
+
+    client._refresh_orderbooks(["good", "bad"])
+
+    assert client._orderbook_manager.get("bad") == good_book
+    assert client._orderbook_manager.get_best_bid_ask("good") == (0.45, 0.55)
+
+
+def test_get_orderbooks_requires_get_orderbook():
+    """Test get_orderbooks on an exchange without REST orderbooks"""
+    import pytest
+
+    with pytest.raises(NotImplementedError):
+        MockExchange().get_orderbooks(["a"])
@@ -0,0 +1,146 @@
+"""Tests for the local market catalog"""
+
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from dr_manhattan.base.catalog import MarketCatalog, market_tags
+from dr_manhattan.exchanges.polymarket import Polymarket
+from dr_manhattan.models.market import Market
+from tests.test_base import MockExchange
+
+
+def _market(market_id, *, volume=0.0, liquidity=0.0, outcomes=("Yes", "No"), **metadata):
+    return Market(
+        id=market_id,
+        question=f"Will {market_id} happen?",
+        outcomes=list(outcomes),
+        close_time=datetime(2026, 1, int(market_id[-1]) + 1, tzinfo=timezone.utc),
+        volume=volume,
+        liquidity=liquidity,
+        prices={o: 1 / len(outcomes) for o in outcomes},
+        metadata=metadata,
+        tick_size=0.01,
+    )
+
+
+class ListingExchange(MockExchange):
+    """Mock exchange whose listing supports update-time cursors"""
+
+    MARKET_UPDATED_AT_KEY = "updatedAt"
+
+    def __init__(self, markets):
+        self.listing = markets
+        self.since_calls = []
+        super().__init__()
+
+    def iter_updated_markets(self, since=None):
+        self.since_calls.append(since)
+        ordered = sorted(self.listing, key=lambda m: m.metadata["updatedAt"], reverse=True)
+        for market in ordered:
+            if since is not None and market.metadata["updatedAt"] <= since:
+                return
+            yield market
+
+
+def test_catalog_round_trips_and_filters():
+    """Test stored markets come back intact and indexed filters apply"""
+    catalog = MarketCatalog()
+    markets = [
+        _market("m1", volume=100, liquidity=50, tags=[{"label": "Crypto", "slug": "crypto"}]),
+        _market("m2", volume=300, liquidity=5, category="Politics"),
+        _market("m3", volume=200, liquidity=80, outcomes=("A", "B", "C")),
+    ]
+    assert catalog.upsert("mock", markets) == 3
+
+    assert catalog.get("mock", "m1") == markets[0]
+    assert [m.id for m in catalog.markets("mock")] == ["m2", "m3", "m1"]
+    assert [m.id for m in catalog.markets("mock", binary=True, min_liquidity=10)] == ["m1"]
+    assert [m.id for m in catalog.markets("mock", tags=["politics", "crypto"])] == ["m2", "m1"]
+    assert [m.id for m in catalog.markets("mock", query="M3")] == ["m3"]
+    closes_after = datetime(2026, 1, 3, tzinfo=timezone.utc)
+    assert [m.id for m in catalog.markets("mock", closes_after=closes_after)] == ["m3"]
+    assert [m.id for m in catalog.markets(order_by="liquidity", limit=1)] == ["m3"]
+    assert catalog.count("other") == 0
+
+    with pytest.raises(ValueError):
+        catalog.markets(order_by="question; DROP TABLE markets")
+
+
+def test_market_tags_reads_strings_and_dicts():
+    """Test tags come from every tag-like metadata key, lower-cased and deduplicated"""
+    market = _market("m1", tags=[{"label": "Crypto", "slug": "crypto"}], category="CRYPTO")
+    assert market_tags(market) == ["crypto"]
+
+
+def test_sync_is_incremental_and_persists(tmp_path):
+    """Test later syncs pass the saved cursor and only write newer markets"""
+    path = str(tmp_path / "markets.db")
+    exchange = ListingExchange(
+        [_market("m1", updatedAt="2026-01-01T00:00:00Z"), _market("m2", updatedAt="2026-01-02")]
+    )
+
+    with MarketCatalog(path) as catalog:
+        assert catalog.sync(exchange) == 2
+        assert catalog.cursor("mock") == "2026-01-02"
+
+    exchange.listing.append(_market("m3", updatedAt="2026-01-03", volume=1))
+    with MarketCatalog(path) as catalog:
+        assert catalog.count("mock") == 2
+        assert catalog.sync(exchange) == 1
+        assert catalog.count("mock") == 3
+        assert catalog.markets("mock", limit=1)[0].id == "m3"
+        assert catalog.sync(exchange, full=True) == 3
+
+    assert exchange.since_calls == [None, "2026-01-02", None]
+
+
+def test_sync_without_cursor_support_lists_everything():
+    """Test exchanges without MARKET_UPDATED_AT_KEY are re-listed in full"""
+
+    class AllMarketsExchange(MockExchange):
+        def fetch_markets(self, params=None):
+            assert params == {"all": True}
+            return [_market("m1"), _market("m2")]
+
+    catalog = MarketCatalog()
+    exchange = AllMarketsExchange()
+
+    assert catalog.sync(exchange) == 2
+    assert catalog.cursor("mock") is None
+    assert catalog.sync(exchange) == 2
+    assert catalog.count() == 2
+    assert catalog.stats()["mock"]["markets"] == 2
+
+
+@patch("requests.Session.request")
+def test_polymarket_updated_markets_stop_at_cursor(mock_request):
+    """Test Polymarket lists by updatedAt and stops at the previous sync's cursor"""
+    seen_params = []
+
+    def respond(method, url, params=None, **kwargs):
+        seen_params.append(dict(params))
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.json.return_value = [
+            {
+                "id": str(i),
+                "question": f"Market {i}",
+                "outcomes": '["Yes", "No"]',
+                "outcomePrices": '["0.5", "0.5"]',
+                "updatedAt": f"2026-01-{10 - i:02d}T00:00:00Z",
+            }
+            for i in range(params["offset"], min(params["offset"] + params["limit"], 8))
+        ]
+        return response
+
+    mock_request.side_effect = respond
+    exchange = Polymarket({"pagination_window": 1})
+
+    markets = list(exchange.iter_updated_markets("2026-01-07T00:00:00Z"))
+
+    assert [m.id for m in markets] == ["0", "1", "2"]
+    assert seen_params[0]["order"] == "updatedAt"
+    assert seen_params[0]["ascending"] is False
+    assert "closed" not in seen_params[0]
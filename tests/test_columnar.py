@@ -0,0 +1,61 @@
+"""Tests for columnar builders"""
+
+from datetime import datetime, timezone
+
+import pyarrow as pa
+
+from dr_manhattan.utils.columnar import Column, ColumnarBuilder, to_epoch_seconds, to_float
+
+COLUMNS = [
+    Column("timestamp", pa.timestamp("s", tz="UTC"), "t", convert=to_epoch_seconds),
+    Column("price", pa.float64(), "p", convert=to_float),
+    Column("side", pa.string(), default=""),
+]
+
+
+def test_builder_appends_pages_column_by_column():
+    """Test rows from several pages end up in one typed table"""
+    builder = ColumnarBuilder(COLUMNS)
+    builder.extend([{"t": 20, "p": "0.5", "side": "BUY"}, {"t": "10", "p": 0.25}])
+    builder.extend(iter([{"t": None, "p": None}]))
+    builder.extend([])
+
+    table = builder.to_arrow()
+
+    assert len(builder) == 3
+    assert table.schema.names == ["timestamp", "price", "side"]
+    assert table.column("price").to_pylist() == [0.5, 0.25, 0.0]
+    assert table.column("side").to_pylist() == ["BUY", "", ""]
+    assert table.column("timestamp").to_pylist()[1] == datetime.fromtimestamp(10, tz=timezone.utc)
+
+
+def test_builder_sorts_and_limits():
+    """Test limit keeps the first rows before a stable sort"""
+    builder = ColumnarBuilder(COLUMNS)
+    builder.extend([{"t": t, "p": t / 100} for t in (30, 10, 20, 5)])
+
+    df = builder.to_dataframe(sort_by="timestamp", limit=3)
+
+    assert df["price"].tolist() == [0.1, 0.2, 0.3]
+    assert list(df.index) == [0, 1, 2]
+
+
+def test_builder_supports_callable_sources():
+    """Test columns can read attributes of objects instead of dict keys"""
+
+    class Row:
+        def __init__(self, value):
+            self.value = value
+
+    builder = ColumnarBuilder([Column("value", pa.int64(), lambda row: row.value)])
+    builder.extend([Row(1), Row(2)])
+
+    assert builder.to_arrow().column("value").to_pylist() == [1, 2]
+
+
+def test_empty_builder_keeps_schema():
+    """Test an empty pull still yields the full column layout"""
+    df = ColumnarBuilder(COLUMNS).to_dataframe(sort_by="timestamp")
+
+    assert df.empty
+    assert list(df.columns) == ["timestamp", "price", "side"]
@@ -0,0 +1,119 @@
+"""Tests for bounded WebSocket callback dispatch"""
+
+import asyncio
+import threading
+import time
+
+from dr_manhattan.base.dispatch import Dispatcher
+from dr_manhattan.base.metrics import MetricsRecorder
+from dr_manhattan.exchanges.polymarket_ws import PolymarketWebSocket
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+class GatedCallback:
+    """Callback that blocks until released, recording its arguments"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.calls = []
+
+    def __call__(self, *args):
+        self.started.set()
+        self.release.wait(2.0)
+        self.calls.append(args)
+
+
+def test_slow_callback_does_not_block_receive_loop():
+    """Test messages keep being processed while a callback is stuck, dropping the oldest"""
+    metrics = MetricsRecorder()
+    ws = PolymarketWebSocket(
+        {"dispatch_policy": "drop_oldest", "dispatch_queue_size": 2, "metrics": metrics}
+    )
+    callback = GatedCallback()
+    ws.subscriptions["t1"] = callback
+
+    async def run():
+        for i in range(5):
+            await ws._process_message_item(
+                {
+                    "event_type": "book",
+                    "asset_id": "t1",
+                    "market": "m",
+                    "timestamp": i + 1,
+                    "bids": [{"price": "0.5", "size": str(i + 1)}],
+                    "asks": [],
+                }
+            )
+            if i == 0:
+                await asyncio.to_thread(callback.started.wait, 2.0)
+
+    asyncio.run(run())
+    stats = ws.dispatcher.stats()["t1"]
+    callback.release.set()
+
+    assert stats["depth"] == 2 and stats["dropped"] == 2
+    assert _wait_until(lambda: len(callback.calls) == 3)
+    assert [book["bids"] for _, book in callback.calls] == [
+        [(0.5, 1.0)],
+        [(0.5, 4.0)],
+        [(0.5, 5.0)],
+    ]
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"]["dispatch_dropped"][0]["value"] == 2
+    assert snapshot["gauges"]["dispatch_queue_depth"][0]["labels"] == {
+        "stream": "PolymarketWebSocket",
+        "subscriber": "t1",
+    }
+    ws.dispatcher.close()
+
+
+def test_conflate_keeps_latest_update_per_token():
+    """Test a conflating subscriber receives only the newest pending update per token"""
+    dispatcher = Dispatcher(policy="conflate")
+    callback = GatedCallback()
+
+    async def run():
+        await dispatcher.put("sub", "busy", callback, "busy", 0)
+        await asyncio.to_thread(callback.started.wait, 2.0)
+        for i in range(1, 4):
+            await dispatcher.put("sub", "a", callback, "a", i)
+            await dispatcher.put("sub", "b", callback, "b", i)
+
+    asyncio.run(run())
+    callback.release.set()
+
+    assert _wait_until(lambda: len(callback.calls) == 3)
+    assert callback.calls == [("busy", 0), ("a", 3), ("b", 3)]
+    assert dispatcher.stats()["sub"]["dropped"] == 4
+    dispatcher.close()
+
+
+def test_block_policy_applies_backpressure():
+    """Test a full blocking queue suspends the producer without stalling the event loop"""
+    dispatcher = Dispatcher(maxsize=1)
+    dispatcher.configure("sub", "block")
+    callback = GatedCallback()
+
+    async def run():
+        await dispatcher.put("sub", "t", callback, 1)
+        await asyncio.to_thread(callback.started.wait, 2.0)
+        await dispatcher.put("sub", "t", callback, 2)
+        producer = asyncio.create_task(dispatcher.put("sub", "t", callback, 3))
+        await asyncio.sleep(0.05)
+        assert not producer.done()  # Loop still runs while the producer waits
+        callback.release.set()
+        await asyncio.wait_for(producer, 2.0)
+
+    asyncio.run(run())
+
+    assert _wait_until(lambda: len(callback.calls) == 3)
+    assert callback.calls == [(1,), (2,), (3,)]
+    assert dispatcher.stats()["sub"]["dropped"] == 0
+    dispatcher.close()
@@ -525,10 +525,8 @@ class TestLimitlessAuthenticated:
 
     def test_fetch_balance_success(self, authenticated_exchange):
         """Test successful balance fetch via on-chain RPC."""
-        import requests
-
-        # Balance uses RPC, not session. Mock requests.post
-        with patch.object(requests, "post") as mock_post:
+        # Balance uses on-chain RPC through the pooled transport
+        with patch.object(authenticated_exchange.http, "post") as mock_post:
             mock_response = Mock()
             # 1000.5 USDC = 1000500000 in 6 decimals = 0x3B9ACA00 + ~500k
             # Let's use 1000000000 = 1000 USDC = 0x3B9ACA00
@@ -597,6 +595,24 @@ class TestLimitlessAuthenticated:
 class TestLimitlessHelperMethods:
     """Test helper methods."""
 
+    def test_parse_orderbook_response_inverts_no_token(self):
+        """Test the No book maps Yes levels to 1 - price in sorted order."""
+        response = {
+            "bids": [{"price": 0.49, "size": 20}, {"price": 0.5, "size": 10}],
+            "asks": [{"price": 0.523, "size": 5}, {"price": 0.6, "size": 1}],
+        }
+
+        book = Limitless._parse_orderbook_response(response, is_no_token=True)
+
+        assert book["bids"] == [
+            {"price": "0.477", "size": "5"},
+            {"price": "0.4", "size": "1"},
+        ]
+        assert book["asks"] == [
+            {"price": "0.5", "size": "10"},
+            {"price": "0.51", "size": "20"},
+        ]
+
     def test_extract_token_ids(self):
         """Test extracting token IDs from market metadata."""
         from dr_manhattan.models.market import Market
@@ -867,6 +883,30 @@ class TestLimitlessWebSocket:
         assert len(update.asks) == 2
         assert update.bids[0] == (0.50, 100)
 
+    def test_watch_orderbook_by_market_derives_no_book(self):
+        """Test only the Yes book is stored and the No book is a complement view."""
+        import asyncio
+        from datetime import datetime, timezone
+
+        from dr_manhattan.exchanges.limitless_ws import LimitlessWebSocket, OrderbookUpdate
+
+        ws = LimitlessWebSocket()
+        asyncio.run(ws.watch_orderbook_by_market("test-market", ["yes", "no"]))
+        ws._orderbook_callbacks[-1](
+            OrderbookUpdate(
+                slug="test-market",
+                bids=[(0.50, 100), (0.49, 200)],
+                asks=[(0.52, 150), (0.53, 100)],
+                timestamp=datetime.now(timezone.utc),
+            )
+        )
+
+        manager = ws.get_orderbook_manager()
+        assert manager.get_best_bid_ask("no") == (0.48, 0.5)
+        assert list(manager.snapshot("no").asks) == [(0.5, 100), (0.51, 200)]
+        assert manager.snapshot("no").version == manager.snapshot("yes").version
+        assert "no" not in manager._snapshots
+
     def test_price_update_dataclass(self):
         """Test PriceUpdate dataclass."""
         from datetime import datetime, timezone
@@ -0,0 +1,141 @@
+"""Tests for the metrics hook and OpenMetrics exporter"""
+
+from dr_manhattan.base.errors import NetworkError
+from dr_manhattan.base.metrics import MetricsHook, MetricsRecorder, method_name
+from tests.test_base import MockExchange
+from tests.test_resilience import _server
+
+
+class HttpExchange(MockExchange):
+    """Mock exchange with one REST read against a local server"""
+
+    def __init__(self, url, config=None):
+        self.url = url
+        super().__init__(config)
+
+    def fetch_thing(self):
+        @self._retry_on_failure
+        def _fetch():
+            response = self._http.get(f"{self.url}/things/12345", timeout=5)
+            if response.status_code >= 500:
+                raise NetworkError(f"HTTP {response.status_code}")
+            return response.text
+
+        return _fetch()
+
+
+def _series(snapshot, kind, name):
+    return {tuple(sorted(entry["labels"].items())): entry for entry in snapshot[kind].get(name, [])}
+
+
+def test_method_name_uses_enclosing_method():
+    """Test closures decorated inside exchange methods report the method name"""
+
+    def fetch_market():
+        def _fetch():
+            pass
+
+        return _fetch
+
+    assert method_name(fetch_market()) == "fetch_market"
+    assert method_name(MockExchange.fetch_market) == "fetch_market"
+
+
+def test_recorder_renders_openmetrics():
+    """Test histogram buckets are cumulative and counters get a _total suffix"""
+    recorder = MetricsRecorder(latency_buckets=(0.1, 1.0))
+    recorder.observe_call("mock", "fetch_market", 0.05)
+    recorder.observe_call("mock", "fetch_market", 0.5, error="NetworkError")
+    recorder.observe_retry("mock", "fetch_market", "NetworkError")
+
+    text = recorder.render()
+    lines = text.splitlines()
+
+    assert "# TYPE dr_manhattan_call_duration_seconds histogram" in lines
+    labels = 'exchange="mock",method="fetch_market"'
+    assert f'dr_manhattan_call_duration_seconds_bucket{{{labels},le="0.1"}} 1' in lines
+    assert f'dr_manhattan_call_duration_seconds_bucket{{{labels},le="1.0"}} 2' in lines
+    assert f'dr_manhattan_call_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+    assert f"dr_manhattan_call_duration_seconds_count{{{labels}}} 2" in lines
+    assert "# TYPE dr_manhattan_retries counter" in lines
+    assert (
+        'dr_manhattan_call_errors_total{exchange="mock",method="fetch_market",error="NetworkError"} 1'
+        in lines
+    )
+    assert lines[-1] == "# EOF"
+
+    recorder.reset()
+    assert recorder.render() == "# EOF\n"
+
+
+def test_exchange_reports_calls_requests_retries_and_waits():
+    """Test an instrumented exchange reports every stage of a call"""
+    with _server(lambda n: (503 if n == 1 else 200, 0.0)) as (url, counter):
+        recorder = MetricsRecorder()
+        exchange = HttpExchange(
+            url,
+            {
+                "metrics": recorder,
+                "retry_delay": 0.01,
+                "rate_limit": 5,
+                "rate_limit_burst": 1,
+                "share_rate_limit": False,
+            },
+        )
+
+        assert exchange.fetch_thing() == "2"
+        # Burst of 1: an immediate second call sleeps on the limiter
+        assert exchange.fetch_thing() == "3"
+        snapshot = recorder.snapshot()
+
+        calls = _series(snapshot, "histograms", "call_duration_seconds")
+        assert calls[(("exchange", "mock"), ("method", "fetch_thing"))]["count"] == 2
+
+        requests = _series(snapshot, "counters", "requests")
+        endpoint = f"GET {url.split('//')[1]}/things/{{id}}"
+        assert (
+            requests[(("endpoint", endpoint), ("exchange", "mock"), ("status", "503"))]["value"]
+            == 1
+        )
+        assert (
+            requests[(("endpoint", endpoint), ("exchange", "mock"), ("status", "200"))]["value"]
+            == 2
+        )
+
+        received = _series(snapshot, "counters", "request_bytes")
+        key = (("direction", "received"), ("endpoint", endpoint), ("exchange", "mock"))
+        assert received[key]["value"] == 3
+
+        retries = _series(snapshot, "counters", "retries")
+        key = (("error", "NetworkError"), ("exchange", "mock"), ("method", "fetch_thing"))
+        assert retries[key]["value"] == 1
+
+        waits = _series(snapshot, "counters", "rate_limit_waits")
+        assert waits[(("bucket", "default"), ("exchange", "mock"))]["value"] >= 1
+
+        exchange.http.close()
+
+
+def test_metrics_disabled_by_default():
+    """Test exchanges without a hook leave the transport uninstrumented"""
+    exchange = MockExchange()
+
+    assert exchange.metrics is None
+    assert exchange.http.after_request is None
+
+
+def test_custom_hook_receives_signing_calls():
+    """Test _observed reports steps outside _retry_on_failure (e.g. order signing)"""
+
+    class Hook(MetricsHook):
+        def __init__(self):
+            self.calls = []
+
+        def observe_call(self, exchange, method, seconds, error=None):
+            self.calls.append((exchange, method, error))
+
+    hook = Hook()
+    exchange = MockExchange({"metrics": hook})
+
+    assert exchange._observed("sign_order", lambda order: f"signed:{order}", "o1") == "signed:o1"
+    assert hook.calls == [("mock", "sign_order", None)]
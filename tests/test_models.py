@@ -1,9 +1,22 @@
 """Tests for data models"""
 
+import threading
+import time
 from datetime import datetime
 
+import pytest
+
+from dr_manhattan.exchanges.polymarket import Polymarket
 from dr_manhattan.models.market import Market
 from dr_manhattan.models.order import Order, OrderSide, OrderStatus
+from dr_manhattan.models.orderbook import (
+    ArrayOrderbook,
+    BookSnapshot,
+    ComplementLevels,
+    Orderbook,
+    OrderbookManager,
+    complement_levels,
+)
 from dr_manhattan.models.position import Position
 
 
@@ -148,6 +161,79 @@ class TestMarket:
         )
         assert multi_market.spread is None
 
+    def test_market_promotes_token_ids_and_condition_id(self):
+        """Test typed fields are filled from metadata when not given"""
+        market = Market(
+            id="m1",
+            question="Q?",
+            outcomes=["Yes", "No"],
+            close_time=None,
+            volume=0,
+            liquidity=0,
+            prices={},
+            metadata={"clobTokenIds": ["t1", "t2"], "conditionId": "0xc"},
+            tick_size=0.01,
+        )
+
+        assert market.token_ids == ["t1", "t2"]
+        assert market.condition_id == "0xc"
+        assert not hasattr(market, "__dict__")
+
+    def test_market_interns_outcomes(self):
+        """Test outcome names are shared across markets"""
+        markets = [
+            Market(
+                id=str(i),
+                question="Q?",
+                outcomes=["".join(["Y", "es"]), "No"],
+                close_time=None,
+                volume=0,
+                liquidity=0,
+                prices={"".join(["Y", "es"]): 0.5},
+                metadata={},
+                tick_size=0.01,
+            )
+            for i in range(2)
+        ]
+
+        assert markets[0].outcomes[0] is markets[1].outcomes[0]
+        assert next(iter(markets[0].prices)) is markets[1].outcomes[0]
+
+    def test_market_compact_keeps_used_keys(self):
+        """Test compact() drops the raw payload but keeps keys the library reads"""
+        market = Market(
+            id="m1",
+            question="Q?",
+            outcomes=["Yes", "No"],
+            close_time=None,
+            volume=0,
+            liquidity=0,
+            prices={},
+            metadata={"clobTokenIds": ["t1", "t2"], "closed": False, "image": "x" * 1000},
+            tick_size=0.01,
+        )
+
+        assert market.compact() is market
+        assert market.metadata == {"clobTokenIds": ["t1", "t2"], "closed": False}
+        assert market.token_ids == ["t1", "t2"]
+
+    def test_exchange_compact_markets_config(self):
+        """Test compact_markets compacts every parsed market"""
+        data = {
+            "id": "1",
+            "question": "Q?",
+            "outcomes": '["Yes", "No"]',
+            "clobTokenIds": '["t1", "t2"]',
+            "conditionId": "0xc",
+            "icon": "https://example.com/icon.png",
+        }
+
+        assert "icon" in Polymarket()._parse_market(data).metadata
+        market = Polymarket({"compact_markets": True})._parse_market(data)
+        assert "icon" not in market.metadata
+        assert market.token_ids == ["t1", "t2"]
+        assert market.condition_id == "0xc"
+
 
 class TestOrder:
     """Tests for Order model"""
@@ -286,6 +372,15 @@ class TestOrder:
 class TestPosition:
     """Tests for Position model"""
 
+    def test_models_are_slotted(self):
+        """Test Order/Position/Orderbook reject unknown attributes"""
+        position = Position(
+            market_id="m", outcome="Yes", size=1, average_price=0.5, current_price=0.5
+        )
+        for obj in (position, Orderbook()):
+            with pytest.raises(AttributeError):
+                obj.extra = 1
+
     def test_position_creation(self):
         """Test creating a position"""
         position = Position(
@@ -357,3 +452,167 @@ class TestOrderEnums:
         assert OrderStatus.PARTIALLY_FILLED.value == "partially_filled"
         assert OrderStatus.CANCELLED.value == "cancelled"
         assert OrderStatus.REJECTED.value == "rejected"
+
+
+class TestArrayOrderbook:
+    """Test array-backed orderbook depth queries"""
+
+    def _book(self):
+        return ArrayOrderbook.from_rest_response(
+            {
+                "bids": [
+                    {"price": "0.48", "size": "50"},
+                    {"price": "0.50", "size": "10"},
+                    {"price": "0.49", "size": "20"},
+                    {"price": "bad", "size": "1"},
+                ],
+                "asks": [[0.53, 40], [0.52, 10], [0.60, 0]],
+            },
+            "token",
+        )
+
+    def test_from_rest_response_sorts_and_filters(self):
+        """Test sides are sorted best-first and empty or malformed levels are dropped"""
+        book = self._book()
+        assert book.bid_prices.tolist() == [0.50, 0.49, 0.48]
+        assert book.ask_prices.tolist() == [0.52, 0.53]
+        assert book.best_bid == 0.50
+        assert book.spread == pytest.approx(0.02)
+        assert book.to_orderbook().asks == [(0.52, 10.0), (0.53, 40.0)]
+
+    def test_vwap_fill_price_and_slippage(self):
+        """Test fills walk levels from the top of the opposite side"""
+        book = self._book()
+        assert book.cumulative_depth(OrderSide.SELL).tolist() == [10, 30, 80]
+        assert book.vwap(OrderSide.SELL, 30) == pytest.approx((0.50 * 10 + 0.49 * 20) / 30)
+        assert book.fill_price("sell", 31) == 0.48
+        assert book.vwap("buy", 20) == pytest.approx((0.52 * 10 + 0.53 * 10) / 20)
+        assert book.slippage(OrderSide.BUY, 20) == pytest.approx(0.005)
+        assert book.vwap(OrderSide.BUY, 51) is None
+        assert book.depth_at(OrderSide.SELL, 0.49) == 30
+
+        with pytest.raises(ValueError):
+            book.vwap("hold", 1)
+
+    def test_imbalance(self):
+        """Test imbalance over all and top-of-book levels"""
+        book = self._book()
+        assert book.imbalance() == pytest.approx((80 - 50) / 130)
+        assert book.imbalance(levels=1) == pytest.approx(0.0)
+        assert ArrayOrderbook().imbalance() is None
+
+    def test_orderbook_and_manager_conversion(self):
+        """Test list books and manager dicts convert to arrays"""
+        book = Orderbook(bids=[(0.4, 5.0)], asks=[(0.6, 5.0)], asset_id="t")
+        assert book.to_arrays().mid_price == pytest.approx(0.5)
+
+        manager = OrderbookManager()
+        manager.update("t", book.to_dict())
+        assert manager.get_arrays("t").asset_id == "t"
+        assert manager.get_arrays("missing") is None
+
+
+class TestOrderbookManager:
+    """Test versioned orderbook snapshots"""
+
+    def test_snapshots_are_immutable_and_versioned(self):
+        """Test updates publish frozen copies with increasing versions"""
+        manager = OrderbookManager()
+        data = {"bids": [(0.4, 5.0)], "asks": [(0.6, 5.0)], "hash": "h"}
+        first = manager.update("a", data)
+        data["bids"].append((0.3, 1.0))
+        second = manager.update("b", {"bids": [(0.1, 1.0)], "asks": []})
+
+        assert isinstance(first, BookSnapshot)
+        assert manager.snapshot("a").bids == ((0.4, 5.0),)
+        assert (first.version, second.version, manager.version) == (1, 2, 2)
+        assert manager.get("a") == {"bids": [(0.4, 5.0)], "asks": [(0.6, 5.0)], "hash": "h"}
+        assert manager.get_best_bid_ask("a") == (0.4, 0.6)
+        assert manager.has_all_data(["a"]) and not manager.has_data("b")
+        with pytest.raises(AttributeError):
+            first.bids = ()
+
+        manager.get("a")["bids"].clear()
+        assert manager.snapshot("a") is first
+        assert manager.update("a", data).version == 3
+
+    def test_complement_book_is_a_view_over_the_source(self):
+        """Test a linked token reads the mapped opposite side of its source book"""
+        manager = OrderbookManager()
+        manager.link_complement("no", "yes")
+        assert manager.snapshot("no") is None
+
+        manager.update("yes", {"bids": [(0.5, 1.0), (0.4, 2.0)], "asks": [(0.6, 3.0)]})
+        no = manager.snapshot("no")
+
+        assert isinstance(no.bids, ComplementLevels)
+        assert no.bids == [(0.4, 3.0)]
+        assert no.asks == [(0.5, 1.0), (0.6, 2.0)]
+        assert no.asks[:1] == [(0.5, 1.0)]
+        assert manager.snapshot("no") is no
+        assert set(manager.snapshots()) == {"yes", "no"}
+        assert complement_levels([{"price": "0.6", "size": "3"}]) == [{"price": "0.4", "size": "3"}]
+
+        manager.update("yes", {"bids": [(0.55, 1.0)], "asks": []})
+        assert manager.get_best_bid_ask("no") == (None, 0.45)
+
+    def test_readers_see_consistent_books_under_concurrent_writes(self):
+        """Test every snapshot read has bids and asks from the same update"""
+        manager = OrderbookManager()
+        stop = threading.Event()
+
+        def write():
+            i = 0
+            while not stop.is_set():
+                i += 1
+                manager.update("t", {"bids": [(i, 1.0)], "asks": [(i, 2.0)]})
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            last_version = 0
+            for _ in range(20_000):
+                snapshot = manager.snapshot("t")
+                if snapshot is None:
+                    continue
+                assert snapshot.best_bid == snapshot.best_ask
+                assert snapshot.version >= last_version
+                last_version = snapshot.version
+        finally:
+            stop.set()
+            writer.join()
+
+    def test_conflating_subscription_delivers_latest_state(self):
+        """Test bursts collapse per token and callbacks are rate limited"""
+        manager = OrderbookManager()
+        manager.link_complement("no", "yes")
+        polled = manager.subscribe(token_ids=["yes", "no"])
+        calls = []
+        delivered = threading.Event()
+
+        def on_books(snapshots):
+            calls.append({token: snap.best_bid for token, snap in snapshots.items()})
+            delivered.set()
+
+        timed = manager.subscribe(on_books, token_ids=["yes"], interval_ms=50)
+
+        for i in range(1, 1001):
+            manager.update("yes", {"bids": [(i / 2000, 1.0)], "asks": [(0.9, 1.0)]})
+            manager.update("other", {"bids": [(0.1, 1.0)], "asks": []})
+
+        books = polled.poll()
+        assert set(books) == {"yes", "no"}
+        assert books["yes"].best_bid == 0.5
+        assert books["no"].best_bid == pytest.approx(0.1)
+        assert polled.poll() == {}
+        assert polled.updates == 2000
+
+        assert delivered.wait(2.0)
+        timed.close()
+        timed.flush()
+        deadline = time.time() + 2.0
+        while calls[-1] != {"yes": 0.5} and time.time() < deadline:
+            time.sleep(0.01)
+        assert calls[-1] == {"yes": 0.5}
+        assert len(calls) < 20  # 1000 updates, a handful of callbacks
+        polled.close()
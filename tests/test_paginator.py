@@ -0,0 +1,144 @@
+"""Tests for the concurrent prefetching paginator"""
+
+import threading
+import time
+
+import pytest
+
+from dr_manhattan.base.paginator import Paginator
+from tests.test_base import MockExchange
+
+
+def _offset_source(total):
+    """Build a fetch_page over ``range(total)`` that records its calls"""
+    calls = []
+
+    def fetch_page(offset, limit):
+        calls.append((offset, limit))
+        return list(range(offset, min(offset + limit, total)))
+
+    return fetch_page, calls
+
+
+def test_paginator_collects_in_order_and_stops_on_short_page():
+    """Test items come back in order and a short page ends iteration"""
+    fetch_page, calls = _offset_source(23)
+
+    items = Paginator(fetch_page, total_limit=100, page_size=10, window=1).collect()
+
+    assert items == list(range(23))
+    assert calls == [(0, 10), (10, 10), (20, 10)]
+
+
+def test_paginator_respects_total_limit_and_initial_offset():
+    """Test last page is trimmed to the remaining limit"""
+    fetch_page, calls = _offset_source(1000)
+
+    items = Paginator(
+        fetch_page, total_limit=25, initial_offset=5, page_size=10, window=4
+    ).collect()
+
+    assert items == list(range(5, 30))
+    assert sorted(calls) == [(5, 10), (15, 10), (25, 5)]
+
+
+def test_paginator_keeps_window_of_requests_in_flight():
+    """Test pages are fetched concurrently up to the window size"""
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fetch_page(offset, limit):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return list(range(offset, offset + limit))
+
+    start = time.monotonic()
+    items = Paginator(fetch_page, total_limit=80, page_size=10, window=4).collect()
+    elapsed = time.monotonic() - start
+
+    assert items == list(range(80))
+    assert peak == 4
+    assert elapsed < 0.35  # 8 serial pages would take 0.4s
+
+
+def test_paginator_dedups_and_stops_on_page_without_new_items():
+    """Test dedup_key drops repeats and a fully duplicated page ends iteration"""
+    pages = {0: [1, 2, 3], 3: [3, 4, 5], 6: [4, 5, 5]}
+
+    items = Paginator(
+        lambda offset, limit: pages.get(offset, []),
+        total_limit=100,
+        page_size=3,
+        window=2,
+        dedup_key=lambda item: item,
+    ).collect()
+
+    assert items == [1, 2, 3, 4, 5]
+
+
+def test_paginator_page_numbers_mode():
+    """Test page-number cursors with filtered pages stop only on an empty page"""
+    calls = []
+
+    def fetch_page(page, limit):
+        calls.append(page)
+        return [f"p{page}"] if page <= 3 else []
+
+    items = Paginator(
+        fetch_page,
+        initial_offset=1,
+        page_size=25,
+        page_numbers=True,
+        stop_on_short_page=False,
+        max_pages=100,
+        window=2,
+    ).collect()
+
+    assert items == ["p1", "p2", "p3"]
+    assert 4 in calls
+    assert max(calls) <= 5
+
+
+def test_paginator_yields_first_page_before_later_pages_finish():
+    """Test consumers can start on page 1 while later pages are loading"""
+    release = threading.Event()
+
+    def fetch_page(offset, limit):
+        if offset > 0:
+            release.wait(1)
+        return list(range(offset, offset + limit))
+
+    iterator = iter(Paginator(fetch_page, total_limit=30, page_size=10, window=3))
+
+    assert [next(iterator) for _ in range(10)] == list(range(10))
+    release.set()
+    assert list(iterator) == list(range(10, 30))
+
+
+def test_paginator_propagates_page_errors():
+    """Test a failing page request raises from the iterator"""
+
+    def fetch_page(offset, limit):
+        if offset >= 20:
+            raise RuntimeError("boom")
+        return list(range(offset, offset + limit))
+
+    with pytest.raises(RuntimeError, match="boom"):
+        Paginator(fetch_page, total_limit=100, page_size=10, window=3).collect()
+
+
+def test_exchange_paginate_uses_pagination_window():
+    """Test Exchange._paginate applies the configured window"""
+    exchange = MockExchange({"pagination_window": 6})
+    fetch_page, _ = _offset_source(5)
+
+    paginator = exchange._paginate(fetch_page, total_limit=10, page_size=5)
+
+    assert paginator.window == 6
+    assert paginator.collect() == list(range(5))
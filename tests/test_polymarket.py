@@ -2,6 +2,7 @@
 
 from unittest.mock import Mock, patch
 
+import pandas as pd
 import pytest
 from requests.exceptions import HTTPError
 
@@ -42,7 +43,7 @@ def test_polymarket_initialization_with_private_key():
         Polymarket(config)
 
 
-@patch("requests.get")
+@patch("requests.Session.request")
 def test_fetch_markets(mock_get):
     """Test fetching markets from CLOB API"""
     mock_response = Mock()
@@ -74,7 +75,7 @@ def test_fetch_markets(mock_get):
     assert markets[0].prices == {"Yes": 0.6, "No": 0.4}
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_fetch_market(mock_request):
     """Test fetching a specific market"""
     mock_response = Mock()
@@ -98,7 +99,7 @@ def test_fetch_market(mock_request):
     assert market.question == "Test question?"
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_fetch_market_not_found(mock_request):
     """Test fetching non-existent market"""
     mock_response = Mock()
@@ -187,3 +188,385 @@ def test_parse_datetime():
     # Test invalid
     dt = exchange._parse_datetime("invalid")
     assert dt is None
+
+
+@patch("requests.Session.request")
+def test_get_orderbooks_uses_multi_book_endpoint(mock_request):
+    """Test get_orderbooks sends one POST /books request for all tokens"""
+    mock_response = Mock()
+    mock_response.json.return_value = [
+        {
+            "market": "0xmarket",
+            "asset_id": "token1",
+            "timestamp": "1700000000000",
+            "bids": [{"price": "0.48", "size": "100"}, {"price": "0.5", "size": "20"}],
+            "asks": [{"price": "0.52", "size": "30"}],
+        },
+        {
+            "market": "0xmarket",
+            "asset_id": "token2",
+            "bids": [],
+            "asks": [{"price": "0.51", "size": "5"}],
+        },
+    ]
+    mock_response.raise_for_status = Mock()
+    mock_request.return_value = mock_response
+
+    exchange = Polymarket()
+    books = exchange.get_orderbooks(["token1", "token2", "token3"])
+
+    assert mock_request.call_count == 1
+    method, url = mock_request.call_args[0][:2]
+    assert method == "POST"
+    assert url.endswith("/books")
+    assert mock_request.call_args[1]["json"] == [
+        {"token_id": "token1"},
+        {"token_id": "token2"},
+        {"token_id": "token3"},
+    ]
+
+    assert books["token1"].best_bid == 0.5
+    assert books["token1"].market_id == "0xmarket"
+    assert books["token1"].timestamp == 1700000000000
+    assert books["token2"].best_ask == 0.51
+    assert books["token3"].bids == [] and books["token3"].asks == []
+
+
+def _gamma_page_responder(total):
+    """Serve Gamma /markets pages of ``total`` markets, recording requested offsets"""
+    offsets = []
+
+    def _respond(method, url, params=None, **kwargs):
+        offset, limit = params["offset"], params["limit"]
+        offsets.append(offset)
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.json.return_value = [
+            {
+                "id": str(i),
+                "question": f"BTC market {i}" if i % 2 == 0 else f"ETH market {i}",
+                "outcomes": '["Yes", "No"]',
+                "outcomePrices": '["0.5", "0.5"]',
+                "clobTokenIds": '["a", "b"]',
+            }
+            for i in range(offset, min(offset + limit, total))
+        ]
+        return response
+
+    return _respond, offsets
+
+
+@patch("requests.Session.request")
+def test_iter_markets_filters_per_page_and_stops_at_max_items(mock_request):
+    """Test iter_markets yields filtered matches and stops fetching at max_items"""
+    respond, offsets = _gamma_page_responder(total=10_000)
+    mock_request.side_effect = respond
+
+    exchange = Polymarket({"pagination_window": 2})
+    markets = list(exchange.iter_markets(limit=5000, query="btc", max_items=150))
+
+    assert len(markets) == 150
+    assert all("BTC" in m.question for m in markets)
+    assert [m.id for m in markets[:3]] == ["0", "2", "4"]
+    # 150 matches need 300 markets: two 200-row pages plus at most the prefetch window
+    assert len(offsets) <= 4
+
+
+@patch("requests.Session.request")
+def test_search_markets_collects_iter_markets(mock_request):
+    """Test search_markets returns the same matches as iter_markets"""
+    respond, _ = _gamma_page_responder(total=450)
+    mock_request.side_effect = respond
+
+    exchange = Polymarket()
+    markets = exchange.search_markets(limit=1000, keywords=["eth"])
+
+    assert len(markets) == 225
+    assert markets == list(exchange.iter_markets(limit=1000, keywords=["eth"]))
+
+
+def test_search_markets_keeps_explicit_filter_signature():
+    """Test search_markets exposes every iter_markets filter as a keyword argument"""
+    import inspect
+
+    search = inspect.signature(Polymarket.search_markets).parameters
+    stream = inspect.signature(Polymarket.iter_markets).parameters
+
+    assert all(p.kind is not inspect.Parameter.VAR_KEYWORD for p in search.values())
+    assert set(stream) - set(search) == {"max_items"}
+    with pytest.raises(TypeError):
+        Polymarket().search_markets(max_results=5)
+
+
+@patch("requests.Session.request")
+def test_iter_public_trades_streams_parsed_trades(mock_request):
+    """Test iter_public_trades parses rows lazily and dedups across pages"""
+
+    def _respond(method, url, params=None, **kwargs):
+        offset, limit = params["offset"], params["limit"]
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.json.return_value = [
+            {
+                "transactionHash": f"0x{i}",
+                "outcomeIndex": 0,
+                "timestamp": 1700000000 + i,
+                "side": "BUY",
+                "size": "2",
+                "price": "0.5",
+            }
+            for i in range(offset, min(offset + limit, 700))
+        ]
+        return response
+
+    mock_request.side_effect = _respond
+
+    exchange = Polymarket()
+    trades = exchange.iter_public_trades("0xcond", limit=1000)
+
+    first = next(trades)
+    assert first.transaction_hash == "0x0"
+    assert first.size == 2.0
+    assert len(list(trades)) == 699
+
+    df = exchange.fetch_public_trades("0xcond", limit=600, as_dataframe=True)
+    assert len(df) == 600
+    assert df["timestamp"].is_monotonic_increasing
+
+
+def test_iter_public_trades_validates_eagerly():
+    """Test invalid arguments raise before iteration starts"""
+    exchange = Polymarket()
+
+    with pytest.raises(ValueError):
+        exchange.iter_public_trades(offset=20000)
+    with pytest.raises(ValueError):
+        exchange.iter_public_trades(filter_type="CASH")
+
+
+@patch("requests.Session.request")
+def test_fetch_public_trades_columnar_matches_row_path(mock_request):
+    """Test as_arrow/as_dataframe build the same columns as the dataclass path"""
+    rows = [
+        {
+            "transactionHash": "0x2",
+            "outcomeIndex": 1,
+            "timestamp": 1700000050,
+            "side": "SELL",
+            "size": "3",
+            "price": 0.4,
+            "conditionId": "0xcond",
+            "proxyWallet": "0xw",
+        },
+        {"transactionHash": "0x1", "outcomeIndex": 0, "timestamp": "1700000000", "size": 1},
+        {"transactionHash": "0x1", "outcomeIndex": 0, "timestamp": "1700000000", "size": 1},
+    ]
+    mock_response = Mock()
+    mock_response.raise_for_status = Mock()
+    mock_response.json.return_value = rows
+    mock_request.return_value = mock_response
+
+    exchange = Polymarket()
+    table = exchange.fetch_public_trades("0xcond", limit=10, as_arrow=True)
+    df = exchange.fetch_public_trades("0xcond", limit=10, as_dataframe=True)
+    trades = exchange.fetch_public_trades("0xcond", limit=10)
+
+    assert table.num_rows == 2
+    assert table.column("transaction_hash").to_pylist() == ["0x1", "0x2"]
+    assert table.column("size").to_pylist() == [1.0, 3.0]
+    assert table.column("side").to_pylist() == ["", "SELL"]
+    assert table.column("outcome_index").to_pylist() == [0, 1]
+    assert list(df["transaction_hash"]) == ["0x1", "0x2"]
+    assert df["timestamp"].iloc[0] == trades[1].timestamp
+    assert df["price"].iloc[1] == trades[0].price
+
+
+def _legacy_trades_dataframe(trades):
+    """DataFrame built the way fetch_public_trades(as_dataframe=True) used to build it"""
+    return (
+        pd.DataFrame(
+            [
+                {
+                    "timestamp": t.timestamp,
+                    "side": t.side,
+                    "asset": t.asset,
+                    "condition_id": t.condition_id,
+                    "size": t.size,
+                    "price": t.price,
+                    "proxy_wallet": t.proxy_wallet,
+                    "title": t.title,
+                    "slug": t.slug,
+                    "event_slug": t.event_slug,
+                    "outcome": t.outcome,
+                    "outcome_index": t.outcome_index,
+                    "name": t.name,
+                    "pseudonym": t.pseudonym,
+                    "bio": t.bio,
+                    "profile_image": t.profile_image,
+                    "profile_image_optimized": t.profile_image_optimized,
+                    "transaction_hash": t.transaction_hash,
+                }
+                for t in trades
+            ]
+        )
+        .sort_values("timestamp")
+        .reset_index(drop=True)
+    )
+
+
+@pytest.mark.parametrize("missing_index", [False, True])
+@patch("requests.Session.request")
+def test_fetch_public_trades_dataframe_keeps_legacy_dtypes(mock_request, missing_index):
+    """Test the columnar DataFrame has the dtypes of the old per-row DataFrame"""
+    rows = [
+        {"transactionHash": f"0x{i}", "outcomeIndex": i % 2, "timestamp": 1700000000 + i}
+        for i in range(3)
+    ]
+    if missing_index:
+        del rows[1]["outcomeIndex"]
+    mock_response = Mock()
+    mock_response.raise_for_status = Mock()
+    mock_response.json.return_value = rows
+    mock_request.return_value = mock_response
+
+    exchange = Polymarket()
+    df = exchange.fetch_public_trades("0xcond", limit=10, as_dataframe=True)
+    legacy = _legacy_trades_dataframe(exchange.fetch_public_trades("0xcond", limit=10))
+
+    assert str(df["timestamp"].dtype) == "datetime64[ns, UTC]"
+    assert df.drop(columns="timestamp").dtypes.to_dict() == (
+        legacy.drop(columns="timestamp").dtypes.to_dict()
+    )
+    assert exchange.fetch_public_trades("0xcond", limit=0, as_dataframe=True) == []
+
+
+@patch("requests.Session.request")
+def test_fetch_public_trades_dataframe_tolerates_string_outcome_index(mock_request):
+    """Test string or malformed outcomeIndex values don't fail the whole pull"""
+    mock_response = Mock()
+    mock_response.raise_for_status = Mock()
+    mock_response.json.return_value = [
+        {"transactionHash": "0x1", "outcomeIndex": "1", "timestamp": 1700000000},
+        {"transactionHash": "0x2", "outcomeIndex": "n/a", "timestamp": 1700000001},
+    ]
+    mock_request.return_value = mock_response
+
+    table = Polymarket().fetch_public_trades("0xcond", limit=10, as_arrow=True)
+
+    assert table.column("outcome_index").to_pylist() == [1, None]
+
+
+@patch("requests.Session.request")
+def test_fetch_price_history_as_arrow(mock_request):
+    """Test price history goes straight from JSON rows to sorted columns"""
+    mock_response = Mock()
+    mock_response.raise_for_status = Mock()
+    mock_response.json.return_value = {
+        "history": [{"t": 1700000060, "p": 0.6}, {"t": 1700000000, "p": 0.5}, {"t": None}]
+    }
+    mock_request.return_value = mock_response
+
+    exchange = Polymarket()
+    market = exchange._parse_market(
+        {"id": "1", "outcomes": '["Yes", "No"]', "clobTokenIds": '["a", "b"]'},
+    )
+    table = exchange.fetch_price_history(market, as_arrow=True)
+    df = exchange.fetch_price_history(market, as_dataframe=True)
+
+    assert table.column("price").to_pylist() == [0.5, 0.6]
+    assert list(df.columns) == ["timestamp", "price"]
+    assert df["price"].tolist() == [0.5, 0.6]
+    assert str(df["timestamp"].dtype) == "datetime64[ns, UTC]"
+
+
+@patch("requests.Session.request")
+def test_search_markets_as_dataframe(mock_request):
+    """Test search_markets can return one row per matching market"""
+    respond, _ = _gamma_page_responder(total=10)
+    mock_request.side_effect = respond
+
+    exchange = Polymarket()
+    df = exchange.search_markets(limit=10, query="btc", as_dataframe=True)
+    table = exchange.search_markets(limit=10, query="btc", as_arrow=True)
+
+    assert df["id"].tolist() == ["0", "2", "4", "6", "8"]
+    assert table.column("token_ids").to_pylist()[0] == ["a", "b"]
+    assert table.column("outcome_prices").to_pylist()[0] == [0.5, 0.5]
+
+
+def _simplified_markets_handler(pages, calls):
+    """Serve /simplified-markets pages keyed by next_cursor"""
+
+    def handler(method, url, params=None, **kwargs):
+        calls.append((url, dict(params or {})))
+        response = Mock()
+        response.status_code = 200
+        if url.endswith("/simplified-markets"):
+            response.json.return_value = pages[(params or {}).get("next_cursor")]
+        else:
+            response.status_code = 404
+            response.raise_for_status.side_effect = HTTPError("404")
+        return response
+
+    return handler
+
+
+def _token_page(condition_ids, next_cursor):
+    return {
+        "data": [
+            {
+                "condition_id": cid,
+                "tokens": [
+                    {"token_id": f"{cid}-yes", "outcome": "Yes"},
+                    {"token_id": f"{cid}-no", "outcome": "No"},
+                ],
+            }
+            for cid in condition_ids
+        ],
+        "next_cursor": next_cursor,
+    }
+
+
+@patch("requests.Session.request")
+def test_token_index_syncs_once_and_persists(mock_request, tmp_path):
+    """Test one bulk sync serves later lookups, including from a fresh instance"""
+    calls = []
+    pages = {None: _token_page(["0x1", "0x2"], "MTAw"), "MTAw": _token_page(["0x3"], "LTE=")}
+    mock_request.side_effect = _simplified_markets_handler(pages, calls)
+    path = tmp_path / "tokens.json"
+
+    exchange = Polymarket({"token_index_path": str(path)})
+    assert exchange.sync_token_index() == 3
+    assert len(calls) == 2
+    assert exchange.fetch_token_ids("0x3") == ["0x3-yes", "0x3-no"]
+    assert exchange.token_index.outcomes("0x1") == ["Yes", "No"]
+    assert len(calls) == 2
+
+    restored = Polymarket({"token_index_path": str(path)})
+    assert restored.fetch_token_ids("0x2") == ["0x2-yes", "0x2-no"]
+    assert len(calls) == 2
+
+    # Incremental sync resumes at the last page instead of starting over
+    pages["MTAw"] = _token_page(["0x3", "0x4"], "LTE=")
+    assert restored.sync_token_index() == 2
+    assert calls[-1][1] == {"next_cursor": "MTAw"}
+    assert restored.fetch_token_ids("0x4") == ["0x4-yes", "0x4-no"]
+
+
+@patch("requests.Session.request")
+def test_fetch_token_ids_miss_requests_single_market(mock_request):
+    """Test an index miss fetches one market instead of scanning listings"""
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = {
+        "condition_id": "0xabc",
+        "tokens": [{"token_id": "t1", "outcome": "Yes"}, {"token_id": "t2", "outcome": "No"}],
+    }
+    mock_request.return_value = response
+
+    exchange = Polymarket()
+    assert exchange.fetch_token_ids("0xabc") == ["t1", "t2"]
+    assert exchange.fetch_token_ids("0xabc") == ["t1", "t2"]
+
+    assert mock_request.call_count == 1
+    assert mock_request.call_args[0][1] == f"{Polymarket.CLOB_URL}/markets/0xabc"
@@ -0,0 +1,331 @@
+"""Tests for the Polymarket market-channel WebSocket"""
+
+import asyncio
+import json
+
+from dr_manhattan.base.websocket import WebSocketState
+from dr_manhattan.exchanges.polymarket_ws import PolymarketWebSocket, PolymarketWebSocketPool
+from dr_manhattan.models.orderbook import L2Book
+
+
+def _book_message(asset_id="t1", bids=(), asks=(), **extra):
+    return {
+        "event_type": "book",
+        "asset_id": asset_id,
+        "market": "m",
+        "timestamp": 1,
+        "hash": "h0",
+        "bids": [{"price": str(p), "size": str(s)} for p, s in bids],
+        "asks": [{"price": str(p), "size": str(s)} for p, s in asks],
+        **extra,
+    }
+
+
+def _change(asset_id, side, price, size, hash_="h"):
+    return {
+        "asset_id": asset_id,
+        "side": side,
+        "price": str(price),
+        "size": str(size),
+        "hash": hash_,
+    }
+
+
+def test_l2_book_applies_levels_in_sorted_order():
+    """Test level updates insert, replace and remove while staying sorted"""
+    book = L2Book(bids=[(0.50, 10), (0.48, 5)], asks=[[0.55, 3]])
+    book.apply("buy", 0.49, 7)
+    book.apply("BUY", 0.50, 0)
+    book.apply("sell", 0.53, 2)
+    book.apply("sell", 0.55, 4)
+    book.apply("sell", 0.60, 0)
+
+    assert book.bids == [(0.49, 7.0), (0.48, 5.0)]
+    assert book.asks == [(0.53, 2.0), (0.55, 4.0)]
+
+
+def test_price_change_updates_full_book():
+    """Test every price change is applied to the stored snapshot, per asset"""
+    ws = PolymarketWebSocket()
+    ws._parse_orderbook_message(_book_message(bids=[(0.5, 10), (0.49, 20)], asks=[(0.52, 5)]))
+    ws._parse_orderbook_message(_book_message("t2", bids=[(0.4, 1)], asks=[(0.6, 1)]))
+
+    updates = ws._parse_orderbook_updates(
+        {
+            "event_type": "price_change",
+            "market": "m",
+            "timestamp": 2,
+            "price_changes": [
+                _change("t1", "BUY", 0.5, 0),
+                _change("t1", "SELL", 0.51, 8, "h1"),
+                _change("t2", "BUY", 0.45, 3, "h2"),
+                _change("t1", "SIDEWAYS", 0.3, 1),
+            ],
+        }
+    )
+
+    assert [(u["asset_id"], u["hash"]) for u in updates] == [("t1", "h1"), ("t2", "h2")]
+    assert updates[0]["bids"] == [(0.49, 20.0)]
+    assert updates[0]["asks"] == [(0.51, 8.0), (0.52, 5.0)]
+    assert updates[1]["bids"] == [(0.45, 3.0), (0.4, 1.0)]
+
+    # A new snapshot replaces the accumulated state
+    reset = ws._parse_orderbook_message(_book_message(bids=[(0.3, 1)]))
+    assert reset["bids"] == [(0.3, 1.0)] and reset["asks"] == []
+
+
+def test_process_message_item_keeps_depth_in_manager():
+    """Test subscribed callbacks receive each changed asset's full book"""
+    ws = PolymarketWebSocket()
+    received = []
+    ws.subscriptions["t1"] = lambda key, book: received.append((key, book["bids"]))
+
+    async def run():
+        await ws._process_message_item(_book_message(bids=[(0.5, 10), (0.49, 20)]))
+        await ws._process_message_item(
+            {
+                "event_type": "price_change",
+                "market": "m",
+                "price_changes": [_change("t1", "BUY", 0.5, 4), _change("t9", "BUY", 0.1, 1)],
+            }
+        )
+
+    asyncio.run(run())
+
+    assert received == [
+        ("t1", [(0.5, 10.0), (0.49, 20.0)]),
+        ("t1", [(0.5, 4.0), (0.49, 20.0)]),
+    ]
+
+
+class SnapshotExchange:
+    """Exchange stub serving REST snapshots for resyncs"""
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self.requested = []
+
+    def get_orderbook(self, token_id):
+        self.requested.append(token_id)
+        return self.snapshot
+
+
+def test_top_of_book_mismatch_triggers_resync_and_replay():
+    """Test a checksum mismatch resyncs from REST and replays newer buffered deltas"""
+    exchange = SnapshotExchange(
+        {
+            "hash": "rest",
+            "timestamp": "20",
+            "bids": [{"price": "0.47", "size": "9"}],
+            "asks": [{"price": "0.55", "size": "1"}],
+        }
+    )
+    ws = PolymarketWebSocket(exchange=exchange)
+    ws.subscribed_assets.add("t1")
+    received = []
+    ws.subscriptions["t1"] = lambda key, book: received.append(book)
+
+    async def run():
+        await ws._process_message_item(_book_message(bids=[(0.5, 10)], asks=[(0.55, 1)]))
+        assert ws.is_book_fresh("t1", max_age_ms=1000)
+
+        # The exchange says the best bid is 0.47: we missed the 0.50 cancel
+        mismatch = _change("t1", "BUY", 0.49, 0)
+        mismatch["best_bid"] = "0.47"
+        await ws._process_message_item(
+            {
+                "event_type": "price_change",
+                "market": "m",
+                "timestamp": "10",
+                "price_changes": [mismatch],
+            }
+        )
+        assert not ws.is_book_fresh("t1", max_age_ms=1000)
+
+        # Deltas arriving mid-resync are buffered and replayed if newer than the snapshot
+        for ts, price in (("15", 0.40), ("25", 0.46)):
+            await ws._process_message_item(
+                {
+                    "event_type": "price_change",
+                    "market": "m",
+                    "timestamp": ts,
+                    "price_changes": [_change("t1", "BUY", price, 2)],
+                }
+            )
+        await asyncio.gather(*ws.tasks)
+
+    asyncio.run(run())
+
+    assert exchange.requested == ["t1"]
+    assert ws.resync_count("t1") == 1
+    assert ws.resync_counts == {"t1": 1}
+    assert ws.is_book_fresh("t1", max_age_ms=1000)
+    assert received[-1]["bids"] == [(0.47, 9.0), (0.46, 2.0)]
+    assert len(received) == 2
+
+
+def test_reconnect_marks_books_stale_until_snapshot():
+    """Test reconnecting resyncs subscribed books and a WS snapshot wins over REST"""
+    exchange = SnapshotExchange({"hash": "rest", "timestamp": "1", "bids": [], "asks": []})
+    ws = PolymarketWebSocket(exchange=exchange)
+    ws.subscribed_assets.add("t1")
+
+    async def run():
+        ws._parse_orderbook_message(_book_message(bids=[(0.5, 10)], timestamp=5))
+        await ws._on_reconnect()
+        assert not ws.is_book_fresh("t1", max_age_ms=1000)
+        ws._parse_orderbook_message(_book_message(bids=[(0.52, 3)], timestamp=6))
+        await asyncio.gather(*ws.tasks)
+
+    asyncio.run(run())
+
+    assert exchange.requested == ["t1"]
+    assert ws.resync_count("t1") == 0
+    assert ws._books["t1"].bids == [(0.52, 3.0)]
+    assert ws.is_book_fresh("t1", max_age_ms=1000)
+    assert not ws.is_book_fresh("unknown", max_age_ms=1000)
+
+
+class RecordingSocket:
+    """Connected socket stub recording sent frames"""
+
+    def __init__(self):
+        self.frames = []
+
+    async def send(self, message):
+        self.frames.append(json.loads(message))
+
+    async def close(self):
+        pass
+
+
+def test_subscriptions_are_batched_per_tick():
+    """Test adds and removes in one tick are diffed and sent in capped frames"""
+    ws = PolymarketWebSocket({"max_assets_per_frame": 500})
+    ws.ws = RecordingSocket()
+    ws.state = WebSocketState.CONNECTED
+    assets = [f"a{i:04d}" for i in range(2000)]
+
+    async def run():
+        for asset_id in assets:
+            await ws.watch_orderbook(asset_id, lambda key, book: None)
+        await ws._flush_task
+        subscribed = list(ws.ws.frames)
+
+        for asset_id in assets[:3]:
+            await ws.unwatch_orderbook(asset_id)
+        await ws.watch_orderbook("new", lambda key, book: None)
+        await ws.unwatch_orderbook("new")
+        await ws._flush_task
+        return subscribed, ws.ws.frames[len(subscribed) :]
+
+    subscribed, changed = asyncio.run(run())
+
+    assert len(subscribed) == 4
+    assert subscribed[0] == {"assets_ids": assets[:500], "type": "market"}
+    assert all(frame["operation"] == "subscribe" for frame in subscribed[1:])
+    assert changed == [{"assets_ids": assets[:3], "operation": "unsubscribe"}]
+    assert ws._active_assets == set(assets[3:])
+
+
+def test_resubscribe_replays_desired_set_after_reconnect():
+    """Test a fresh connection gets the whole subscription set in batched frames"""
+    ws = PolymarketWebSocket({"max_assets_per_frame": 2})
+    ws.state = WebSocketState.CONNECTED
+    ws._active_assets = {"gone"}
+    ws.subscribed_assets = {"gone", "t1"}
+    for asset_id in ("t1", "t2", "t3"):
+        ws.subscriptions[asset_id] = lambda key, book: None
+    ws.ws = RecordingSocket()
+
+    asyncio.run(ws._resubscribe())
+
+    assert ws.ws.frames == [
+        {"assets_ids": ["t1", "t2"], "type": "market"},
+        {"assets_ids": ["t3"], "operation": "subscribe"},
+    ]
+    assert ws.subscribed_assets == {"t1", "t2", "t3"}
+
+
+class OfflinePool(PolymarketWebSocketPool):
+    """Pool whose shards connect to RecordingSockets instead of the network"""
+
+    def _new_shard(self):
+        shard = super()._new_shard()
+
+        async def connect():
+            shard.ws = RecordingSocket()
+            shard.state = WebSocketState.CONNECTED
+            await shard._resubscribe()
+
+        async def receive_forever():
+            await asyncio.Event().wait()
+
+        shard.connect = connect
+        shard._receive_loop = receive_forever
+        return shard
+
+
+def test_pool_shards_rebalances_and_reconnects_shards_independently():
+    """Test assets are capped per connection, repacked on close, and shards reconnect alone"""
+    pool = OfflinePool({"max_assets_per_connection": 2, "reconnect_delay": 0})
+    assets = [f"a{i}" for i in range(6)]
+
+    async def run():
+        for i in range(0, 6, 2):
+            await pool.watch_orderbook_by_market(f"m{i}", assets[i : i + 2])
+        await asyncio.sleep(0)
+        assert pool.loads == [2, 2, 2]
+
+        shard = pool.shard_for("a3")
+        await shard._process_message_item(_book_message("a3", bids=[(0.4, 5)]))
+        assert pool.get_orderbook_manager().get_best_bid_ask("a3") == (0.4, None)
+
+        # Markets a1, a3, a5 close: three assets now fit on two connections
+        kept = {
+            asset_id: pool.shard_for(asset_id).subscriptions[asset_id] for asset_id in assets[::2]
+        }
+        await pool.sync(kept)
+        await asyncio.sleep(0)
+        assert sorted(pool.loads) == [1, 2]
+        assert all(shard.state == WebSocketState.CONNECTED for shard in pool.shards)
+
+        first, second = pool.shards
+        frames_before = list(second.ws.frames)
+        await first._reconnect()
+        assert first.ws.frames == [{"assets_ids": sorted(first.subscriptions), "type": "market"}]
+        assert second.ws.frames == frames_before
+
+        await pool.disconnect()
+        assert pool.shards == [] and len(pool) == 0
+
+    asyncio.run(run())
+
+
+def test_conflated_market_callback_gets_latest_book():
+    """Test a conflating subscriber sees the newest book instead of every update"""
+    ws = PolymarketWebSocket()
+    ws.ws = RecordingSocket()
+    ws.state = WebSocketState.CONNECTED
+    calls = []
+
+    async def run():
+        subscription = await ws.watch_orderbook_by_market(
+            "m",
+            ["t1", "t2"],
+            lambda key, book: calls.append((key, book["bids"])),
+            conflate_ms=60_000,
+        )
+        for size in range(1, 101):
+            await ws._process_message_item(_book_message(bids=[(0.5, size)]))
+        return subscription
+
+    subscription = asyncio.run(run())
+    delivered_by_timer = len(calls)
+    subscription.flush()
+
+    assert delivered_by_timer <= 1
+    assert ("t1", [(0.5, 100.0)]) in calls
+    assert subscription.updates == 100
+    assert ws.orderbook_manager.get_best_bid_ask("t1") == (0.5, None)
+    subscription.close()
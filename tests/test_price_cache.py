@@ -0,0 +1,96 @@
+"""Tests for the on-disk price history cache"""
+
+import time
+from unittest.mock import Mock, patch
+
+from dr_manhattan.base.metrics import MetricsRecorder
+from dr_manhattan.base.price_cache import PriceHistoryCache, missing_ranges
+from dr_manhattan.exchanges.polymarket import Polymarket
+
+
+def _fetcher(calls):
+    """Fetch function returning one row per 60s and recording requested ranges"""
+
+    def fetch(start, end):
+        calls.append((start, end))
+        first = start + (-start % 60)
+        return [(t, t / 1e6) for t in range(first, end + 1, 60)]
+
+    return fetch
+
+
+def test_missing_ranges():
+    """Test uncovered sub-ranges of a window"""
+    coverage = [[100, 200], [300, 400]]
+
+    assert missing_ranges(coverage, 0, 500) == [(0, 100), (200, 300), (400, 500)]
+    assert missing_ranges(coverage, 150, 350) == [(200, 300)]
+    assert missing_ranges(coverage, 120, 180) == []
+    assert missing_ranges(coverage, 150, 350, min_gap=200) == []
+
+
+def test_second_lookup_fetches_only_new_range():
+    """Test an overlapping window is served from cache except for its tail"""
+    calls = []
+    cache = PriceHistoryCache()
+    fetch = _fetcher(calls)
+
+    first = cache.get("ex", "tok", 0, 600, fetch)
+    again = cache.get("ex", "tok", 120, 480, fetch)
+    extended = cache.get("ex", "tok", 0, 900, fetch)
+
+    assert calls == [(0, 600), (600, 900)]
+    assert again == [row for row in first if 120 <= row[0] <= 480]
+    assert [t for t, _ in extended] == list(range(0, 901, 60))
+    assert cache.stats() == {"hits": 1, "misses": 2, "keys": 1}
+
+
+def test_closed_series_is_not_fetched_again(tmp_path):
+    """Test a closed market's history persists and is never refetched"""
+    calls = []
+    closed_at = int(time.time()) - 3600
+    cache = PriceHistoryCache(str(tmp_path))
+    cache.get("ex", "tok", closed_at - 600, closed_at + 600, _fetcher(calls), closed_at=closed_at)
+
+    reopened = PriceHistoryCache(str(tmp_path))
+    rows = reopened.get("ex", "tok", closed_at - 600, int(time.time()), _fetcher(calls))
+
+    assert calls == [(closed_at - 600, closed_at)]
+    assert rows[-1][0] <= closed_at
+    assert reopened.stats()["hits"] == 1
+
+
+@patch("requests.Session.request")
+def test_polymarket_price_history_uses_cache(mock_request):
+    """Test Polymarket fetches cached windows by startTs/endTs and counts lookups"""
+    requests_seen = []
+
+    def respond(method, url, params=None, **kwargs):
+        requests_seen.append(dict(params or {}))
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.json.return_value = {
+            "history": [{"t": params["startTs"], "p": 0.5}, {"t": params["endTs"], "p": 0.6}]
+        }
+        return response
+
+    mock_request.side_effect = respond
+    metrics = MetricsRecorder()
+    exchange = Polymarket({"price_history_cache": PriceHistoryCache(), "metrics": metrics})
+    market = exchange._parse_market(
+        {"id": "1", "outcomes": '["Yes", "No"]', "clobTokenIds": '["a", "b"]'},
+    )
+
+    first = exchange.fetch_price_history(market, interval="1d", fidelity=60)
+    second = exchange.fetch_price_history(market, interval="1d", fidelity=60)
+
+    assert len(requests_seen) == 1
+    assert requests_seen[0]["market"] == "a"
+    assert requests_seen[0]["endTs"] - requests_seen[0]["startTs"] == 86400
+    assert "interval" not in requests_seen[0]
+    assert [p.price for p in second] == [p.price for p in first] == [0.5, 0.6]
+    lookups = {
+        entry["labels"]["result"]: entry["value"]
+        for entry in metrics.snapshot()["counters"]["cache_lookups"]
+    }
+    assert lookups == {"miss": 1, "hit": 1}
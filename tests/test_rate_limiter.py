@@ -0,0 +1,183 @@
+"""Tests for token-bucket rate limiting"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from dr_manhattan.base.errors import RateLimitError
+from dr_manhattan.base.rate_limiter import (
+    RateLimiter,
+    TokenBucket,
+    get_shared_rate_limiter,
+    parse_retry_after,
+)
+from dr_manhattan.exchanges.polymarket import Polymarket
+from tests.test_base import MockExchange
+
+
+def test_token_bucket_allows_burst_then_waits():
+    """Test bucket serves its burst immediately and then spaces requests"""
+    bucket = TokenBucket(rate=10, burst=3)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_token_bucket_rejects_invalid_rate():
+    """Test bucket requires a positive rate"""
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_token_bucket_is_thread_safe():
+    """Test concurrent reservations are all accounted for"""
+    bucket = TokenBucket(rate=1000, burst=10)
+    waits = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(20):
+            wait = bucket.reserve()
+            with lock:
+                waits.append(wait)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(waits) == 160
+    # 150 requests over the burst need at least 150 / 1000 s of spacing in total
+    assert max(waits) > 0.1
+
+
+def test_token_bucket_block():
+    """Test block holds reservations until it expires"""
+    bucket = TokenBucket(rate=100, burst=10)
+    bucket.block(0.5)
+
+    assert bucket.reserve() == pytest.approx(0.5, abs=0.05)
+    assert bucket.status()["blocked_for"] > 0
+
+
+def test_rate_limiter_endpoint_buckets():
+    """Test endpoints with their own budget do not drain the default bucket"""
+    limiter = RateLimiter(rate=1, burst=1, endpoint_limits={"orders": (5, 2)})
+
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve("orders") == 0.0
+    assert limiter.reserve("orders") == 0.0
+    assert limiter.reserve() > 0
+    # Unknown endpoints share the default bucket
+    assert limiter.bucket("unknown") is limiter.bucket()
+    assert set(limiter.status()) == {"default", "orders"}
+
+
+def test_shared_rate_limiter_registry():
+    """Test limiters are shared per key and limits"""
+    first = get_shared_rate_limiter("test-host-registry", rate=5, endpoint_limits={"o": [1, 2]})
+    second = get_shared_rate_limiter("test-host-registry", rate=5, endpoint_limits={"o": (1, 2)})
+    faster = get_shared_rate_limiter("test-host-registry", rate=50)
+    other = get_shared_rate_limiter("other-test-host-registry", rate=5)
+
+    assert first is second
+    assert first is not faster
+    assert first is not other
+
+
+def test_exchange_with_different_limits_gets_its_own_limiter():
+    """Test a later instance's limits are not silently replaced by the first one's"""
+    default = Polymarket({"rate_limit": 2}).rate_limiter
+    custom = Polymarket({"rate_limit": 1000, "rate_limits": {"orders": 50}}).rate_limiter
+
+    assert custom is not default
+    assert custom.bucket().rate == 1000
+    assert custom.bucket("orders").rate == 50
+
+
+def test_polymarket_rate_limits_each_api_host():
+    """Test Gamma, CLOB and Data-API requests draw from separate host limiters"""
+    exchange = Polymarket({"rate_limit": 0.001, "rate_limit_burst": 10, "share_rate_limit": False})
+    sent = []
+    exchange.http.session.request = lambda method, url, **kwargs: sent.append(url) or Mock(
+        status_code=200
+    )
+
+    @exchange._retry_on_failure
+    def fetch(url):
+        return exchange.http.get(url)
+
+    fetch(f"{exchange.BASE_URL}/markets")
+    fetch(f"{exchange.DATA_API_URL}/trades")
+    fetch(f"{exchange.DATA_API_URL}/trades")
+    exchange.http.get(f"{exchange.CLOB_URL}/book")  # outside _retry_on_failure
+
+    gamma = exchange.rate_limiter_for(exchange.BASE_URL).bucket().status()
+    data_api = exchange.rate_limiter_for(exchange.DATA_API_URL).bucket().status()
+    assert len(sent) == 4
+    assert gamma["tokens_available"] == pytest.approx(9, abs=0.01)
+    assert data_api["tokens_available"] == pytest.approx(8, abs=0.01)
+    assert exchange.rate_limiter is exchange.rate_limiter_for(exchange.CLOB_URL)
+    assert exchange.rate_limiter.bucket().status()["tokens_available"] == pytest.approx(
+        10, abs=0.01
+    )
+
+
+def test_exchanges_share_limiter_per_host():
+    """Test instances of the same exchange share a limiter unless disabled"""
+    a = MockExchange()
+    b = MockExchange()
+    private = MockExchange({"share_rate_limit": False})
+
+    assert a.rate_limiter is b.rate_limiter
+    assert private.rate_limiter is not a.rate_limiter
+
+
+def test_parse_retry_after():
+    """Test Retry-After parsing for seconds, HTTP dates and garbage"""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) == 1.0
+    assert parse_retry_after("soon", default=2.0) == 2.0
+
+    future = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < parse_retry_after(format_datetime(future, usegmt=True)) <= 30
+
+
+def test_retry_on_failure_honors_retry_after():
+    """Test 429 retries wait Retry-After instead of exponential backoff"""
+    exchange = MockExchange({"share_rate_limit": False, "retry_delay": 100})
+    calls = {"n": 0}
+
+    @exchange._retry_on_failure
+    def flaky():
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise RateLimitError("Rate limited", retry_after=0.25)
+        return "ok"
+
+    with patch("dr_manhattan.base.exchange.time.sleep") as mock_sleep:
+        assert flaky() == "ok"
+
+    delays = [c.args[0] for c in mock_sleep.call_args_list]
+    assert delays[0] == 0.25
+    assert exchange.rate_limiter.bucket().status()["blocked_for"] > 0
+
+
+def test_retry_on_failure_uses_endpoint_bucket():
+    """Test endpoint-scoped retry decorator charges the endpoint bucket"""
+    exchange = MockExchange({"share_rate_limit": False, "rate_limits": {"orders": (1, 1)}})
+
+    @exchange._retry_on_failure(endpoint="orders")
+    def place():
+        return "placed"
+
+    assert place() == "placed"
+    assert exchange.rate_limiter.bucket("orders").status()["tokens_available"] < 1
+    assert exchange.rate_limiter.bucket().status()["tokens_available"] == pytest.approx(
+        10, abs=0.01
+    )
@@ -0,0 +1,231 @@
+"""Tests for hedged requests and endpoint circuit breakers"""
+
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from dr_manhattan.base.errors import CircuitOpenError
+from dr_manhattan.base.http import HTTPTransport
+from dr_manhattan.base.resilience import (
+    CircuitBreaker,
+    HedgePolicy,
+    LatencyTracker,
+    endpoint_key,
+)
+from tests.test_base import MockExchange
+
+
+@contextmanager
+def _server(handle):
+    """Run a local HTTP server whose GET/POST responses come from handle(n)"""
+    counter = {"n": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _respond(self):
+            with lock:
+                counter["n"] += 1
+                n = counter["n"]
+            status, delay = handle(n)
+            time.sleep(delay)
+            body = str(n).encode()
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            self._respond()
+
+        def do_POST(self):
+            self._respond()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}", counter
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_endpoint_key_collapses_ids_and_query():
+    """Test ID-like path segments and query strings share one key"""
+    assert endpoint_key("get", "https://api.x.com/v1/markets/123?x=1") == (
+        "GET api.x.com/v1/markets/{id}"
+    )
+    assert endpoint_key("GET", "https://api.x.com/book/0xabcdef1234") == "GET api.x.com/book/{id}"
+
+
+def test_latency_tracker_percentile():
+    """Test percentile lookup needs enough samples"""
+    tracker = LatencyTracker()
+    for ms in range(1, 101):
+        tracker.record("GET /x", ms / 1000)
+
+    assert tracker.percentile("GET /x", 0.95) == pytest.approx(0.096)
+    assert tracker.percentile("GET /x", 0.95, min_samples=500) is None
+    assert tracker.percentile("GET /missing") is None
+
+
+def test_hedge_policy_delay():
+    """Test fixed, initial and percentile-derived hedge delays"""
+    tracker = LatencyTracker()
+    policy = HedgePolicy(enabled=True, min_samples=5, initial_delay=0.5, min_delay=0.05)
+
+    assert policy.delay_for(tracker, "GET /x") == 0.5
+    for _ in range(5):
+        tracker.record("GET /x", 0.01)
+    assert policy.delay_for(tracker, "GET /x") == 0.05
+    assert HedgePolicy(enabled=True, delay=0.2).delay_for(tracker, "GET /x") == 0.2
+
+
+def test_circuit_breaker_opens_and_recovers():
+    """Test closed -> open -> half-open -> closed transitions"""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()  # single half-open trial
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.status()["opens"] == 2
+
+
+def test_transport_hedges_slow_get():
+    """Test a slow primary GET is beaten by the hedged duplicate"""
+    # First request hangs, the hedge answers immediately
+    with _server(lambda n: (200, 1.0 if n == 1 else 0.0)) as (url, counter):
+        transport = HTTPTransport(hedge=HedgePolicy(enabled=True, delay=0.05))
+        start = time.monotonic()
+        response = transport.get(url, timeout=5)
+        elapsed = time.monotonic() - start
+
+        assert response.text == "2"
+        assert elapsed < 0.8
+        # The hedge counts as a request; only the primary's latency is sampled
+        assert transport.stats()["requests"] == 2
+        time.sleep(1.2)
+        assert transport.latency.percentile(endpoint_key("GET", url)) >= 1.0
+        stats = transport.resilience_stats()["hedging"]
+        assert stats == {
+            "enabled": True,
+            "hedged": 1,
+            "hedge_wins": 1,
+            "hedge_win_rate": 1.0,
+        }
+        transport.close()
+
+
+def test_transport_does_not_hedge_fast_or_non_get_requests():
+    """Test fast GETs and POSTs are sent once"""
+    with _server(lambda n: (200, 0.0)) as (url, counter):
+        transport = HTTPTransport(hedge=HedgePolicy(enabled=True, delay=0.5))
+        transport.get(url, timeout=5)
+        transport.post(url, timeout=5)
+
+        assert counter["n"] == 2
+        assert transport.resilience_stats()["hedging"]["hedged"] == 0
+        transport.close()
+
+
+def test_transport_circuit_breaker_fails_fast_on_5xx():
+    """Test repeated 5xx responses open the endpoint circuit"""
+    with _server(lambda n: (503, 0.0)) as (url, counter):
+        transport = HTTPTransport(breaker_threshold=3, breaker_reset_timeout=60)
+        for _ in range(3):
+            assert transport.get(f"{url}/markets/1", timeout=5).status_code == 503
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            transport.get(f"{url}/markets/2", timeout=5)
+
+        assert counter["n"] == 3
+        assert exc_info.value.retry_after > 0
+        # Other endpoints are unaffected
+        assert transport.get(f"{url}/book", timeout=5).status_code == 503
+
+        breakers = transport.resilience_stats()["circuit_breakers"]
+        status = next(s for key, s in breakers.items() if key.endswith("/markets/{id}"))
+        assert status["state"] == "open"
+        assert status["rejected"] == 1
+        transport.close()
+
+
+def test_exchange_describe_exposes_resilience_config():
+    """Test exchange config wires hedging/breakers and describe() reports them"""
+    exchange = MockExchange(
+        {"hedge_requests": True, "hedge_delay": 0.3, "circuit_breaker_threshold": 0}
+    )
+
+    assert exchange.http.hedge.enabled
+    assert exchange.http.hedge.delay == 0.3
+    assert exchange.http.breaker_threshold == 0
+    assert exchange.describe()["resilience"]["hedging"]["enabled"] is True
+
+
+def test_endpoint_state_is_bounded():
+    """Test free-form path segments (e.g. slugs) don't grow per-endpoint state forever"""
+    tracker = LatencyTracker(max_endpoints=3)
+    for slug in ["a", "b", "c", "a", "d"]:
+        tracker.record(f"GET host/markets/{slug}/orderbook", 0.1)
+
+    assert len(tracker) == 3
+    assert tracker.percentile("GET host/markets/b/orderbook") is None
+    assert tracker.percentile("GET host/markets/a/orderbook") == 0.1
+
+    transport = HTTPTransport(breaker_threshold=1, max_endpoints=2)
+    for slug in ["x", "y", "z"]:
+        transport.breaker(f"GET host/markets/{slug}")
+    assert list(transport.resilience_stats()["circuit_breakers"]) == [
+        "GET host/markets/y",
+        "GET host/markets/z",
+    ]
+    transport.close()
+
+
+def test_circuit_breaker_is_opt_in_and_not_retried():
+    """Test breakers are off by default and an open circuit fails fast through retries"""
+    with _server(lambda n: (503, 0.0)) as (url, counter):
+        default = MockExchange({"max_retries": 0})
+        for _ in range(8):
+            default.http.get(f"{url}/status", timeout=5)
+        assert default.resilience_stats()["circuit_breakers"] == {}
+
+        exchange = MockExchange(
+            {"circuit_breaker_threshold": 2, "max_retries": 3, "retry_delay": 0.01}
+        )
+        attempts = []
+
+        @exchange._retry_on_failure
+        def fetch():
+            attempts.append(1)
+            return exchange.http.get(f"{url}/status", timeout=5)
+
+        fetch()
+        fetch()
+        with pytest.raises(CircuitOpenError):
+            fetch()
+
+        assert len(attempts) == 3
+        assert counter["n"] == 10
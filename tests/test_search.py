@@ -0,0 +1,84 @@
+"""Tests for the inverted market search index"""
+
+from dr_manhattan.exchanges.polymarket import Polymarket
+from dr_manhattan.models.market import Market
+from dr_manhattan.utils.search import MarketSearchIndex, tokenize
+
+
+def _market(market_id, question, **metadata):
+    return Market(
+        id=market_id,
+        question=question,
+        outcomes=["Yes", "No"],
+        close_time=None,
+        volume=0,
+        liquidity=0,
+        prices={},
+        metadata=metadata,
+        tick_size=0.01,
+    )
+
+
+def _ids(markets):
+    return [m.id for m in markets]
+
+
+def test_tokenize_lowercases_words():
+    """Test punctuation splits tokens"""
+    assert tokenize("Will BTC reach $100k?") == ["will", "btc", "reach", "100k"]
+
+
+def test_search_and_or_prefix_and_categories():
+    """Test AND/OR keyword queries, prefix matching and category filters"""
+    index = MarketSearchIndex(
+        [
+            _market("1", "Will Bitcoin reach $100k?", category="Crypto"),
+            _market("2", "Will Ethereum reach $5k?", category="Crypto"),
+            _market("3", "Will Trump win?", categories=["Politics", "US"]),
+            _market("4", "Bitcoin ETF approved?", slug="btc-etf"),
+        ]
+    )
+
+    assert _ids(index.search("bitcoin reach")) == ["1"]
+    assert _ids(index.search("bitc")) == ["1", "4"]
+    assert _ids(index.search("bitc", prefix=False)) == []
+    assert _ids(index.search(keywords=["will"], any_keywords=["trump", "ethereum"])) == ["2", "3"]
+    assert _ids(index.search(categories=["crypto"])) == ["1", "2"]
+    assert _ids(index.search("will", categories=["us"])) == ["3"]
+    assert _ids(index.search("etf")) == ["4"]
+    assert _ids(index.search("will", limit=2)) == ["1", "2"]
+    assert index.search("dogecoin") == []
+
+
+def test_index_updates_and_removes_markets():
+    """Test re-adding a market replaces its tokens and remove drops it"""
+    index = MarketSearchIndex([_market("1", "Will BTC reach 100k?")])
+    index.add(_market("1", "Will ETH reach 5k?"))
+
+    assert len(index) == 1
+    assert index.search("btc") == []
+    assert _ids(index.search("eth")) == ["1"]
+
+    index.remove("1")
+    assert "1" not in index
+    assert index.search("eth") == []
+
+
+def test_matches_filters_streamed_markets():
+    """Test matches() indexes the market and applies query, keywords and categories"""
+    index = MarketSearchIndex()
+    market = _market("1", "Will Bitcoin reach $100k?", category="Crypto")
+
+    assert index.matches(market, "bitcoin 100", keywords=["reach"], categories=["crypto"])
+    assert not index.matches(market, "bitcoin", categories=["politics"])
+    assert not index.matches(market, "ethereum")
+    assert _ids(index.search("bitcoin")) == ["1"]
+
+
+def test_exchange_search_feeds_search_index():
+    """Test exchanges index markets seen by client-side search"""
+    exchange = Polymarket()
+    market = _market("1", "Fed decision in March?", tags=["Economy"], slug="fed-march")
+
+    assert exchange.search_index.matches(market, "fed", keywords=["econ"])
+    assert _ids(exchange.search_index.search("march")) == ["1"]
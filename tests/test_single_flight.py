@@ -0,0 +1,197 @@
+"""Tests for request coalescing (single-flight)"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dr_manhattan.base.single_flight import AsyncSingleFlight, SingleFlight, call_key
+from tests.test_base import MockExchange
+
+
+class SlowExchange(MockExchange):
+    """Mock exchange whose reads take a while and count network calls"""
+
+    def __init__(self, config=None):
+        self.network_calls = 0
+        self._calls_lock = threading.Lock()
+        super().__init__(config)
+
+    def _hit(self):
+        with self._calls_lock:
+            self.network_calls += 1
+        time.sleep(0.1)
+
+    def get_orderbook(self, token_id):
+        self._hit()
+        return {"bids": [{"price": "0.5", "size": "1"}], "asks": [], "token": token_id}
+
+    def fetch_balance(self):
+        self._hit()
+        return {"USDC": 100.0}
+
+
+def test_single_flight_shares_one_call_across_threads():
+    """Test concurrent identical calls run once and share the result"""
+    flight = SingleFlight()
+    calls = []
+
+    def work():
+        calls.append(1)
+        time.sleep(0.1)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: flight.do(("work",), work), range(8)))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    stats = flight.stats()
+    assert stats["calls"] == 8
+    assert stats["executed"] == 1
+    assert stats["coalesced"] == 7
+    assert flight.in_flight() == 0
+
+
+def test_single_flight_shares_exceptions_and_does_not_cache():
+    """Test followers receive the leader's error and later calls run again"""
+    flight = SingleFlight()
+    calls = []
+
+    def fail():
+        calls.append(1)
+        time.sleep(0.05)
+        raise ValueError("boom")
+
+    def run(_):
+        with pytest.raises(ValueError, match="boom"):
+            flight.do(("fail",), fail)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(run, range(4)))
+    assert len(calls) == 1
+
+    with pytest.raises(ValueError):
+        flight.do(("fail",), fail)
+    assert len(calls) == 2
+
+
+def test_call_key_skips_unhashable_arguments():
+    """Test calls with unhashable arguments are not coalesced"""
+    assert call_key("fetch_market", ("m1",), {}) == ("fetch_market", ("m1",), ())
+    assert call_key("fetch_markets", ({"limit": 10},), {}) is None
+
+
+def test_exchange_coalesces_identical_reads_when_enabled():
+    """Test opt-in coalescing of fetch_balance/get_orderbook on Exchange"""
+    exchange = SlowExchange({"coalesce_requests": True})
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        balances = list(executor.map(lambda _: exchange.fetch_balance(), range(5)))
+        books = list(executor.map(exchange.get_orderbook, ["t1", "t1", "t2", "t1", "t2"]))
+
+    assert exchange.network_calls == 3
+    assert balances == [{"USDC": 100.0}] * 5
+    assert [book["token"] for book in books] == ["t1", "t1", "t2", "t1", "t2"]
+
+    stats = exchange.coalescing_stats()
+    assert stats["by_method"]["fetch_balance"] == {"executed": 1, "coalesced": 4}
+    assert stats["by_method"]["get_orderbook"] == {"executed": 2, "coalesced": 3}
+
+
+def test_exchange_does_not_coalesce_by_default():
+    """Test coalescing is opt-in"""
+    exchange = SlowExchange()
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(lambda _: exchange.fetch_balance(), range(3)))
+
+    assert exchange.network_calls == 3
+    assert exchange.coalescing_stats()["calls"] == 0
+
+
+def test_async_single_flight_shares_one_task():
+    """Test concurrent identical coroutines share one task"""
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def work(value):
+        calls.append(value)
+        await asyncio.sleep(0.05)
+        return {"value": value}
+
+    async def run():
+        return await asyncio.gather(
+            *(flight.do(("work", 1), work, 1) for _ in range(5)),
+            flight.do(("work", 2), work, 2),
+        )
+
+    results = asyncio.run(run())
+
+    assert sorted(calls) == [1, 2]
+    assert all(result is results[0] for result in results[:5])
+    assert results[5] == {"value": 2}
+    assert flight.stats()["coalesced"] == 4
+
+
+def test_async_single_flight_survives_caller_cancellation():
+    """Test cancelling one waiter does not cancel the shared call"""
+    flight = AsyncSingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def run():
+        first = asyncio.ensure_future(flight.do(("work",), work))
+        second = asyncio.ensure_future(flight.do(("work",), work))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == "done"
+
+
+def test_async_exchange_coalesces_identical_reads():
+    """Test the async path coalesces identical concurrent reads across tasks"""
+    exchange = SlowExchange({"coalesce_requests": True})
+
+    async def run():
+        async with exchange.to_async() as async_exchange:
+            results = await asyncio.gather(*(async_exchange.get_orderbook("t1") for _ in range(6)))
+            return results, async_exchange.coalescing_stats()
+
+    results, stats = asyncio.run(run())
+
+    assert exchange.network_calls == 1
+    assert all(result == results[0] for result in results)
+    assert len({id(result) for result in results}) == 6
+    assert stats["by_method"]["get_orderbook"] == {"executed": 1, "coalesced": 5}
+
+
+def test_exchange_followers_get_their_own_copy():
+    """Test a caller mutating a coalesced result does not affect the others"""
+    exchange = SlowExchange({"coalesce_requests": True})
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        books = list(executor.map(exchange.get_orderbook, ["t1"] * 4))
+
+    assert exchange.network_calls == 1
+    books[0]["token"] = "mutated"
+    assert [book["token"] for book in books[1:]] == ["t1"] * 3
+
+
+def test_single_flight_copy_result_applies_to_followers_only():
+    """Test copy_result hands followers a copy and the leader the original"""
+    flight = SingleFlight(copy_result=lambda value: {**value, "copied": True})
+
+    def work():
+        time.sleep(0.1)
+        return {"copied": False}
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(lambda _: flight.do(("work",), work), range(3)))
+
+    assert sorted(result["copied"] for result in results) == [False, True, True]
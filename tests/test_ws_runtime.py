@@ -0,0 +1,72 @@
+"""Tests for the shared WebSocket event loop runtime"""
+
+import asyncio
+import threading
+
+import pytest
+
+from dr_manhattan.base.websocket import WebSocketState
+from dr_manhattan.base.ws_runtime import WebSocketRuntime
+from dr_manhattan.exchanges.polymarket_ws import PolymarketWebSocket
+
+
+class OfflineSocket(PolymarketWebSocket):
+    """Market socket that 'connects' without the network and idles until closed"""
+
+    async def connect(self):
+        self.state = WebSocketState.CONNECTED
+        self.connected_on = threading.current_thread()
+
+    async def _receive_loop(self):
+        while self.state != WebSocketState.CLOSED:
+            await asyncio.sleep(0.01)
+
+
+def test_sockets_share_one_loop_thread():
+    """Test many started sockets run on a single runtime thread and stop cleanly"""
+    runtime = WebSocketRuntime(name="test-ws")
+    sockets = [OfflineSocket({"runtime": runtime}) for _ in range(20)]
+
+    threads = {socket.start() for socket in sockets}
+    runtime.run(asyncio.sleep(0.05), timeout=2)
+
+    assert threads == {runtime.thread}
+    assert [t for t in threading.enumerate() if t.name == "test-ws"] == [runtime.thread]
+    assert all(socket.connected_on is runtime.thread for socket in sockets)
+    assert all(socket.loop is runtime.loop for socket in sockets)
+
+    for socket in sockets:
+        socket.stop()
+    for socket in sockets:
+        socket._run_future.result(timeout=2)
+    runtime.stop()
+    assert not runtime.running
+
+
+def test_runtime_run_submit_and_restart():
+    """Test thread-safe calls, the same-thread guard, and restarting after stop"""
+    runtime = WebSocketRuntime(name="test-ws")
+
+    async def double(value):
+        return value * 2
+
+    async def run_from_loop():
+        with pytest.raises(RuntimeError):
+            runtime.run(double(1))
+        return threading.current_thread()
+
+    assert runtime.run(double(21), timeout=2) == 42
+    assert runtime.run(run_from_loop(), timeout=2) is runtime.thread
+
+    pending = runtime.submit(asyncio.sleep(60))
+    runtime.stop()
+    assert pending.cancelled()
+    assert not runtime.running
+
+    assert runtime.run(double(2), timeout=2) == 4
+    runtime.stop()
+
+
+def test_default_runtime_is_shared():
+    """Test the process-wide runtime is a singleton"""
+    assert WebSocketRuntime.default() is WebSocketRuntime.default()